@@ -19,20 +19,123 @@ This makes the code easier to:
 - Maintain (change prompts without touching logic)
 """
 
+import os
+import re
+import io
 import json
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List
+import threading
+import functools
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import orjson
 
 # NEW: Import from our modular structure
-from llm.client import get_llm_client
+# (llm.client is imported lazily in MetricsExtractor.__init__ so importing
+# this module doesn't load the OpenAI/httpx stack)
+from llm.cache import TTLCache, SemanticCache, make_cache_key
+from llm.tokens import truncate_to_tokens
+from llm.json_stream import iter_json_array_items, salvage_json_array
 from prompts.extraction_prompts import (
     METRICS_SCHEMA,
     create_metrics_extraction_prompt,
-    METRICS_EXTRACTION_SYSTEM_MESSAGE
+    METRICS_EXTRACTION_SYSTEM_MESSAGE,
+    METRICS_RESPONSE_SCHEMA
 )
 
 logger = logging.getLogger(__name__)
 
+# Token budget for research content in the extraction prompt.
+# Split evenly across sources, with a per-source cap so one long page
+# can't crowd out the others. Leaves headroom for instructions + response.
+CONTENT_TOKEN_BUDGET = 6000
+MAX_TOKENS_PER_SOURCE = 1200
+
+# Markdown boilerplate that wastes tokens: images, link-only lines
+# (navigation menus) and cookie/consent notices
+_BOILERPLATE_RE = re.compile(
+    r'!\[[^\]]*\]\([^)]*\)'                         # ![alt](image.png)
+    r'|^[ \t]*(?:[-*+][ \t]*)?\[[^\]]*\]\([^)]*\)[ \t]*$'  # * [Home](/)
+    r'|^.*\b(?:cookies?|consent)\b.*\b(?:accept|agree|settings|preferences)\b.*$',
+    re.IGNORECASE | re.MULTILINE
+)
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+# Sources whose 5-word shingles overlap this much are near-duplicates
+# (e.g. the same press release syndicated on several news sites)
+NEAR_DUPLICATE_THRESHOLD = 0.85
+SHINGLE_SIZE = 5
+
+# Extraction cache settings (see _cached_extraction below)
+CACHE_TTL_SECONDS = float(os.getenv('EXTRACTION_CACHE_TTL_DAYS', '7')) * 24 * 3600
+SEMANTIC_CACHE_ENABLED = os.getenv('EXTRACTION_SEMANTIC_CACHE', 'true').lower() == 'true'
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv('EXTRACTION_SEMANTIC_THRESHOLD', '0.95'))
+
+_exact_cache = TTLCache(ttl_seconds=CACHE_TTL_SECONDS)
+_semantic_cache = SemanticCache(threshold=SEMANTIC_CACHE_THRESHOLD, ttl_seconds=CACHE_TTL_SECONDS)
+
+
+def _cached_extraction(func):
+    """
+    Decorator that caches extract_metrics() results in two tiers.
+
+    1. Exact: SHA-256 of the company name + each source's URL and
+       content hash. Same inputs → instant answer, no API call.
+    2. Semantic: embedding of the combined content, compared against
+       earlier runs for the SAME company. Re-scrapes that changed only
+       a little (cos-sim >= threshold) reuse the earlier metrics.
+
+    Fallback results (all-neutral default metrics) and partial results
+    (a response that broke off before every schema metric arrived) are
+    never cached, so a failed extraction is retried next time.
+    """
+    @functools.wraps(func)
+    def wrapper(self, company_name: str, sources: List[Dict[str, str]]) -> List[Dict]:
+        namespace = company_name.strip().lower()
+        key = make_cache_key(namespace, *sorted(
+            f"{s['url']}:{hashlib.sha256(s['content'].encode('utf-8')).hexdigest()}"
+            for s in sources
+        ))
+
+        # TIER 1: Exact match
+        cached = _exact_cache.get(key)
+        if cached is not None:
+            logger.info(f"⚡ Exact cache hit for {company_name}")
+            return [dict(m) for m in cached]
+
+        # TIER 2: Semantic match (one cheap embedding call vs. a full extraction).
+        # The combined text is reused for the prompt on a miss
+        embedding = None
+        combined_content = None
+        if SEMANTIC_CACHE_ENABLED and sources:
+            combined_content = self._combine_sources(sources)
+            try:
+                embedding = self.llm_client.embed(combined_content)
+                cached = _semantic_cache.lookup(namespace, embedding)
+                if cached is not None:
+                    logger.info(f"⚡ Semantic cache hit for {company_name}")
+                    _exact_cache.set(key, cached)
+                    return [dict(m) for m in cached]
+            except Exception as e:
+                logger.warning(f"⚠️ Semantic cache unavailable: {str(e)}")
+                embedding = None
+
+        # Cache miss: run the real extraction
+        metrics = func(self, company_name, sources, combined_content=combined_content)
+
+        if self._is_complete_result(metrics):
+            # Store a copy: the caller owns (and may modify) the returned list
+            cached_copy = [dict(m) for m in metrics]
+            _exact_cache.set(key, cached_copy)
+            if embedding is not None:
+                _semantic_cache.add(namespace, embedding, cached_copy)
+
+        return metrics
+
+    return wrapper
+
 
 class MetricsExtractor:
     """
@@ -56,19 +159,37 @@ class MetricsExtractor:
         "Governance": 0.25
     }
 
+    # Fields every metric from the AI must have
+    REQUIRED_FIELDS = ('category', 'metric_name', 'value', 'confidence')
+
+    # Neutral fallback metrics (score 50, confidence 0.1), built once
+    _DEFAULT_METRICS: Tuple[Dict, ...] = tuple(
+        {'category': category, 'metric_name': metric_name, 'value': 50.0, 'confidence': 0.1}
+        for category, metric_names in METRICS_SCHEMA.items()
+        for metric_name in metric_names
+    )
+
     def __init__(self):
         """Initialize the Metrics Extractor with LLM client."""
         # NEW: Use centralized LLM client
+        from llm.client import get_llm_client
         self.llm_client = get_llm_client()
         logger.info("Metrics Extractor initialized successfully")
 
-    def extract_metrics(self, company_name: str, sources: List[Dict[str, str]]) -> List[Dict]:
+    @_cached_extraction
+    def extract_metrics(self, company_name: str, sources: List[Dict[str, str]],
+                        combined_content: Optional[str] = None) -> List[Dict]:
         """
         Extract sustainability metrics from research sources using AI.
 
+        Results are cached (exact + semantic), so repeated runs for the
+        same company and sources skip the LLM call entirely.
+
         Args:
             company_name: Name of the company
             sources: List of dicts with 'url' and 'content' keys
+            combined_content: _combine_sources(sources), if already built
+                              (passed in by the cache decorator)
 
         Returns:
             List of metric dictionaries
@@ -80,46 +201,418 @@ class MetricsExtractor:
             ]
             metrics = extractor.extract_metrics("Tesla", sources)
         """
-        logger.info(f"🤖 Extracting metrics for: {company_name}")
+        return list(self.iter_extract_metrics(company_name, sources, combined_content))
 
-        # STEP 1: Combine content from all sources
-        combined_content = "\n\n---\n\n".join([
-            f"Source: {s['url']}\n{s['content'][:5000]}"
-            for s in sources
-        ])
+    def iter_extract_metrics(self, company_name: str, sources: List[Dict[str, str]],
+                             combined_content: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Extract metrics one at a time while the LLM response streams in.
 
-        # STEP 2: Create prompt using centralized prompt module
-        prompt = create_metrics_extraction_prompt(company_name, combined_content)
+        Each metric is validated and yielded as soon as its JSON object is
+        complete, so the first metric is available long before the whole
+        response has been generated.
+
+        If the response breaks off or is malformed, the metrics already
+        received are kept. Default metrics are only used when nothing
+        could be extracted.
+
+        Args:
+            company_name: Name of the company
+            sources: List of dicts with 'url' and 'content' keys
+            combined_content: _combine_sources(sources), if already built
+
+        Yields:
+            Validated metric dictionaries
+
+        Example:
+            for metric in extractor.iter_extract_metrics("Tesla", sources):
+                print(f"{metric['metric_name']}: {metric['value']}")
+        """
+        logger.info(f"🤖 Extracting metrics for: {company_name}")
+
+        # STEP 1-2: Combine sources and create prompt
+        prompt = self._build_prompt(company_name, sources, combined_content)
+        extracted = 0
 
         try:
-            # STEP 3: Call LLM using centralized client
+            # STEP 3: Stream the LLM response using centralized client
             logger.info("Sending content to GPT-4o-mini for analysis...")
 
-            response = self.llm_client.complete_json(
+            chunks = self.llm_client.stream_json(
                 prompt=prompt,
                 system_message=METRICS_EXTRACTION_SYSTEM_MESSAGE,
                 temperature=0.2,
-                max_tokens=2000
+                max_tokens=2000,
+                schema=METRICS_RESPONSE_SCHEMA  # Only known metrics, always valid JSON
             )
 
-            # STEP 4: Parse response
-            data = json.loads(response)
-            metrics = data.get('metrics', [])
-
-            # STEP 5: Validate and clean
-            validated_metrics = self._validate_metrics(metrics)
+            # STEP 4-5: Parse, validate and emit each metric as it completes
+            for raw_metric in iter_json_array_items(chunks, 'metrics'):
+                metric = self._validate_metric(raw_metric)
+                if metric:
+                    extracted += 1
+                    yield metric
 
-            logger.info(f"✅ Successfully extracted {len(validated_metrics)} metrics")
-            return validated_metrics
+            logger.info(f"✅ Successfully extracted {extracted} metrics")
+            return
 
         except json.JSONDecodeError as e:
             logger.error(f"❌ JSON parsing error: {str(e)}")
-            return self._get_default_metrics()
 
         except Exception as e:
             logger.error(f"❌ Extraction error: {str(e)}")
+
+        if extracted:
+            logger.warning(f"⚠️ Keeping {extracted} metrics received before the error")
+        else:
+            yield from self._get_default_metrics()
+
+    async def aextract_metrics(self, company_name: str, sources: List[Dict[str, str]]) -> List[Dict]:
+        """
+        Async version of extract_metrics().
+
+        The LLM call is awaited instead of blocking, so several companies
+        can be extracted at the same time (see extract_metrics_batch).
+
+        Args:
+            company_name: Name of the company
+            sources: List of dicts with 'url' and 'content' keys
+
+        Returns:
+            List of metric dictionaries
+
+        Example:
+            metrics = await extractor.aextract_metrics("Tesla", sources)
+        """
+        logger.info(f"🤖 Extracting metrics (async) for: {company_name}")
+
+        prompt = self._build_prompt(company_name, sources)
+
+        try:
+            response = await self.llm_client.acomplete_json(
+                prompt=prompt,
+                system_message=METRICS_EXTRACTION_SYSTEM_MESSAGE,
+                temperature=0.2,
+                max_tokens=2000,
+                schema=METRICS_RESPONSE_SCHEMA  # Only known metrics, always valid JSON
+            )
+            return self._parse_response(response)
+
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ JSON parsing error for {company_name}: {str(e)}")
             return self._get_default_metrics()
 
+        except Exception as e:
+            logger.error(f"❌ Extraction error for {company_name}: {str(e)}")
+            return self._get_default_metrics()
+
+    def extract_metrics_batch(
+        self,
+        companies: List[Tuple[str, List[Dict[str, str]]]],
+        max_concurrency: int = 5
+    ) -> List[List[Dict]]:
+        """
+        Extract metrics for many companies concurrently.
+
+        The LLM calls are network-bound, so running them together with
+        asyncio.gather() takes about as long as the slowest single call
+        instead of the sum of all calls. A semaphore caps how many
+        requests are in flight so we stay under OpenAI's rate limits.
+
+        Args:
+            companies: List of (company_name, sources) tuples
+            max_concurrency: Maximum number of simultaneous LLM requests
+
+        Returns:
+            List of metric lists, in the same order as `companies`
+
+        Example:
+            results = extractor.extract_metrics_batch([
+                ("Tesla", tesla_sources),
+                ("Apple", apple_sources)
+            ])
+            tesla_metrics, apple_metrics = results
+        """
+        async def run_all():
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def extract_one(company_name, sources):
+                async with semaphore:
+                    return await self.aextract_metrics(company_name, sources)
+
+            try:
+                tasks = [extract_one(name, sources) for name, sources in companies]
+                return await asyncio.gather(*tasks)
+            finally:
+                # Close this loop's pooled connections before asyncio.run() ends
+                await self.llm_client.aclose()
+
+        logger.info(f"🤖 Batch extracting metrics for {len(companies)} companies")
+        return asyncio.run(run_all())
+
+    def submit_batch(self, companies: List[Tuple[str, List[Dict[str, str]]]]) -> str:
+        """
+        Submit an offline extraction job through the OpenAI Batch API.
+
+        For bulk/nightly runs we don't need answers right away. Batch
+        jobs finish within 24 hours, cost ~50% less than live calls and
+        don't count against the normal per-minute rate limits.
+
+        Args:
+            companies: List of (company_name, sources) tuples
+
+        Returns:
+            Batch ID to pass to poll_batch() / collect_batch_results()
+
+        Example:
+            batch_id = extractor.submit_batch([("Tesla", tesla_sources)])
+            # ... hours later ...
+            if extractor.poll_batch(batch_id) == "completed":
+                results = extractor.collect_batch_results(batch_id)
+        """
+        return self.llm_client.submit_batch([
+            {
+                "custom_id": company_name,
+                "prompt": self._build_prompt(company_name, sources),
+                "system_message": METRICS_EXTRACTION_SYSTEM_MESSAGE,
+                "temperature": 0.2,
+                "max_tokens": 2000,
+                "response_format": {"type": "json_schema", "json_schema": METRICS_RESPONSE_SCHEMA}
+            }
+            for company_name, sources in companies
+        ])
+
+    def poll_batch(self, batch_id: str) -> str:
+        """
+        Check the status of a batch job.
+
+        Args:
+            batch_id: ID returned by submit_batch()
+
+        Returns:
+            Status string ("validating", "in_progress", "completed", "failed", ...)
+        """
+        return self.llm_client.poll_batch(batch_id)
+
+    def collect_batch_results(self, batch_id: str) -> Dict[str, List[Dict]]:
+        """
+        Download and validate the results of a completed batch job.
+
+        Companies whose request failed get the default neutral metrics,
+        same as a failed live extraction.
+
+        Args:
+            batch_id: ID returned by submit_batch()
+
+        Returns:
+            {company_name: list of metric dictionaries}
+
+        Raises:
+            ValueError: If the batch has no output yet
+        """
+        results = {}
+        for company_name, response in self.llm_client.collect_batch(batch_id).items():
+            try:
+                if response is None:
+                    raise ValueError("request failed")
+                results[company_name] = self._parse_response(response)
+            except ValueError as e:  # includes JSONDecodeError
+                logger.error(f"❌ Batch result error for {company_name}: {str(e)}")
+                results[company_name] = self._get_default_metrics()
+
+        logger.info(f"✅ Collected batch results for {len(results)} companies")
+        return results
+
+    def extract_many(
+        self,
+        companies: List[Tuple[str, List[Dict[str, str]]]],
+        poll_interval: float = 60,
+        timeout: Optional[float] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        Extract metrics for many companies through the Batch API (blocking).
+
+        Convenience wrapper around submit_batch() → wait → collect for
+        scripts and scheduled jobs. Interactive analysis keeps using
+        extract_metrics(), which answers in seconds.
+
+        Args:
+            companies: List of (company_name, sources) tuples
+            poll_interval: Seconds between status checks
+            timeout: Give up after this many seconds (None = up to 24h)
+
+        Returns:
+            {company_name: list of metric dictionaries}
+
+        Raises:
+            RuntimeError: If the batch job failed, expired or was cancelled
+
+        Example:
+            results = extractor.extract_many([
+                ("Tesla", tesla_sources),
+                ("Apple", apple_sources)
+            ])
+            tesla_metrics = results["Tesla"]
+        """
+        batch_id = self.submit_batch(companies)
+        status = self.llm_client.wait_for_batch(batch_id, poll_interval, timeout)
+        if status != "completed":
+            raise RuntimeError(f"Batch {batch_id} ended with status: {status}")
+        return self.collect_batch_results(batch_id)
+
+    def _combine_sources(self, sources: List[Dict[str, str]]) -> str:
+        """
+        Combine research sources into one block of text within the token budget.
+
+        Each source is cleaned of markdown boilerplate and truncated by
+        tokens (not characters), so the prompt size is predictable. The
+        cut falls on a sentence boundary, so no half sentence is sent.
+
+        Args:
+            sources: List of dicts with 'url' and 'content' keys
+
+        Returns:
+            All sources joined with separators
+        """
+        sources = self._dedupe_sources(sources)
+        if not sources:
+            return ""
+
+        per_source = min(MAX_TOKENS_PER_SOURCE, CONTENT_TOKEN_BUDGET // len(sources))
+
+        # Write every piece into one buffer (no per-source temporary strings)
+        buffer = io.StringIO()
+        for i, s in enumerate(sources):
+            if i:
+                buffer.write("\n\n---\n\n")
+            buffer.write("Source: ")
+            buffer.write(s['url'])
+            buffer.write("\n")
+            buffer.write(truncate_to_tokens(self._clean_content(s['content']), per_source, at_sentence=True))
+
+        return buffer.getvalue()
+
+    def _dedupe_sources(self, sources: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Drop duplicate and near-duplicate sources before building the prompt.
+
+        1. Exact duplicates: same content hash → keep the first one
+        2. Near-duplicates: Jaccard similarity of 5-word shingles above
+           NEAR_DUPLICATE_THRESHOLD → keep the longest version
+
+        With ~10 sources a direct pairwise comparison is cheap, so no
+        MinHash/LSH index is needed.
+
+        Args:
+            sources: List of dicts with 'url' and 'content' keys
+
+        Returns:
+            Sources without duplicates, in their original order
+        """
+        # STEP 1: Exact duplicates by content hash
+        unique = {}
+        for s in sources:
+            digest = hashlib.blake2b(s['content'].encode('utf-8'), digest_size=8).digest()
+            unique.setdefault(digest, s)
+        candidates = list(unique.values())
+
+        # STEP 2: Near-duplicates by shingle overlap
+        shingles = []
+        for s in candidates:
+            words = s['content'].lower().split()
+            shingles.append({
+                hash(' '.join(words[i:i + SHINGLE_SIZE]))
+                for i in range(max(1, len(words) - SHINGLE_SIZE + 1))
+            })
+
+        dropped = set()
+        for i in range(len(candidates)):
+            if i in dropped:
+                continue
+            for j in range(i + 1, len(candidates)):
+                if j in dropped:
+                    continue
+                union = len(shingles[i] | shingles[j])
+                if union and len(shingles[i] & shingles[j]) / union >= NEAR_DUPLICATE_THRESHOLD:
+                    # Keep the longer of the two versions
+                    if len(candidates[j]['content']) > len(candidates[i]['content']):
+                        dropped.add(i)
+                        break
+                    dropped.add(j)
+
+        kept = [s for i, s in enumerate(candidates) if i not in dropped]
+
+        if len(kept) < len(sources):
+            logger.info(f"🧹 Removed {len(sources) - len(kept)} duplicate sources")
+
+        return kept
+
+    def _clean_content(self, content: str) -> str:
+        """
+        Strip markdown boilerplate (images, nav links, cookie banners).
+
+        Args:
+            content: Scraped markdown content
+
+        Returns:
+            Content with low-information lines removed
+        """
+        content = _BOILERPLATE_RE.sub('', content)
+        return _BLANK_LINES_RE.sub('\n\n', content).strip()
+
+    def _build_prompt(self, company_name: str, sources: List[Dict[str, str]],
+                      combined_content: Optional[str] = None) -> str:
+        """
+        Combine research sources into a single extraction prompt.
+
+        Args:
+            company_name: Name of the company
+            sources: List of dicts with 'url' and 'content' keys
+            combined_content: _combine_sources(sources), if already built
+
+        Returns:
+            Prompt string ready to send to the LLM
+        """
+        # Combine content from all sources (unless the caller already did)
+        if combined_content is None:
+            combined_content = self._combine_sources(sources)
+
+        # Create prompt using centralized prompt module
+        return create_metrics_extraction_prompt(company_name, combined_content)
+
+    def _parse_response(self, response: str) -> List[Dict]:
+        """
+        Parse the LLM's JSON response into validated metrics.
+
+        Args:
+            response: Raw JSON string returned by the LLM
+
+        Returns:
+            Cleaned and validated metrics list
+
+        If the JSON is broken (e.g. cut off at max_tokens), every metric
+        that was complete before the break is salvaged.
+
+        Raises:
+            json.JSONDecodeError: If the response is invalid and no
+                metrics could be recovered from it
+        """
+        try:
+            # orjson: C parser, several times faster than json.loads
+            # (orjson.JSONDecodeError is a subclass of json.JSONDecodeError)
+            data = orjson.loads(response)
+            metrics = data.get('metrics', [])
+        except json.JSONDecodeError:
+            metrics = salvage_json_array(response, 'metrics')
+            if not metrics:
+                raise
+            logger.warning(f"⚠️ Malformed JSON response, salvaged {len(metrics)} metrics")
+
+        validated_metrics = self._validate_metrics(metrics)
+
+        logger.info(f"✅ Successfully extracted {len(validated_metrics)} metrics")
+        return validated_metrics
+
     def _validate_metrics(self, metrics: List[Dict]) -> List[Dict]:
         """
         Validate and clean extracted metrics from the AI.
@@ -133,42 +626,84 @@ class MetricsExtractor:
         validated = []
 
         for metric in metrics:
-            # Check required fields
-            required_fields = ['category', 'metric_name', 'value', 'confidence']
-            if not all(k in metric for k in required_fields):
-                logger.warning(f"⚠️ Skipping metric missing fields: {metric}")
-                continue
+            cleaned = self._validate_metric(metric)
+            if cleaned:
+                validated.append(cleaned)
 
-            # Validate category
-            if metric['category'] not in self.CATEGORY_WEIGHTS:
-                logger.warning(f"⚠️ Invalid category: {metric['category']}")
-                continue
+        return validated
 
-            # Validate and clamp value (0-100)
-            try:
-                value = float(metric['value'])
-                value = max(0, min(100, value))
-            except (ValueError, TypeError):
-                logger.warning(f"⚠️ Invalid value for {metric['metric_name']}, using 50")
-                value = 50.0
+    def _validate_metric(self, metric: Dict) -> Optional[Dict]:
+        """
+        Validate and clean a single metric from the AI.
 
-            # Validate and clamp confidence (0-1)
-            try:
-                confidence = float(metric['confidence'])
-                confidence = max(0, min(1, confidence))
-            except (ValueError, TypeError):
-                logger.warning(f"⚠️ Invalid confidence for {metric['metric_name']}, using 0.5")
-                confidence = 0.5
-
-            # Add validated metric
-            validated.append({
-                'category': metric['category'],
-                'metric_name': metric['metric_name'],
-                'value': round(value, 2),
-                'confidence': round(confidence, 2)
-            })
+        Args:
+            metric: One raw metric dictionary
 
-        return validated
+        Returns:
+            Cleaned metric, or None if the metric should be skipped
+        """
+        # Check required fields
+        if not isinstance(metric, dict) or not all(k in metric for k in self.REQUIRED_FIELDS):
+            logger.warning(f"⚠️ Skipping metric missing fields: {metric}")
+            return None
+
+        # Validate category
+        if metric['category'] not in self.CATEGORY_WEIGHTS:
+            logger.warning(f"⚠️ Invalid category: {metric['category']}")
+            return None
+
+        # Validate and clamp value (0-100)
+        try:
+            value = float(metric['value'])
+            value = max(0, min(100, value))
+        except (ValueError, TypeError):
+            logger.warning(f"⚠️ Invalid value for {metric['metric_name']}, using 50")
+            value = 50.0
+
+        # Validate and clamp confidence (0-1)
+        try:
+            confidence = float(metric['confidence'])
+            confidence = max(0, min(1, confidence))
+        except (ValueError, TypeError):
+            logger.warning(f"⚠️ Invalid confidence for {metric['metric_name']}, using 0.5")
+            confidence = 0.5
+
+        return {
+            'category': metric['category'],
+            'metric_name': metric['metric_name'],
+            'value': round(value, 2),
+            'confidence': round(confidence, 2)
+        }
+
+    def _is_default_result(self, metrics: List[Dict]) -> bool:
+        """
+        Check whether metrics are the neutral fallback (nothing extracted).
+
+        Args:
+            metrics: Metrics returned by an extraction
+
+        Returns:
+            True if every metric is the neutral default (50, confidence 0.1)
+        """
+        return all(m['value'] == 50.0 and m['confidence'] == 0.1 for m in metrics)
+
+    def _is_complete_result(self, metrics: List[Dict]) -> bool:
+        """
+        Check whether an extraction returned every schema metric.
+
+        Partial results (kept when the response broke off, see
+        iter_extract_metrics) and the neutral fallback are not complete.
+
+        Args:
+            metrics: Metrics returned by an extraction
+
+        Returns:
+            True if all metrics of METRICS_SCHEMA are present and the
+            result isn't the neutral default
+        """
+        received = {(m['category'], m['metric_name']) for m in metrics}
+        expected = {(m['category'], m['metric_name']) for m in self._DEFAULT_METRICS}
+        return expected <= received and not self._is_default_result(metrics)
 
     def _get_default_metrics(self) -> List[Dict]:
         """
@@ -179,18 +714,39 @@ class MetricsExtractor:
         """
         logger.warning("⚠️ Using default metrics due to extraction failure")
 
-        default_metrics = []
+        # Fresh dicts each time so callers can't modify the shared template
+        return [dict(metric) for metric in self._DEFAULT_METRICS]
+
+
+# Singleton instance
+_extractor_instance = None
+_extractor_lock = threading.Lock()
+
+
+def get_metrics_extractor() -> MetricsExtractor:
+    """
+    Get a singleton metrics extractor (recommended entry point).
+
+    The extractor only holds the shared LLM client (caches are module
+    level), so one instance can serve all analyses and threads.
+
+    Returns:
+        MetricsExtractor instance
+
+    Example:
+        from analysis.extractor import get_metrics_extractor
+
+        metrics = get_metrics_extractor().extract_metrics("Tesla", sources)
+    """
+    global _extractor_instance
 
-        for category, metric_names in self.METRICS_SCHEMA.items():
-            for metric_name in metric_names:
-                default_metrics.append({
-                    'category': category,
-                    'metric_name': metric_name,
-                    'value': 50.0,
-                    'confidence': 0.1
-                })
+    # Double-checked locking: the lock is only taken until the instance exists
+    if _extractor_instance is None:
+        with _extractor_lock:
+            if _extractor_instance is None:
+                _extractor_instance = MetricsExtractor()
 
-        return default_metrics
+    return _extractor_instance
 
 
 def test_metrics_extractor():
@@ -25,17 +25,42 @@ Main Functions:
 - get_recommendations(): Suggests improvements based on weak areas
 """
 
+import re
+import heapq
+import asyncio
+import bisect
 import logging
-from typing import Dict, List
+import threading
+import functools
+from typing import Awaitable, Callable, Dict, List, Optional
 from datetime import datetime
+from operator import itemgetter
 
-# Setup logging
-logging.basicConfig(
-    level='INFO',
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Setup logging (the application configures handlers/levels, not this module)
 logger = logging.getLogger(__name__)
 
+# Used by _metric_key(): runs of non-alphanumeric characters become word breaks
+_KEY_RE = re.compile(r'[^a-z0-9]+')
+_KEY_STOPWORDS = {"and"}
+
+
+@functools.lru_cache(maxsize=4096)
+def _metric_key(name: str) -> str:
+    """
+    Turn a metric name into a safe snake_case key.
+
+    Metric names come from a small fixed vocabulary, so results are
+    memoized and each name is only converted once per process.
+
+    Args:
+        name: Metric name (e.g., "Diversity and Inclusion")
+
+    Returns:
+        Key like "diversity_inclusion"
+    """
+    parts = _KEY_RE.sub(' ', name.lower()).split()
+    return "_".join(p for p in parts if p not in _KEY_STOPWORDS)
+
 
 class SustainabilityScorer:
     """
@@ -62,6 +87,13 @@ class SustainabilityScorer:
         "Governance": 0.25      # 25% of final score
     }
 
+    # Positional views of CATEGORY_WEIGHTS for the hot scoring path:
+    # slot i of every per-category list belongs to _CATEGORIES[i]
+    _CATEGORIES = tuple(CATEGORY_WEIGHTS)
+    _WEIGHTS = tuple(CATEGORY_WEIGHTS.values())
+    _CATEGORY_INDEX = {category: i for i, category in enumerate(CATEGORY_WEIGHTS)}
+    _TOTAL_WEIGHT = sum(CATEGORY_WEIGHTS.values())
+
     # Qualitative ratings based on numerical scores
     SCORE_LEVELS = {
         "Excellent": (85, 100),   # 85-100 points
@@ -71,6 +103,12 @@ class SustainabilityScorer:
         "Very Poor": (0, 29)       # 0-29 points
     }
 
+    # Lookup table for _get_score_level(), built once from SCORE_LEVELS:
+    # sorted lower bounds + matching level names for a binary search
+    _LEVEL_BOUNDS = sorted((low, level) for level, (low, _) in SCORE_LEVELS.items())
+    _LEVEL_MINIMUMS = [low for low, _ in _LEVEL_BOUNDS]
+    _LEVEL_NAMES = [level for _, level in _LEVEL_BOUNDS]
+
     def __init__(self):
         """Initialize the Sustainability Scorer."""
         logger.info("Sustainability Scorer initialized")
@@ -105,6 +143,23 @@ class SustainabilityScorer:
         # Step 1: Filter to only this category's metrics
         category_metrics = [m for m in metrics if m['category'] == category]
 
+        return self._round_category(self._score_category(category_metrics, category))
+
+    def _score_category(self, category_metrics: List[Dict], category: str) -> Dict:
+        """
+        Score a list of metrics that all belong to one category.
+
+        Shared by calculate_category_score() and calculate_final_score(),
+        which groups all metrics by category in a single pass first.
+
+        Args:
+            category_metrics: Metrics of a single category
+            category: Name of that category (for logging)
+
+        Returns:
+            Same dictionary as calculate_category_score(), but with
+            unrounded score/confidence (see _round_category)
+        """
         # Step 2: Handle case where no metrics found
         if not category_metrics:
             logger.warning(f"⚠️ No metrics found for category: {category}")
@@ -117,8 +172,10 @@ class SustainabilityScorer:
 
         # Step 3: Calculate confidence-weighted average
         # Formula: score = Σ(value × confidence) / Σ(confidence)
+        # One pass builds the sums AND the per-metric details
         total_weighted_score = 0
         total_confidence = 0
+        metric_details = []
 
         for metric in category_metrics:
             # Get metric value and confidence
@@ -129,6 +186,13 @@ class SustainabilityScorer:
             total_weighted_score += value * confidence
             total_confidence += confidence
 
+            # Step 5: Format individual metric details for output
+            metric_details.append({
+                'name': metric['metric_name'],
+                'value': metric['value'],
+                'confidence': metric['confidence']
+            })
+
         # Step 4: Calculate final category score
         if total_confidence > 0:
             # Weighted average
@@ -140,24 +204,31 @@ class SustainabilityScorer:
             category_score = 50.0
             avg_confidence = 0.0
 
-        # Step 5: Format individual metric details for output
-        metric_details = [
-            {
-                'name': m['metric_name'],
-                'value': m['value'],
-                'confidence': m['confidence']
-            }
-            for m in category_metrics
-        ]
-
-        # Step 6: Return results
+        # Step 6: Return results (rounded later, at the output boundary)
         return {
-            'score': round(category_score, 2),
-            'confidence': round(avg_confidence, 2),
+            'score': category_score,
+            'confidence': avg_confidence,
             'metric_count': len(category_metrics),
             'metrics': metric_details
         }
 
+    def _round_category(self, category_data: Dict) -> Dict:
+        """
+        Round a category result for output (2 decimals), in place.
+
+        Scores are kept at full precision while calculating and only
+        rounded once, when results are handed back to callers.
+
+        Args:
+            category_data: Result from _score_category()
+
+        Returns:
+            The same dictionary, rounded
+        """
+        category_data['score'] = round(category_data['score'], 2)
+        category_data['confidence'] = round(category_data['confidence'], 2)
+        return category_data
+
     def calculate_final_score(self, metrics: List[Dict]) -> Dict:
         """
         Calculate the final weighted sustainability score.
@@ -191,40 +262,140 @@ class SustainabilityScorer:
         """
         logger.info("📊 Calculating final sustainability score...")
 
-        # STEP 1: Calculate scores for each category
-        category_scores = {}
-        weighted_sum = 0
-        total_weight = 0
+        result = self._compute_final_score(metrics, datetime.now().isoformat())
+
+        logger.info(f"✅ Final score: {result['final_score']:.2f}/100 ({result['score_level']})")
+        return result
+
+    async def acalculate_final_score(
+        self,
+        metrics: List[Dict],
+        summarizer: Optional[Callable[[str, Dict], Awaitable[str]]] = None
+    ) -> Dict:
+        """
+        Async version of calculate_final_score() with optional per-category summaries.
+
+        The math itself is fast and stays synchronous. When a summarizer
+        is given (e.g. an LLM call that writes a short qualitative summary
+        per category), the three summaries run concurrently with
+        asyncio.gather() - about 3× faster than one after another.
+
+        Args:
+            metrics: List of ALL extracted metrics from all categories
+            summarizer: Optional async function (category, category_data) → summary text
+
+        Returns:
+            Same dictionary as calculate_final_score(); with a summarizer,
+            each category_breakdown entry also gets a 'summary' key
+
+        Example:
+            async def summarize(category, data):
+                return await llm.acomplete_json(f"Summarize {category}: {data}")
+
+            scores = await scorer.acalculate_final_score(metrics, summarize)
+        """
+        result = self.calculate_final_score(metrics)
 
-        for category, weight in self.CATEGORY_WEIGHTS.items():
-            # Get category score
-            category_data = self.calculate_category_score(metrics, category)
-            category_scores[category] = category_data
+        if summarizer is None:
+            return result
 
-            # Apply category weight to get contribution to final score
-            # Example: Environmental score 80 × weight 0.40 = 32 points
-            weighted_sum += category_data['score'] * weight
-            total_weight += weight
+        breakdown = result['category_breakdown']
+        summaries = await asyncio.gather(*[
+            summarizer(category, breakdown[category]) for category in self._CATEGORIES
+        ])
+
+        for category, summary in zip(self._CATEGORIES, summaries):
+            breakdown[category]['summary'] = summary
+
+        return result
+
+    def calculate_final_scores_batch(self, metrics_by_company: Dict[str, List[Dict]]) -> Dict[str, Dict]:
+        """
+        Calculate final scores for many companies at once.
+
+        Same results as calling calculate_final_score() per company, but
+        with one shared timestamp and one summary log line instead of
+        per-company logging - useful for pipeline/bulk scoring.
+
+        Args:
+            metrics_by_company: {company_name: list of metrics}
+
+        Returns:
+            {company_name: scores dictionary}
+
+        Example:
+            results = scorer.calculate_final_scores_batch({
+                "Tesla": tesla_metrics,
+                "Apple": apple_metrics
+            })
+            print(results["Tesla"]["final_score"])
+        """
+        calculated_at = datetime.now().isoformat()
+
+        results = {
+            company: self._compute_final_score(metrics, calculated_at)
+            for company, metrics in metrics_by_company.items()
+        }
+
+        logger.info(f"✅ Scored {len(results)} companies")
+        return results
+
+    def _compute_final_score(self, metrics: List[Dict], calculated_at: str) -> Dict:
+        """
+        Core of calculate_final_score(), without logging.
+
+        Args:
+            metrics: List of ALL extracted metrics from all categories
+            calculated_at: ISO timestamp to store with the result
+
+        Returns:
+            Scores dictionary (see calculate_final_score)
+        """
+        # STEP 1: Calculate scores for each category
+        # Bucket metrics by category position in ONE pass (instead of
+        # re-scanning the full list once per category)
+        buckets = [[] for _ in self._CATEGORIES]
+        for metric in metrics:
+            index = self._CATEGORY_INDEX.get(metric['category'])
+            if index is not None:
+                buckets[index].append(metric)
+
+        category_list = [
+            self._score_category(bucket, category)
+            for bucket, category in zip(buckets, self._CATEGORIES)
+        ]
 
         # STEP 2: Calculate final weighted score
-        if total_weight > 0:
-            final_score = weighted_sum / total_weight
+        # Example: Environmental score 80 × weight 0.40 = 32 points
+        if self._TOTAL_WEIGHT > 0:
+            final_score = sum(
+                data['score'] * weight for data, weight in zip(category_list, self._WEIGHTS)
+            ) / self._TOTAL_WEIGHT
         else:
             final_score = 50.0  # Neutral score if no data
 
+        # Round once for output; the level must match the score shown
+        final_score = round(final_score, 2)
+
         # STEP 3: Determine qualitative score level
         score_level = self._get_score_level(final_score)
 
         # STEP 4: Calculate overall confidence
         # Average of all category confidences
         avg_confidence = sum(
-            cat['confidence'] for cat in category_scores.values()
-        ) / len(category_scores)
+            cat['confidence'] for cat in category_list
+        ) / len(category_list)
+
+        # Named view for callers and storage, rounded once for output
+        category_scores = {
+            category: self._round_category(data)
+            for category, data in zip(self._CATEGORIES, category_list)
+        }
 
         # STEP 5: Build comprehensive result package
         result = {
             # Main scores
-            'final_score': round(final_score, 2),
+            'final_score': final_score,
             'score_level': score_level,
             'confidence': round(avg_confidence, 2),
 
@@ -240,10 +411,9 @@ class SustainabilityScorer:
             'component_scores': self._build_component_scores(category_scores),
 
             # Timestamp
-            'calculated_at': datetime.now().isoformat()
+            'calculated_at': calculated_at
         }
 
-        logger.info(f"✅ Final score: {final_score:.2f}/100 ({score_level})")
         return result
 
     def _get_score_level(self, score: float) -> str:
@@ -267,10 +437,13 @@ class SustainabilityScorer:
             level = scorer._get_score_level(78)
             # Returns: "Good"
         """
-        for level, (min_score, max_score) in self.SCORE_LEVELS.items():
-            if min_score <= score <= max_score:
-                return level
-        return "Unknown"
+        if not 0 <= score <= 100:
+            return "Unknown"
+
+        # Binary search for the highest lower bound <= score.
+        # Also covers fractional scores between ranges (e.g. 84.5 → "Good").
+        index = bisect.bisect_right(self._LEVEL_MINIMUMS, score) - 1
+        return self._LEVEL_NAMES[index]
 
     def _build_component_scores(self, category_scores: Dict) -> Dict:
         """
@@ -301,15 +474,7 @@ class SustainabilityScorer:
             for metric in data['metrics']:
                 # Create safe key name (lowercase, no spaces)
                 # e.g., "Carbon Emissions Reduction" → "carbon_emissions_reduction"
-                metric_key = (
-                    metric['name']
-                    .lower()
-                    .replace(' ', '_')
-                    .replace('and', '')
-                    .replace('__', '_')
-                    .strip('_')
-                )
-                component_scores[metric_key] = metric['value']
+                component_scores[_metric_key(metric['name'])] = metric['value']
 
         return component_scores
 
@@ -341,7 +506,7 @@ class SustainabilityScorer:
         recommendations = []
 
         # Check each category for low scores
-        for category in ['Environmental', 'Social', 'Governance']:
+        for category in self._CATEGORIES:
             category_data = scores['category_breakdown'][category]
             score = category_data['score']
 
@@ -351,14 +516,16 @@ class SustainabilityScorer:
                     f"Priority: Improve {category} practices (current score: {score:.1f}/100)"
                 )
 
-            # Find low-scoring metrics within this category
-            low_metrics = [
-                m for m in category_data['metrics']
-                if m['value'] < 50
-            ]
+            # Find the 2 lowest-scoring metrics (< 50) within this category
+            # heapq.nsmallest = one pass, no full sort
+            low_metrics = heapq.nsmallest(
+                2,
+                (m for m in category_data['metrics'] if m['value'] < 50),
+                key=itemgetter('value')
+            )
 
             # Add recommendations for top 2 lowest metrics
-            for metric in low_metrics[:2]:
+            for metric in low_metrics:
                 recommendations.append(
                     f"Focus on: {metric['name']} in {category} category (score: {metric['value']:.1f}/100)"
                 )
@@ -379,6 +546,37 @@ class SustainabilityScorer:
         return recommendations[:5]
 
 
+# Singleton instance
+_scorer_instance = None
+_scorer_lock = threading.Lock()
+
+
+def get_sustainability_scorer() -> SustainabilityScorer:
+    """
+    Get a singleton sustainability scorer (recommended entry point).
+
+    A scorer has no state at all, so one instance can serve all analyses
+    and threads.
+
+    Returns:
+        SustainabilityScorer instance
+
+    Example:
+        from analysis.scorer import get_sustainability_scorer
+
+        scores = get_sustainability_scorer().calculate_final_score(metrics)
+    """
+    global _scorer_instance
+
+    # Double-checked locking: the lock is only taken until the instance exists
+    if _scorer_instance is None:
+        with _scorer_lock:
+            if _scorer_instance is None:
+                _scorer_instance = SustainabilityScorer()
+
+    return _scorer_instance
+
+
 def test_sustainability_scorer():
     """
     Test the Sustainability Scorer with sample data.
@@ -471,4 +669,8 @@ def test_sustainability_scorer():
 
 # When this file is run directly, run the test
 if __name__ == "__main__":
+    logging.basicConfig(
+        level='INFO',
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
     test_sustainability_scorer()
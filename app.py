@@ -37,21 +37,41 @@ from ui.components import (
     display_chat_messages,
     classify_user_intent,
     add_user_message,
-    render_history_view
-)
-from ui.intent_handlers import (
-    handle_analyze,
-    handle_compare,
-    handle_rag_question,
-    handle_show_score,
-    handle_show_details,
-    handle_show_category,
-    handle_show_strengths_weaknesses,
-    handle_delete,
-    handle_clear,
-    handle_list_companies,
-    handle_download
+    render_history_view,
+    reset_turn_cache
 )
+# Intent handlers are loaded lazily: each handler module (and heavy
+# dependencies like ReportLab) is imported the first time it's needed
+import ui.intent_handlers as handlers
+from ui.profiling import profile_rerun, timed
+
+
+# Intent → handler. Each entry receives the classified intent data.
+# "analyze" has no entry: analysis happens before routing (STEP 1).
+INTENT_HANDLERS = {
+    # Management intents
+    "clear": lambda data: handlers.handle_clear(),
+    "delete": lambda data: handlers.handle_delete(data.get('companies', [])),
+    "list_companies": lambda data: handlers.handle_list_companies(),
+    "cache_stats": lambda data: handlers.handle_cache_stats(),
+
+    # Comparison intent
+    "compare": lambda data: handlers.handle_compare(data.get('companies', [])),
+
+    # Score display intents
+    "show_score": lambda data: handlers.handle_show_score(data.get('companies', [])),
+    "show_details": lambda data: handlers.handle_show_details(data.get('companies', [])),
+    "show_environmental": lambda data: handlers.handle_show_category(data.get('companies', []), data['intent']),
+    "show_social": lambda data: handlers.handle_show_category(data.get('companies', []), data['intent']),
+    "show_governance": lambda data: handlers.handle_show_category(data.get('companies', []), data['intent']),
+    "show_strengths_weaknesses": lambda data: handlers.handle_show_strengths_weaknesses(data.get('companies', [])),
+
+    # RAG question intent
+    "rag_question": lambda data: handlers.handle_rag_question(data.get('companies', []), data.get('question')),
+
+    # Download intent
+    "download": lambda data: handlers.handle_download(data.get('companies', [])),
+}
 
 
 def main():
@@ -64,20 +84,31 @@ def main():
     3. Renders the sidebar
     4. Creates tabs for Chat and History
     5. Handles chat interaction and intent routing
+
+    Set PROFILE_APP=1 to get a "Profile reruns" toggle in the sidebar.
     """
     # Setup page
     setup_page_config()
     apply_custom_css()
 
+    with profile_rerun():
+        _render_app()
+
+
+def _render_app():
+    """Render the header, sidebar and tabs (everything after page setup)."""
     # Header
     st.title("🌱 Company Sustainability Scoring System")
     st.markdown("Analyze companies' Environmental, Social, and Governance (ESG) practices using AI")
 
-    # Initialize chat state
-    initialize_chat_state(get_initial_chat_message())
+    # Initialize chat state (welcome message is only built on first run)
+    initialize_chat_state(get_initial_chat_message)
+
+    # The company list is loaded at most once per run (see get_companies_from_db)
+    reset_turn_cache()
 
     # Render sidebar
-    with st.sidebar:
+    with st.sidebar, timed("render_sidebar"):
         render_sidebar()
 
     # Main content tabs
@@ -93,59 +124,31 @@ def main():
 
         # Chat input
         if prompt := st.chat_input("Ask me anything about companies' sustainability..."):
-            # Add user message
-            add_user_message(prompt)
+            # Add user message (drawn now: handlers that don't rerun the
+            # app reply below it in this same run)
+            add_user_message(prompt, render=True)
 
             # Classify intent using LLM
-            with st.spinner("🤔 Understanding your request..."):
+            with st.spinner("🤔 Understanding your request..."), timed("classify_user_intent"):
                 intent_data = classify_user_intent(prompt)
 
             # Extract intent components
             intent = intent_data.get('intent')
-            companies = intent_data.get('companies', [])
             needs_analysis = intent_data.get('needs_analysis', [])
-            question = intent_data.get('question')
 
             # STEP 1: Analyze companies that need analysis first
             if needs_analysis:
-                handle_analyze(needs_analysis)
+                with timed("handle_analyze"):
+                    handlers.handle_analyze(needs_analysis)
 
             # STEP 2: Route to appropriate intent handler
-            # Management intents
-            if intent == "clear":
-                handle_clear()
-            elif intent == "delete":
-                handle_delete(companies)
-            elif intent == "list_companies":
-                handle_list_companies()
-
-            # Comparison intent
-            elif intent == "compare":
-                handle_compare(companies)
-
-            # Score display intents
-            elif intent == "show_score":
-                handle_show_score(companies)
-            elif intent == "show_details":
-                handle_show_details(companies)
-            elif intent in ["show_environmental", "show_social", "show_governance"]:
-                handle_show_category(companies, intent)
-            elif intent == "show_strengths_weaknesses":
-                handle_show_strengths_weaknesses(companies)
-
-            # RAG question intent
-            elif intent == "rag_question":
-                handle_rag_question(companies, question)
-
-            # Download intent
-            elif intent == "download":
-                handle_download(companies)
-
-            # Analyze intent (already handled in STEP 1)
-            # No additional action needed
+            handler = INTENT_HANDLERS.get(intent)
+            if handler:
+                with timed(f"handle {intent}"):
+                    handler(intent_data)
 
     # TAB 2: History View
-    with tab2:
+    with tab2, timed("render_history_view"):
         render_history_view()
 
 
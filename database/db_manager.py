@@ -29,11 +29,17 @@ Main Functions:
 """
 
 import sqlite3
-import json
 import os
+import time
+import threading
+import weakref
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from dotenv import load_dotenv
+import orjson
+import zstandard
 import logging
 
 # Load environment variables
@@ -46,6 +52,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# INSERT ... RETURNING needs SQLite 3.35+ (older builds fall back to a SELECT)
+SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+def _timestamp(dt: Optional[datetime] = None) -> str:
+    """
+    Format a time as ISO-8601 text ("2024-01-31 14:05:09") for storage.
+
+    Fixed-width ISO strings sort the same way as the times they
+    represent, so freshness checks can compare them directly in SQL.
+
+    Args:
+        dt: Time to format (defaults to now)
+
+    Returns:
+        ISO-8601 timestamp string, second precision
+    """
+    return (dt or datetime.now()).isoformat(sep=' ', timespec='seconds')
+
+
+# Bump this whenever schema.sql changes. Stored in the database file
+# (PRAGMA user_version) so an up-to-date database skips the schema script.
+SCHEMA_VERSION = 6
+
+# Rating of a final score in SQL, same bins as SustainabilityScorer
+# (used to backfill old rows and for callers that don't pass score_level)
+SCORE_LEVEL_SQL = """
+    CASE
+        WHEN final_score >= 85 THEN 'Excellent'
+        WHEN final_score >= 70 THEN 'Good'
+        WHEN final_score >= 50 THEN 'Fair'
+        WHEN final_score >= 30 THEN 'Poor'
+        ELSE 'Very Poor'
+    END
+"""
+
+# How long analyzed companies are kept before evict_expired() removes them.
+# (CACHE_EXPIRY_DAYS decides when to re-analyze; this decides when to delete.)
+CACHE_RETENTION_DAYS = int(os.getenv('CACHE_RETENTION_DAYS', 30))
+
+# Minimum time between automatic eviction runs
+EVICTION_INTERVAL_SECONDS = 3600
+
+# zstd level for research_sources.content_zstd (3 = fast, ~4-8× on text)
+CONTENT_COMPRESSION_LEVEL = 3
+
+# How often buffered "last accessed" times are written to the database
+ACCESS_FLUSH_INTERVAL_SECONDS = 60
+
+# Per-database write counters (see DatabaseManager.data_version)
+_data_versions: Dict[str, int] = {}
+_data_versions_lock = threading.Lock()
+
 
 class DatabaseManager:
     """
@@ -70,6 +128,17 @@ class DatabaseManager:
             company, sources, metrics, scores = cached
     """
 
+    # Prepared INSERT statements (defined once, reused by executemany)
+    INSERT_SOURCE_SQL = """
+        INSERT INTO research_sources (company_id, url, content_zstd, scraped_at)
+        VALUES (?, ?, ?, ?)
+    """
+    INSERT_METRIC_SQL = """
+        INSERT INTO sustainability_metrics
+        (company_id, category, metric_name, value, confidence, extracted_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_path: Optional[str] = None):
         """
         Initialize the Database Manager.
@@ -85,6 +154,44 @@ class DatabaseManager:
         # Get database path from argument, env, or default
         self.db_path = db_path or os.getenv('DATABASE_PATH', 'sustainability_data.db')
 
+        # One long-lived connection for this manager (opening a new one
+        # per query costs ~1ms + pragma round-trips each time).
+        # check_same_thread=False: Streamlit may call us from different
+        # threads, so access is serialized with a lock instead.
+        # isolation_level=None: no implicit BEGIN before every INSERT/UPDATE;
+        # multi-statement writes open one explicit transaction instead
+        # (see _transaction()).
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row  # Enable dictionary-like access
+        self._conn.execute("PRAGMA foreign_keys = ON")  # CRITICAL: Enable foreign key constraints!
+        # WAL mode: readers (history/sidebar) don't wait for writers, and
+        # commits append to a log instead of rewriting pages. WAL is stored
+        # in the file; expect sustainability_data.db-wal / -shm next to it.
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        # NORMAL is safe with WAL and skips the fsync on every commit
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA temp_store = MEMORY")  # Temp tables/sorts in RAM
+        self._conn.execute("PRAGMA mmap_size = 268435456")  # Memory-map up to 256 MB for reads
+        self._lock = threading.RLock()
+
+        # Scraped content is stored zstd-compressed (the biggest data by far).
+        # zstd objects aren't thread-safe; they are only used under self._lock.
+        self._compressor = zstandard.ZstdCompressor(level=CONTENT_COMPRESSION_LEVEL)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._last_eviction: Optional[float] = None  # Never evicted yet
+
+        # Cache hits only record access times in memory (no write on the
+        # read path); a background thread flushes them every minute
+        self._access_buffer: Dict[int, str] = {}
+        self._access_lock = threading.Lock()
+        self._stop_flusher = threading.Event()
+        threading.Thread(
+            target=self._flush_loop,
+            args=(weakref.ref(self), self._stop_flusher),
+            name="db-access-flusher",
+            daemon=True
+        ).start()
+
         # Create database and tables if they don't exist
         self._initialize_database()
 
@@ -97,35 +204,233 @@ class DatabaseManager:
         Reads the schema.sql file and executes it to create all tables,
         indexes, and relationships. This is safe to call multiple times -
         it only creates tables that don't exist yet (IF NOT EXISTS).
-        """
-        # Get path to schema.sql file (in same directory as this file)
-        schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
 
-        # Read the SQL schema
-        with open(schema_path, 'r') as f:
-            schema_sql = f.read()
-
-        # Execute the schema to create tables
-        with sqlite3.connect(self.db_path) as conn:
+        The schema version is stored in the database (PRAGMA user_version).
+        If the database is already at SCHEMA_VERSION, the file read and
+        script execution are skipped entirely.
+        """
+        with self._get_connection() as conn:
+            # Already up to date? Nothing to do.
+            current_version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if current_version == SCHEMA_VERSION:
+                logger.debug("Database schema already up to date")
+                return
+
+            # Migrate older databases first: schema.sql creates indexes on
+            # these columns, which would fail if the columns don't exist yet.
+            # (Databases from before versioning report user_version 0 too,
+            # so this also runs for brand-new files - it's a no-op there.)
+            self._migrate(conn)
+
+            # Get path to schema.sql file (in same directory as this file)
+            schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
+
+            # Read the SQL schema
+            with open(schema_path, 'r') as f:
+                schema_sql = f.read()
+
+            # Execute the schema to create tables, then record the version
             conn.executescript(schema_sql)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
             conn.commit()
 
         logger.info("Database schema initialized successfully")
 
-    def _get_connection(self) -> sqlite3.Connection:
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """
+        Bring a database created by an older schema version up to date.
+
+        CREATE TABLE IF NOT EXISTS never changes an existing table, so new
+        columns have to be added here explicitly.
+
+        Args:
+            conn: Open database connection
+        """
+        # v3: companies.expires_at (for evict_expired)
+        if self._add_column_if_missing(conn, 'companies', 'expires_at', 'TIMESTAMP'):
+            conn.execute(
+                "UPDATE companies SET expires_at = datetime(research_date, ?) WHERE expires_at IS NULL",
+                (f"+{CACHE_RETENTION_DAYS} days",)
+            )
+
+        # v4: companies.last_accessed_at (LRU-aware eviction)
+        self._add_column_if_missing(conn, 'companies', 'last_accessed_at', 'TIMESTAMP')
+
+        # v5: research_sources.content_zstd (compressed content; old rows
+        # keep using the plain `content` column)
+        self._add_column_if_missing(conn, 'research_sources', 'content_zstd', 'BLOB')
+
+        # v6: sustainability_scores.score_level (stored on save, so readers
+        # never have to compute it)
+        if self._add_column_if_missing(conn, 'sustainability_scores', 'score_level', 'TEXT'):
+            conn.execute(f"UPDATE sustainability_scores SET score_level = {SCORE_LEVEL_SQL}")
+
+    def _add_column_if_missing(self, conn: sqlite3.Connection, table: str,
+                               column: str, column_type: str) -> bool:
+        """
+        Add a column to a table unless it already exists.
+
+        Args:
+            conn: Open database connection
+            table: Table name
+            column: Column name
+            column_type: SQL type (e.g. "TIMESTAMP")
+
+        Returns:
+            True if the column was added (False if it exists already or
+            the table doesn't exist yet - schema.sql will create it)
         """
-        Get a database connection with row factory enabled.
+        existing = {row['name'] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if not existing or column in existing:
+            return False
+
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+        logger.info(f"Added column {table}.{column}")
+        return True
+
+    @contextmanager
+    def _get_connection(self, track_changes: bool = True) -> Iterator[sqlite3.Connection]:
+        """
+        Use the shared database connection (with row factory enabled).
 
         Row factory allows us to access results as dictionaries instead
         of tuples, which is more convenient: row['name'] instead of row[0]
 
-        Returns:
+        Used as a context manager: the connection is locked for this
+        thread while the block runs. The connection is in autocommit
+        mode, so each statement commits by itself; use _transaction()
+        to group several writes. If the block changed any rows,
+        data_version is bumped so UI caches reload.
+
+        Args:
+            track_changes: False for bookkeeping writes (access times)
+                           that shouldn't invalidate UI caches
+
+        Yields:
             SQLite connection object ready to use
+
+        Example:
+            with self._get_connection() as conn:
+                conn.execute("DELETE FROM companies WHERE name = ?", ("Tesla",))
+        """
+        with self._lock:
+            changes_before = self._conn.total_changes
+            try:
+                yield self._conn
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+            if track_changes and self._conn.total_changes != changes_before:
+                self._bump_data_version()
+
+    @contextmanager
+    def _transaction(self, track_changes: bool = True) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block of writes as one explicit transaction.
+
+        BEGIN IMMEDIATE takes the write lock up front, so the block can't
+        fail halfway with "database is locked", and all its statements
+        (e.g. 15 metric INSERTs) share a single commit.
+
+        Args:
+            track_changes: False for bookkeeping writes (access times)
+                           that shouldn't invalidate UI caches
+
+        Yields:
+            SQLite connection inside an open transaction
+
+        Example:
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM sustainability_metrics WHERE company_id = ?", (1,))
+                conn.executemany(self.INSERT_METRIC_SQL, rows)
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dictionary-like access
-        conn.execute("PRAGMA foreign_keys = ON")  # CRITICAL: Enable foreign key constraints!
-        return conn
+        with self._lock:
+            changes_before = self._conn.total_changes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except Exception:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+
+            if track_changes and self._conn.total_changes != changes_before:
+                self._bump_data_version()
+
+    @property
+    def data_version(self) -> int:
+        """
+        Counter that changes whenever data is written or deleted.
+
+        Every _get_connection()/_transaction() block that changed rows bumps
+        it (saves, deletes, eviction). UI caches include it in their key,
+        so cached reads stay valid exactly until the next write instead
+        of for a fixed time. It is shared by every manager of the same
+        file, because all Streamlit sessions read the same database.
+
+        Example:
+            rows = load_history(db.db_path, db.data_version)
+        """
+        return _data_versions.get(self.db_path, 0)
+
+    def _bump_data_version(self) -> None:
+        """Mark cached reads of this database as outdated."""
+        with _data_versions_lock:
+            _data_versions[self.db_path] = _data_versions.get(self.db_path, 0) + 1
+
+    def close(self) -> None:
+        """Flush pending access times and close the database connection."""
+        self._stop_flusher.set()
+        self.flush_access_buffer()
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _flush_loop(manager_ref: "weakref.ref[DatabaseManager]", stop: threading.Event) -> None:
+        """
+        Background thread: flush buffered access times periodically.
+
+        Holds only a weak reference, so the thread ends by itself once
+        its DatabaseManager is garbage collected.
+        """
+        while not stop.wait(ACCESS_FLUSH_INTERVAL_SECONDS):
+            manager = manager_ref()
+            if manager is None:
+                return
+            try:
+                manager.flush_access_buffer()
+            except Exception as e:
+                logger.warning(f"⚠️ Could not flush access times: {str(e)}")
+            del manager  # Don't keep the manager alive while sleeping
+
+    def _record_access(self, company_id: int) -> None:
+        """Remember that a company was just read (written later in bulk)."""
+        with self._access_lock:
+            self._access_buffer[company_id] = _timestamp()
+
+    def flush_access_buffer(self) -> int:
+        """
+        Write buffered last-access times to the database in one transaction.
+
+        Returns:
+            Number of companies updated
+        """
+        with self._access_lock:
+            pending, self._access_buffer = self._access_buffer, {}
+
+        if not pending:
+            return 0
+
+        with self._transaction(track_changes=False) as conn:
+            conn.executemany(
+                "UPDATE companies SET last_accessed_at = ? WHERE id = ?",
+                [(accessed_at, company_id) for company_id, accessed_at in pending.items()]
+            )
+
+        return len(pending)
 
     def save_research(self, company_name: str, sources: List[Dict[str, str]]) -> int:
         """
@@ -154,35 +459,42 @@ class DatabaseManager:
         """
         logger.info(f"💾 Saving research data for: {company_name}")
 
-        with self._get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
 
             # STEP 1: Insert or update company record
             # ON CONFLICT: If company exists, update dates
-            cursor.execute("""
-                INSERT INTO companies (name, research_date, last_updated)
-                VALUES (?, ?, ?)
+            # expires_at: when evict_expired() may delete this company
+            upsert_sql = """
+                INSERT INTO companies (name, research_date, last_updated, expires_at)
+                VALUES (?, ?, ?, ?)
                 ON CONFLICT(name) DO UPDATE SET
                     research_date = excluded.research_date,
-                    last_updated = excluded.last_updated
-            """, (company_name, datetime.now(), datetime.now()))
+                    last_updated = excluded.last_updated,
+                    expires_at = excluded.expires_at
+            """
+            now = _timestamp()
+            expires_at = _timestamp(datetime.now() + timedelta(days=CACHE_RETENTION_DAYS))
+            params = (company_name, now, now, expires_at)
 
             # STEP 2: Get the company ID
-            cursor.execute("SELECT id FROM companies WHERE name = ?", (company_name,))
-            company_id = cursor.fetchone()[0]
+            if SUPPORTS_RETURNING:
+                # Same statement hands back the ID (no second query)
+                cursor.execute(upsert_sql + " RETURNING id", params)
+                company_id = cursor.fetchone()[0]
+            else:
+                cursor.execute(upsert_sql, params)
+                cursor.execute("SELECT id FROM companies WHERE name = ?", (company_name,))
+                company_id = cursor.fetchone()[0]
 
             # STEP 3: Delete old research sources (replace with new ones)
             cursor.execute("DELETE FROM research_sources WHERE company_id = ?", (company_id,))
 
-            # STEP 4: Insert new research sources
-            for source in sources:
-                cursor.execute("""
-                    INSERT INTO research_sources (company_id, url, content, scraped_at)
-                    VALUES (?, ?, ?, ?)
-                """, (company_id, source['url'], source['content'], datetime.now()))
-
-            # Save changes to database
-            conn.commit()
+            # STEP 4: Insert new research sources (one statement for all rows)
+            cursor.executemany(self.INSERT_SOURCE_SQL, [
+                (company_id, source['url'], self._compressor.compress(source['content'].encode('utf-8')), now)
+                for source in sources
+            ])
 
         logger.info(f"✅ Saved {len(sources)} research sources for company_id: {company_id}")
         return company_id
@@ -209,29 +521,25 @@ class DatabaseManager:
         """
         logger.info(f"💾 Saving {len(metrics)} metrics for company_id: {company_id}")
 
-        with self._get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
 
             # STEP 1: Delete old metrics (replace with new ones)
             cursor.execute("DELETE FROM sustainability_metrics WHERE company_id = ?", (company_id,))
 
-            # STEP 2: Insert new metrics
-            for metric in metrics:
-                cursor.execute("""
-                    INSERT INTO sustainability_metrics
-                    (company_id, category, metric_name, value, confidence, extracted_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
+            # STEP 2: Insert new metrics (one statement for all rows)
+            now = _timestamp()
+            cursor.executemany(self.INSERT_METRIC_SQL, [
+                (
                     company_id,
                     metric['category'],
                     metric['metric_name'],
                     metric['value'],
                     metric['confidence'],
-                    datetime.now()
-                ))
-
-            # Save changes
-            conn.commit()
+                    now
+                )
+                for metric in metrics
+            ])
 
         logger.info(f"✅ Successfully saved metrics for company_id: {company_id}")
 
@@ -240,7 +548,7 @@ class DatabaseManager:
         Save sustainability scores for a company.
 
         Stores the final calculated scores including:
-        - Final overall score
+        - Final overall score and its rating (score_level)
         - Individual category scores (Environmental, Social, Governance)
         - Component scores (detailed breakdown as JSON)
 
@@ -248,7 +556,8 @@ class DatabaseManager:
             company_id: ID of the company
             scores: Dictionary with keys:
                    'final_score', 'environmental_score', 'social_score',
-                   'governance_score', 'component_scores' (dict)
+                   'governance_score', 'score_level', 'component_scores' (dict)
+                   (score_level is derived from final_score if missing)
 
         Example:
             scores = {
@@ -256,36 +565,42 @@ class DatabaseManager:
                 'environmental_score': 80.0,
                 'social_score': 70.0,
                 'governance_score': 77.0,
+                'score_level': 'Good',
                 'component_scores': {...}  # Detailed breakdown
             }
             db.save_scores(company_id, scores)
         """
         logger.info(f"💾 Saving scores for company_id: {company_id}")
 
-        with self._get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
 
             # Convert component scores dictionary to JSON string for storage
-            component_scores_json = json.dumps(scores.get('component_scores', {}))
+            # (orjson is several times faster than json and returns bytes)
+            component_scores_json = orjson.dumps(scores.get('component_scores', {})).decode('utf-8')
 
             # Insert new score record
             cursor.execute("""
                 INSERT INTO sustainability_scores
                 (company_id, final_score, environmental_score, social_score,
-                 governance_score, component_scores_json, calculated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                 governance_score, score_level, component_scores_json, calculated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 company_id,
                 scores['final_score'],
                 scores.get('environmental_score'),
                 scores.get('social_score'),
                 scores.get('governance_score'),
+                scores.get('score_level'),
                 component_scores_json,
-                datetime.now()
+                _timestamp()
             ))
 
-            # Save changes
-            conn.commit()
+            if scores.get('score_level') is None:
+                cursor.execute(
+                    f"UPDATE sustainability_scores SET score_level = {SCORE_LEVEL_SQL} WHERE id = ?",
+                    (cursor.lastrowid,)
+                )
 
         logger.info(f"✅ Successfully saved scores for company_id: {company_id}")
 
@@ -307,13 +622,7 @@ class DatabaseManager:
                 print("Company not found")
         """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM companies WHERE name = ?", (company_name,))
-            row = cursor.fetchone()
-
-            if row:
-                return dict(row)  # Convert to dictionary
-            return None
+            return self._fetch_company(conn, company_name)
 
     def get_research_sources(self, company_id: int) -> List[Dict]:
         """
@@ -332,14 +641,52 @@ class DatabaseManager:
                 print(f"Content length: {len(source['content'])} chars")
         """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM research_sources
-                WHERE company_id = ?
-                ORDER BY scraped_at DESC
-            """, (company_id,))
+            return self._fetch_sources(conn, company_id)
 
-            return [dict(row) for row in cursor.fetchall()]
+    def get_source_excerpts(self, company_name: str, limit: int = 3,
+                            max_bytes: int = 6000) -> List[Dict]:
+        """
+        Get the beginning of a company's most recent sources.
+
+        For prompts that only use a few thousand characters per source
+        (RAG questions), loading whole pages is wasted work. Only `limit`
+        rows are read, and only the first `max_bytes` of each page are
+        decompressed (zstd is a stream, so it can stop early). Legacy
+        uncompressed rows are cut with SUBSTR in SQL (on the BLOB, so
+        it counts bytes like the zstd path, not characters).
+
+        Args:
+            company_name: Name of the company
+            limit: Number of sources (newest first)
+            max_bytes: Bytes of content per source (UTF-8; a character
+                       cut in half at the end is dropped)
+
+        Returns:
+            List of {'url', 'content'} dicts (empty if no sources)
+
+        Example:
+            for source in db.get_source_excerpts("Tesla", limit=3, max_bytes=4000):
+                print(source['url'], len(source['content']))
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                SELECT s.url, s.content_zstd, SUBSTR(CAST(s.content AS BLOB), 1, ?) AS content
+                FROM research_sources s
+                JOIN companies c ON c.id = s.company_id
+                WHERE c.name = ?
+                ORDER BY s.scraped_at DESC
+                LIMIT ?
+            """, (max_bytes, company_name, limit)).fetchall()
+
+            excerpts = []
+            for row in rows:
+                prefix = row['content'] or b''
+                if row['content_zstd'] is not None:
+                    with self._decompressor.stream_reader(row['content_zstd']) as reader:
+                        prefix = reader.read(max_bytes)
+                excerpts.append({'url': row['url'], 'content': prefix.decode('utf-8', errors='ignore')})
+
+            return excerpts
 
     def get_metrics(self, company_id: int) -> List[Dict]:
         """
@@ -357,14 +704,34 @@ class DatabaseManager:
                 print(f"{metric['category']}: {metric['metric_name']} = {metric['value']}")
         """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM sustainability_metrics
-                WHERE company_id = ?
-                ORDER BY category, metric_name
-            """, (company_id,))
+            return self._fetch_metrics(conn, company_id)
 
-            return [dict(row) for row in cursor.fetchall()]
+    def get_category_metrics(self, company_id: int, category: str) -> List[Tuple[str, float]]:
+        """
+        Get one category's metrics for a company, best first.
+
+        The category filter and the sort run in SQLite, so callers that
+        show a single category don't load (and sort) all 15 metrics.
+
+        Args:
+            company_id: ID of the company
+            category: "Environmental", "Social" or "Governance"
+
+        Returns:
+            List of (metric_name, value) tuples, highest value first
+
+        Example:
+            for name, value in db.get_category_metrics(company_id, "Environmental"):
+                print(f"{name}: {value:.1f}")
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT metric_name, value FROM sustainability_metrics
+                WHERE company_id = ? AND category = ?
+                ORDER BY value DESC
+            """, (company_id, category))
+
+            return [tuple(row) for row in cursor.fetchall()]
 
     def get_latest_score(self, company_id: int) -> Optional[Dict]:
         """
@@ -383,24 +750,75 @@ class DatabaseManager:
                 print(f"Components: {scores['component_scores']}")
         """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM sustainability_scores
-                WHERE company_id = ?
-                ORDER BY calculated_at DESC
-                LIMIT 1
-            """, (company_id,))
-
-            row = cursor.fetchone()
-            if row:
-                score_dict = dict(row)
-                # Parse JSON component scores back to dictionary
-                if score_dict.get('component_scores_json'):
-                    score_dict['component_scores'] = json.loads(score_dict['component_scores_json'])
-                return score_dict
-            return None
-
-    def get_recent_analysis(self, company_name: str, days: int = 7) -> Optional[Tuple[Dict, List[Dict], List[Dict], Dict]]:
+            return self._fetch_latest_score(conn, company_id)
+
+    # ------------------------------------------------------------------
+    # Query helpers: run on a connection the caller already holds, so
+    # several reads can share one connection/lock (see get_recent_analysis)
+    # ------------------------------------------------------------------
+
+    def _fetch_company(self, conn: sqlite3.Connection, company_name: str) -> Optional[Dict]:
+        """Query behind get_company()."""
+        row = conn.execute("SELECT * FROM companies WHERE name = ?", (company_name,)).fetchone()
+
+        if row:
+            return dict(row)  # Convert to dictionary
+        return None
+
+    def _fetch_sources(self, conn: sqlite3.Connection, company_id: int) -> List[Dict]:
+        """Query behind get_research_sources()."""
+        cursor = conn.execute("""
+            SELECT * FROM research_sources
+            WHERE company_id = ?
+            ORDER BY scraped_at DESC
+        """, (company_id,))
+
+        return [self._source_from_row(row) for row in cursor.fetchall()]
+
+    def _source_from_row(self, row: sqlite3.Row) -> Dict:
+        """Turn a research_sources row into a source dict (content decompressed)."""
+        source = dict(row)
+        # Decompress into the usual 'content' key (rows saved before
+        # compression was added only have plain `content`)
+        compressed = source.pop('content_zstd', None)
+        if compressed is not None:
+            source['content'] = self._decompressor.decompress(compressed).decode('utf-8')
+        return source
+
+    def _fetch_metrics(self, conn: sqlite3.Connection, company_id: int) -> List[Dict]:
+        """Query behind get_metrics()."""
+        cursor = conn.execute("""
+            SELECT * FROM sustainability_metrics
+            WHERE company_id = ?
+            ORDER BY category, metric_name
+        """, (company_id,))
+
+        return [dict(row) for row in cursor.fetchall()]
+
+    def _fetch_latest_score(self, conn: sqlite3.Connection, company_id: int) -> Optional[Dict]:
+        """Query behind get_latest_score()."""
+        row = conn.execute("""
+            SELECT * FROM sustainability_scores
+            WHERE company_id = ?
+            ORDER BY calculated_at DESC
+            LIMIT 1
+        """, (company_id,)).fetchone()
+
+        if row:
+            return self._score_from_row(row)
+        return None
+
+    @staticmethod
+    def _score_from_row(row: sqlite3.Row) -> Dict:
+        """Turn a sustainability_scores row into a score dict."""
+        score_dict = dict(row)
+        # Parse JSON component scores back to dictionary
+        if score_dict.get('component_scores_json'):
+            score_dict['component_scores'] = orjson.loads(score_dict['component_scores_json'])
+        return score_dict
+
+    def get_recent_analysis(self, company_name: str, days: int = 7,
+                            include_sources: bool = True) -> Optional[Tuple[Dict, List[Dict], List[Dict], Dict]]:
         """
         Get recent analysis for a company if it exists within the cache period.
 
@@ -414,6 +832,9 @@ class DatabaseManager:
         Args:
             company_name: Name of the company
             days: Number of days to consider as "recent" (default: 7)
+            include_sources: False skips loading (and decompressing) the
+                             scraped pages; their existence is still
+                             checked, and sources is an empty list
 
         Returns:
             Tuple of (company, sources, metrics, scores) if recent analysis exists
@@ -431,38 +852,287 @@ class DatabaseManager:
                 # Need to analyze again
                 print("No recent data, running new analysis...")
         """
-        # Get company record
-        company = self.get_company(company_name)
-
-        if not company:
-            # Company not in database yet
-            return None
-
-        # Check if analysis is recent enough
-        research_date = datetime.fromisoformat(company['research_date'])
-        cache_expiry = datetime.now() - timedelta(days=days)
+        # Housekeeping: drop expired companies (at most once per hour)
+        self._maybe_evict_expired()
 
-        if research_date < cache_expiry:
-            # Analysis is too old
-            logger.info(f"⏰ Analysis for {company_name} is older than {days} days")
-            return None
-
-        # Get all associated data
-        sources = self.get_research_sources(company['id'])
-        metrics = self.get_metrics(company['id'])
-        scores = self.get_latest_score(company['id'])
+        # All reads share ONE connection/lock: small indexed queries per
+        # table instead of a JOIN (which would multiply sources × metrics rows)
+        with self._get_connection() as conn:
+            # Get company record + check if analysis is recent enough.
+            # The freshness check runs in SQL as a plain string comparison
+            # (ISO timestamps sort chronologically) - no date parsing.
+            cache_expiry = _timestamp(datetime.now() - timedelta(days=days))
+            row = conn.execute(
+                "SELECT *, research_date >= ? AS is_fresh FROM companies WHERE name = ?",
+                (cache_expiry, company_name)
+            ).fetchone()
+
+            if not row:
+                # Company not in database yet
+                return None
+
+            company = dict(row)
+            research_date = company['research_date']
+
+            if not company.pop('is_fresh'):
+                # Analysis is too old
+                logger.info(f"⏰ Analysis for {company_name} is older than {days} days")
+                return None
+
+            # Get all associated data
+            if include_sources:
+                sources = self._fetch_sources(conn, company['id'])
+                has_sources = bool(sources)
+            else:
+                sources = []
+                has_sources = conn.execute(
+                    "SELECT EXISTS (SELECT 1 FROM research_sources WHERE company_id = ?)",
+                    (company['id'],)
+                ).fetchone()[0]
+            metrics = self._fetch_metrics(conn, company['id'])
+            scores = self._fetch_latest_score(conn, company['id'])
 
         # Make sure we have all required data
-        if not sources or not scores:
+        if not has_sources or not scores:
             logger.info(f"⚠️ Incomplete analysis data for {company_name}")
             return None
 
+        self._record_access(company['id'])
+
         logger.info(f"✅ Found recent analysis for {company_name} from {research_date}")
         return (company, sources, metrics, scores)
 
-    def get_all_companies(self) -> List[Dict]:
+    def get_all_recent_analyses(self, days: int = 7,
+                                include_sources: bool = True) -> Dict[str, Tuple[Dict, List[Dict], List[Dict], Dict]]:
+        """
+        Get the recent analysis of every company at once.
+
+        Same result as calling get_recent_analysis() for each company, but
+        with four queries in total (companies, sources, metrics, latest
+        scores) instead of four per company. Rows are grouped by
+        company_id in Python.
+
+        Args:
+            days: Cache period; older analyses are left out
+            include_sources: False skips loading (and decompressing) the
+                             scraped pages - by far the largest data - for
+                             callers that only show scores; sources is
+                             then an empty list
+
+        Returns:
+            {company_name: (company, sources, metrics, scores)}, most
+            recent first; companies with incomplete data are left out
+
+        Example:
+            for name, (company, sources, metrics, scores) in db.get_all_recent_analyses().items():
+                print(f"{name}: {scores['final_score']:.1f}")
+        """
+        # Housekeeping: drop expired companies (at most once per hour)
+        self._maybe_evict_expired()
+
+        cache_expiry = _timestamp(datetime.now() - timedelta(days=days))
+        # Rows of the fresh companies only (same freshness check as get_recent_analysis)
+        fresh_ids = "SELECT id FROM companies WHERE research_date >= ?"
+
+        sources_by_company = defaultdict(list)
+        metrics_by_company = defaultdict(list)
+        scores_by_company = {}
+
+        with self._get_connection() as conn:
+            companies = [dict(row) for row in conn.execute(
+                "SELECT * FROM companies WHERE research_date >= ? ORDER BY research_date DESC",
+                (cache_expiry,)
+            )]
+            if not companies:
+                return {}
+
+            if include_sources:
+                for row in conn.execute(f"""
+                    SELECT * FROM research_sources
+                    WHERE company_id IN ({fresh_ids})
+                    ORDER BY scraped_at DESC
+                """, (cache_expiry,)):
+                    sources_by_company[row['company_id']].append(self._source_from_row(row))
+            else:
+                # Still only list companies that have sources
+                companies_with_sources = {row[0] for row in conn.execute(f"""
+                    SELECT DISTINCT company_id FROM research_sources
+                    WHERE company_id IN ({fresh_ids})
+                """, (cache_expiry,))}
+
+            for row in conn.execute(f"""
+                SELECT * FROM sustainability_metrics
+                WHERE company_id IN ({fresh_ids})
+                ORDER BY category, metric_name
+            """, (cache_expiry,)):
+                metrics_by_company[row['company_id']].append(dict(row))
+
+            # Latest score per company, answered from idx_scores_company_time
+            for row in conn.execute(f"""
+                SELECT s.* FROM companies c
+                JOIN sustainability_scores s ON s.id = (
+                    SELECT id FROM sustainability_scores
+                    WHERE company_id = c.id
+                    ORDER BY calculated_at DESC
+                    LIMIT 1
+                )
+                WHERE c.id IN ({fresh_ids})
+            """, (cache_expiry,)):
+                scores_by_company[row['company_id']] = self._score_from_row(row)
+
+        analyses = {}
+        for company in companies:
+            company_id = company['id']
+            sources = sources_by_company.get(company_id, [])
+            scores = scores_by_company.get(company_id)
+
+            # Make sure we have all required data
+            has_sources = bool(sources) if include_sources else company_id in companies_with_sources
+            if not has_sources or not scores:
+                continue
+
+            self._record_access(company_id)
+            analyses[company['name']] = (company, sources, metrics_by_company.get(company_id, []), scores)
+
+        return analyses
+
+    def evict_expired(self) -> int:
+        """
+        Delete companies whose retention period has ended.
+
+        A company is only removed if it was neither saved nor read
+        within CACHE_RETENTION_DAYS (least-recently-used first: anything
+        still being looked at stays). Related sources, metrics and scores
+        are removed automatically (ON DELETE CASCADE). Keeps the
+        database - and every index lookup - from growing forever.
+
+        Returns:
+            Number of companies deleted
+
+        Example:
+            removed = db.evict_expired()
+            print(f"Removed {removed} expired companies")
+        """
+        # Make sure recent reads are counted before deciding
+        self.flush_access_buffer()
+
+        now = datetime.now()
+        access_cutoff = _timestamp(now - timedelta(days=CACHE_RETENTION_DAYS))
+
+        with self._transaction() as conn:
+            cursor = conn.execute("""
+                DELETE FROM companies
+                WHERE expires_at < ?
+                  AND (last_accessed_at IS NULL OR last_accessed_at < ?)
+            """, (_timestamp(now), access_cutoff))
+            removed = cursor.rowcount
+
+        self._last_eviction = time.monotonic()
+
+        if removed:
+            logger.info(f"🧹 Evicted {removed} expired companies")
+        return removed
+
+    def _maybe_evict_expired(self) -> None:
+        """Run evict_expired() if it hasn't run in the last EVICTION_INTERVAL_SECONDS."""
+        if (self._last_eviction is None
+                or time.monotonic() - self._last_eviction >= EVICTION_INTERVAL_SECONDS):
+            self.evict_expired()
+
+    def delete_companies(self, company_names: List[str]) -> int:
         """
-        Get all companies in the database.
+        Delete several companies (and, via CASCADE, all their data) at once.
+
+        One DELETE ... WHERE name IN (...) statement in one transaction,
+        so deleting K companies costs a single commit instead of K.
+
+        Args:
+            company_names: Names of the companies to delete
+
+        Returns:
+            Number of companies deleted
+
+        Example:
+            db.delete_companies(["Tesla", "Apple"])
+        """
+        if not company_names:
+            return 0
+
+        placeholders = ",".join("?" * len(company_names))
+        with self._transaction() as conn:
+            return conn.execute(
+                f"DELETE FROM companies WHERE name IN ({placeholders})",
+                company_names
+            ).rowcount
+
+    def companies_exist(self, company_names: List[str], days: Optional[int] = None) -> Set[str]:
+        """
+        Check which of the given companies are in the database.
+
+        One indexed lookup (name IN (...)) that reads no analysis data,
+        so handlers can reject requests for unknown companies before
+        loading anything.
+
+        Args:
+            company_names: Names to check
+            days: Only count companies analyzed within this many days
+                  (None = any age)
+
+        Returns:
+            Set of the names that exist
+
+        Example:
+            known = db.companies_exist(["Tesla", "Apple"], days=7)
+            missing = [c for c in ["Tesla", "Apple"] if c not in known]
+        """
+        if not company_names:
+            return set()
+
+        placeholders = ",".join("?" * len(company_names))
+        query = f"SELECT name FROM companies WHERE name IN ({placeholders})"
+        params = list(company_names)
+        if days is not None:
+            query += " AND research_date >= ?"
+            params.append(_timestamp(datetime.now() - timedelta(days=days)))
+
+        with self._get_connection() as conn:
+            return {row[0] for row in conn.execute(query, params)}
+
+    def clear_all(self) -> int:
+        """
+        Delete every company and all of its data.
+
+        The child tables are emptied first with an unconditional DELETE,
+        which SQLite runs as a fast truncate (no per-row work), so the
+        companies DELETE no longer has any rows to cascade to. All of it
+        is one transaction. Afterwards the WAL file is checkpointed and
+        truncated, so clearing a large database doesn't leave a
+        multi-MB log behind that slows down the next writes.
+
+        Returns:
+            Number of companies deleted
+
+        Example:
+            removed = db.clear_all()
+        """
+        with self._transaction() as conn:
+            for table in ('research_sources', 'sustainability_metrics', 'sustainability_scores'):
+                conn.execute(f"DELETE FROM {table}")
+            deleted = conn.execute("DELETE FROM companies").rowcount
+
+        with self._get_connection(track_changes=False) as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        logger.info(f"🗑️ Cleared database ({deleted} companies)")
+        return deleted
+
+    def get_all_companies(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict]:
+        """
+        Get all companies in the database (optionally one page of them).
+
+        Args:
+            limit: Maximum number of companies to return (None = all)
+            offset: Number of companies to skip (for pagination)
 
         Returns:
             List of company dictionaries, ordered by most recent first
@@ -471,16 +1141,192 @@ class DatabaseManager:
             companies = db.get_all_companies()
             for company in companies:
                 print(f"- {company['name']} (analyzed: {company['research_date']})")
+
+            # Second page of 50
+            page = db.get_all_companies(limit=50, offset=50)
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
+            # LIMIT -1 means "no limit" in SQLite
             cursor.execute("""
                 SELECT * FROM companies
                 ORDER BY research_date DESC
-            """)
+                LIMIT ? OFFSET ?
+            """, (-1 if limit is None else limit, offset))
 
             return [dict(row) for row in cursor.fetchall()]
 
+    def get_companies_with_latest_scores(self, limit: Optional[int] = None,
+                                         offset: int = 0) -> List[Tuple[str, str, Optional[float]]]:
+        """
+        Get companies together with their latest final score, in one query.
+
+        Same order and paging as get_all_companies(), but the latest score
+        of every company is joined in by SQLite - no extra query per
+        company (the N+1 pattern).
+
+        Args:
+            limit: Maximum number of companies to return (None = all)
+            offset: Number of companies to skip (for pagination)
+
+        Returns:
+            List of (name, research_date, final_score) tuples; final_score
+            is None for companies without a score
+
+        Example:
+            for name, research_date, final_score in db.get_companies_with_latest_scores(limit=50):
+                print(f"- {name}: {final_score}")
+        """
+        with self._get_connection() as conn:
+            # The subquery is answered from idx_scores_company_time
+            cursor = conn.execute("""
+                SELECT c.name, c.research_date, s.final_score
+                FROM companies c
+                LEFT JOIN sustainability_scores s ON s.id = (
+                    SELECT id FROM sustainability_scores
+                    WHERE company_id = c.id
+                    ORDER BY calculated_at DESC
+                    LIMIT 1
+                )
+                ORDER BY c.research_date DESC
+                LIMIT ? OFFSET ?
+            """, (-1 if limit is None else limit, offset))
+
+            return [tuple(row) for row in cursor.fetchall()]
+
+    def list_companies_with_scores(self, days: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Get (name, final_score) of every scored company, best first.
+
+        A two-column projection for list views: no metrics, sources or
+        score details are loaded, and SQLite does the sorting. Like
+        get_all_recent_analyses(), companies without sources or a score
+        are left out.
+
+        Args:
+            days: Only include companies analyzed within this many days
+                  (None = any age)
+
+        Returns:
+            List of (name, final_score) tuples, highest score first
+
+        Example:
+            for name, final_score in db.list_companies_with_scores(days=7):
+                print(f"- {name}: {final_score:.1f}/100")
+        """
+        query = """
+            SELECT c.name, s.final_score
+            FROM companies c
+            JOIN sustainability_scores s ON s.id = (
+                SELECT id FROM sustainability_scores
+                WHERE company_id = c.id
+                ORDER BY calculated_at DESC
+                LIMIT 1
+            )
+            WHERE EXISTS (SELECT 1 FROM research_sources r WHERE r.company_id = c.id)
+        """
+        params = []
+        if days is not None:
+            query += " AND c.research_date >= ?"
+            params.append(_timestamp(datetime.now() - timedelta(days=days)))
+        query += " ORDER BY s.final_score DESC"
+
+        with self._get_connection() as conn:
+            return [tuple(row) for row in conn.execute(query, params)]
+
+    def get_comparison_scores(self, company_names: List[str],
+                              days: Optional[int] = None) -> List[Tuple[str, float, float, float, float]]:
+        """
+        Get the latest scores of the given companies, best first.
+
+        One query for a comparison: only the four score columns are read,
+        and SQLite sorts them. Companies that are unknown (or have no
+        sources or score) are simply missing from the result.
+
+        Args:
+            company_names: Companies to compare
+            days: Only include companies analyzed within this many days
+                  (None = any age)
+
+        Returns:
+            List of (name, final_score, environmental_score, social_score,
+            governance_score) tuples, highest final score first
+
+        Example:
+            rows = db.get_comparison_scores(["Tesla", "Apple"], days=7)
+            name, final_score, env, social, gov = rows[0]  # the winner
+        """
+        if not company_names:
+            return []
+
+        placeholders = ",".join("?" * len(company_names))
+        query = f"""
+            SELECT c.name, s.final_score, s.environmental_score, s.social_score, s.governance_score
+            FROM companies c
+            JOIN sustainability_scores s ON s.id = (
+                SELECT id FROM sustainability_scores
+                WHERE company_id = c.id
+                ORDER BY calculated_at DESC
+                LIMIT 1
+            )
+            WHERE c.name IN ({placeholders})
+              AND EXISTS (SELECT 1 FROM research_sources r WHERE r.company_id = c.id)
+        """
+        params = list(company_names)
+        if days is not None:
+            query += " AND c.research_date >= ?"
+            params.append(_timestamp(datetime.now() - timedelta(days=days)))
+        query += " ORDER BY s.final_score DESC"
+
+        with self._get_connection() as conn:
+            return [tuple(row) for row in conn.execute(query, params)]
+
+    def count_companies(self) -> int:
+        """
+        Count the companies in the database.
+
+        Returns:
+            Number of companies
+
+        Example:
+            pages = (db.count_companies() + 49) // 50
+        """
+        with self._get_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM companies").fetchone()[0]
+
+
+# Shared instances, one per database file
+_db_instances: Dict[str, DatabaseManager] = {}
+_db_lock = threading.Lock()
+
+
+def get_db_manager(db_path: Optional[str] = None) -> DatabaseManager:
+    """
+    Get a shared DatabaseManager instance.
+
+    Streamlit reruns the whole script on every interaction. Creating a
+    new DatabaseManager each time would re-check the schema again and
+    again - this returns the same instance for the whole process.
+
+    Args:
+        db_path: Path to SQLite database file (same default as DatabaseManager)
+
+    Returns:
+        DatabaseManager instance
+
+    Example:
+        from database.db_manager import get_db_manager
+
+        db = get_db_manager()
+        cached = db.get_recent_analysis("Tesla")
+    """
+    path = db_path or os.getenv('DATABASE_PATH', 'sustainability_data.db')
+
+    with _db_lock:
+        if path not in _db_instances:
+            _db_instances[path] = DatabaseManager(path)
+        return _db_instances[path]
+
 
 def test_database_manager():
     """
@@ -598,6 +1444,7 @@ def test_database_manager():
         print("=" * 70)
 
         # STEP 8: Cleanup
+        db.close()
         import os
         if os.path.exists("test_sustainability.db"):
             os.remove("test_sustainability.db")
@@ -5,7 +5,9 @@ CREATE TABLE IF NOT EXISTS companies (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL UNIQUE,
     research_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    expires_at TIMESTAMP, -- When the company may be evicted (CACHE_RETENTION_DAYS)
+    last_accessed_at TIMESTAMP -- Last cache hit (flushed in batches)
 );
 
 -- Research sources table: stores URLs and content from research
@@ -13,7 +15,8 @@ CREATE TABLE IF NOT EXISTS research_sources (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     company_id INTEGER NOT NULL,
     url TEXT NOT NULL,
-    content TEXT,
+    content TEXT, -- Legacy plain-text content (rows saved before compression)
+    content_zstd BLOB, -- zstd-compressed UTF-8 content
     scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE
 );
@@ -38,15 +41,23 @@ CREATE TABLE IF NOT EXISTS sustainability_scores (
     environmental_score REAL,
     social_score REAL,
     governance_score REAL,
+    score_level TEXT, -- Rating of final_score (Excellent, Good, Fair, Poor, Very Poor)
     component_scores_json TEXT, -- JSON with detailed component breakdown
     calculated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (company_id) REFERENCES companies(id) ON DELETE CASCADE
 );
 
 -- Create indexes for faster queries
-CREATE INDEX IF NOT EXISTS idx_companies_name ON companies(name);
+-- companies.name needs no extra index: UNIQUE already creates one
+-- (used by get_company and the ON CONFLICT upsert)
+DROP INDEX IF EXISTS idx_companies_name;
 CREATE INDEX IF NOT EXISTS idx_research_sources_company ON research_sources(company_id);
 CREATE INDEX IF NOT EXISTS idx_metrics_company ON sustainability_metrics(company_id);
 CREATE INDEX IF NOT EXISTS idx_metrics_category ON sustainability_metrics(category);
-CREATE INDEX IF NOT EXISTS idx_scores_company ON sustainability_scores(company_id);
+-- Latest score lookup: WHERE company_id = ? ORDER BY calculated_at DESC LIMIT 1
+-- is answered straight from this index (it also covers company_id-only lookups)
+DROP INDEX IF EXISTS idx_scores_company;
+CREATE INDEX IF NOT EXISTS idx_scores_company_time ON sustainability_scores(company_id, calculated_at DESC);
 CREATE INDEX IF NOT EXISTS idx_companies_research_date ON companies(research_date);
+CREATE INDEX IF NOT EXISTS idx_companies_expires ON companies(expires_at);
+CREATE INDEX IF NOT EXISTS idx_companies_last_accessed ON companies(last_accessed_at);
@@ -0,0 +1,226 @@
+"""
+Response Caches for LLM Calls
+
+LLM calls are slow (seconds) and cost money. When we ask the same thing
+twice we should pay only once. This module provides two cache tiers:
+
+1. TTLCache      - exact match: same key → same answer (a fast dict lookup)
+2. SemanticCache - "close enough" match: compares text embeddings and
+                   reuses an answer when the new input means nearly the
+                   same thing as an old one
+
+Student Guide:
+--------------
+What is an embedding?
+- A list of numbers (a vector) that represents the meaning of a text
+- Texts about the same thing have vectors pointing the same direction
+- Cosine similarity measures that: 1.0 = identical meaning, 0 = unrelated
+
+Why namespaces?
+- Two companies can have very similar research text (e.g. both quote
+  the same industry report). We never want Apple's metrics returned for
+  Tesla, so semantic lookups only compare entries in the same namespace.
+
+Both caches are in-process and bounded (oldest entries are dropped first),
+so memory use stays small. Results that must survive restarts are already
+stored in the SQLite database.
+
+Usage:
+    from llm.cache import TTLCache, SemanticCache, make_cache_key
+
+    cache = TTLCache(ttl_seconds=3600)
+    key = make_cache_key("Tesla", "some content")
+    cache.set(key, result)
+    cache.get(key)  # → result (until it expires)
+"""
+
+import math
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+
+def make_cache_key(*parts: str) -> str:
+    """
+    Build a stable SHA-256 cache key from several strings.
+
+    Args:
+        *parts: Strings that together identify the request
+
+    Returns:
+        Hex digest that is identical for identical inputs
+
+    Example:
+        key = make_cache_key("tesla", "https://a.com:3f2a...", "https://b.com:91cc...")
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')  # Separator so ("ab", "c") != ("a", "bc")
+    return digest.hexdigest()
+
+
+class TTLCache:
+    """
+    Thread-safe exact-match cache with expiry and a size limit.
+
+    Example usage:
+        cache = TTLCache(ttl_seconds=60, max_entries=100)
+        cache.set("key", {"answer": 42})
+        cache.get("key")      # {"answer": 42}
+        cache.get("missing")  # None
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: How long an entry stays valid
+            max_entries: Maximum entries kept (oldest dropped first)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            # Mark as recently used
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SemanticCache:
+    """
+    Embedding-based cache: returns a stored value when a new input is
+    similar enough (cosine similarity) to a previous one.
+
+    Vectors are normalized when stored, so similarity is a plain dot
+    product. With a few hundred entries a pure-Python scan takes well
+    under a millisecond - far less than the LLM call it replaces.
+
+    Example usage:
+        cache = SemanticCache(threshold=0.95, ttl_seconds=3600)
+        cache.add("tesla", embedding, metrics)
+        cache.lookup("tesla", similar_embedding)  # → metrics
+    """
+
+    def __init__(self, threshold: float = 0.95, ttl_seconds: float = 7 * 24 * 3600,
+                 max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            threshold: Minimum cosine similarity to count as a hit (0-1)
+            ttl_seconds: How long an entry stays valid
+            max_entries: Maximum entries kept (oldest dropped first)
+        """
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # Each entry: (namespace, unit vector, expires_at, value)
+        self._entries: List[Tuple[str, List[float], float, Any]] = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> List[float]:
+        """Scale a vector to length 1 so dot product = cosine similarity."""
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+
+    def lookup(self, namespace: str, embedding: List[float]) -> Optional[Any]:
+        """
+        Find the most similar stored value in a namespace.
+
+        Args:
+            namespace: Only entries with this namespace are compared
+            embedding: Embedding of the new input
+
+        Returns:
+            Best matching value if its similarity >= threshold, else None
+        """
+        query = self._normalize(embedding)
+        now = time.monotonic()
+        best_score, best_value = 0.0, None
+
+        with self._lock:
+            # Drop expired entries while we're scanning anyway
+            self._entries = [e for e in self._entries if e[2] >= now]
+
+            for entry_namespace, vector, _, value in self._entries:
+                if entry_namespace != namespace:
+                    continue
+                score = sum(a * b for a, b in zip(query, vector))
+                if score > best_score:
+                    best_score, best_value = score, value
+
+        if best_score >= self.threshold:
+            return best_value
+        return None
+
+    def add(self, namespace: str, embedding: List[float], value: Any) -> None:
+        """
+        Store a value with its embedding.
+
+        Args:
+            namespace: Group the entry belongs to (e.g. company name)
+            embedding: Embedding of the input that produced the value
+            value: Value to cache
+        """
+        entry = (namespace, self._normalize(embedding), time.monotonic() + self.ttl_seconds, value)
+
+        with self._lock:
+            self._entries.append(entry)
+            if len(self._entries) > self.max_entries:
+                del self._entries[:len(self._entries) - self.max_entries]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -19,11 +19,23 @@ Usage:
     response = client.complete(prompt, temperature=0.2)
 """
 
+import io
 import os
+import time
+import atexit
+import asyncio
 import logging
-from typing import Optional
+import weakref
+import threading
+import importlib.util
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+import httpx
+import orjson
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
+from llm.cache import TTLCache, SemanticCache, make_cache_key
+from llm.rate_limit import RateLimiter
+from llm.tokens import CHARS_PER_TOKEN
 
 # Load environment variables
 load_dotenv()
@@ -31,6 +43,77 @@ load_dotenv()
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Connection pool size for the HTTP clients. Keep-alive connections are
+# reused between calls, so only the first request pays for the TCP + TLS
+# handshake (~50-150 ms).
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# HTTP/2 multiplexes concurrent requests over one connection. Needs the
+# optional "h2" package; without it httpx falls back to HTTP/1.1.
+HTTP2_ENABLED = importlib.util.find_spec('h2') is not None
+
+# Client-side throttling, set a bit below the account's OpenAI limits so
+# batch work (many companies at once) doesn't run into 429 errors
+DEFAULT_MAX_CONCURRENCY = int(os.getenv('OPENAI_MAX_CONCURRENCY', 8))
+DEFAULT_RPM = int(os.getenv('OPENAI_RPM', 450))
+DEFAULT_TPM = int(os.getenv('OPENAI_TPM', 180000))
+
+# Transient failures (429 rate limit, 5xx, timeouts, dropped connections)
+# are retried by the OpenAI SDK with exponential backoff + jitter, and it
+# honors the server's Retry-After header. 400-type errors (bad request,
+# auth) are never retried - retrying wouldn't help.
+MAX_RETRIES = int(os.getenv('OPENAI_MAX_RETRIES', 5))
+REQUEST_TIMEOUT_SECONDS = float(os.getenv('OPENAI_TIMEOUT_SECONDS', 60))
+# Fail fast when a connection can't even be opened (the retry kicks in)
+REQUEST_TIMEOUT = httpx.Timeout(REQUEST_TIMEOUT_SECONDS, connect=5.0)
+
+# Calls at or below this temperature give (nearly) the same answer every
+# time, so identical requests are answered from the response cache
+CACHEABLE_MAX_TEMPERATURE = 0.1
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv('LLM_RESPONSE_CACHE_TTL_SECONDS', 3600))
+
+# Opt-in semantic cache (complete(..., semantic_cache_key=question)):
+# rephrasings of an earlier question reuse its answer. Questions that
+# differ only in scope ("Scope 1" vs "Scope 3 emissions", "2023" vs "2030
+# targets") can still be very similar, so the threshold is strict (same
+# as the extractor's); a false hit silently serves the wrong answer
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv('LLM_SEMANTIC_CACHE_THRESHOLD', 0.95))
+SEMANTIC_CACHE_TTL_SECONDS = float(os.getenv('LLM_SEMANTIC_CACHE_TTL_SECONDS', 24 * 3600))
+
+# Batch API job states after which nothing changes any more
+BATCH_FINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+
+# One HTTP client (connection pool) for every sync LLMClient in the process
+_shared_http_client: Optional[httpx.Client] = None
+_shared_http_lock = threading.Lock()
+
+
+def _get_shared_http_client() -> httpx.Client:
+    """
+    Get the process-wide HTTP client used by all sync OpenAI clients.
+
+    Sharing it means every LLMClient reuses the same warm (keep-alive,
+    HTTP/2 if available) connections instead of each paying for its own
+    TCP + TLS handshakes.
+
+    Returns:
+        httpx.Client configured for the OpenAI SDK
+    """
+    global _shared_http_client
+
+    if _shared_http_client is None:
+        with _shared_http_lock:
+            if _shared_http_client is None:
+                _shared_http_client = DefaultHttpxClient(
+                    limits=HTTP_POOL_LIMITS,
+                    timeout=REQUEST_TIMEOUT,
+                    http2=HTTP2_ENABLED
+                )
+                atexit.register(_shared_http_client.close)
+
+    return _shared_http_client
+
 
 class LLMClient:
     """
@@ -62,12 +145,22 @@ class LLMClient:
         )
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        rpm: Optional[int] = None,
+        tpm: Optional[int] = None
+    ):
         """
         Initialize the LLM client.
 
         Args:
             api_key: OpenAI API key. If None, reads from OPENAI_API_KEY env variable
+            max_concurrency: Maximum async requests in flight per event loop
+                             (default: OPENAI_MAX_CONCURRENCY or 8)
+            rpm: Requests per minute allowed (default: OPENAI_RPM or 450)
+            tpm: Tokens per minute allowed (default: OPENAI_TPM or 180000)
 
         Raises:
             ValueError: If API key is not found
@@ -77,12 +170,41 @@ class LLMClient:
         if not self.api_key:
             raise ValueError("Missing OPENAI_API_KEY in environment variables")
 
-        # Create OpenAI client
-        self.client = OpenAI(api_key=self.api_key)
+        # Create OpenAI client on the process-wide pooled HTTP client
+        self.client = OpenAI(
+            api_key=self.api_key,
+            max_retries=MAX_RETRIES,
+            timeout=REQUEST_TIMEOUT,
+            http_client=_get_shared_http_client()
+        )
+
+        # Async clients are bound to the event loop that created them,
+        # so we keep one per running loop (see _get_async_client)
+        self._async_clients = weakref.WeakKeyDictionary()
+
+        # Throttling: a semaphore caps concurrent async calls (one per
+        # loop, like the clients); the rate limiter is shared by every
+        # call, sync or async, from any thread
+        self.max_concurrency = max_concurrency or DEFAULT_MAX_CONCURRENCY
+        self._async_semaphores = weakref.WeakKeyDictionary()
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=rpm or DEFAULT_RPM,
+            tokens_per_minute=tpm or DEFAULT_TPM
+        )
 
         # Default model (fast and cost-effective)
         self.default_model = "gpt-4o-mini"
 
+        # Exact-match cache for low-temperature calls (see _response_cache_key)
+        self.response_cache = TTLCache(ttl_seconds=RESPONSE_CACHE_TTL_SECONDS, max_entries=512)
+
+        # Similarity cache for callers that opt in (see complete())
+        self.semantic_cache = SemanticCache(
+            threshold=SEMANTIC_CACHE_THRESHOLD,
+            ttl_seconds=SEMANTIC_CACHE_TTL_SECONDS,
+            max_entries=512
+        )
+
         logger.info("LLM Client initialized successfully")
 
     def complete(
@@ -91,7 +213,8 @@ class LLMClient:
         system_message: Optional[str] = None,
         temperature: float = 0.2,
         max_tokens: int = 1000,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        semantic_cache_key: Optional[str] = None
     ) -> str:
         """
         Get a text completion from the LLM.
@@ -102,6 +225,10 @@ class LLMClient:
             temperature: Randomness (0.0 = deterministic, 1.0 = creative)
             max_tokens: Maximum response length
             model: Model to use (defaults to gpt-4o-mini)
+            semantic_cache_key: Opt-in semantic caching. Pass the part of
+                the prompt that users rephrase (e.g. the question). If an
+                earlier call had the same rest of the prompt and a very
+                similar key, its answer is returned without an LLM call.
 
         Returns:
             The LLM's response as a string
@@ -114,14 +241,25 @@ class LLMClient:
             )
             print(response)  # "ESG stands for Environmental, Social, and Governance..."
         """
-        # Build messages
-        messages = []
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-        messages.append({"role": "user", "content": prompt})
+        messages = self.build_messages(prompt, system_message)
+
+        # Near-deterministic calls: reuse an identical earlier answer
+        cache_key = self._response_cache_key(
+            model or self.default_model, messages, temperature, max_tokens, None
+        )
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("LLM response cache hit")
+                return cached
+
+        cached, semantic_slot = self._semantic_lookup(prompt, system_message, model, semantic_cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            # Call OpenAI API
+            # Wait for our share of the rate limit, then call OpenAI API
+            self.rate_limiter.acquire(self._estimate_tokens(messages, max_tokens))
             response = self.client.chat.completions.create(
                 model=model or self.default_model,
                 messages=messages,
@@ -130,19 +268,97 @@ class LLMClient:
             )
 
             # Extract and return the response text
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
+            if cache_key and content:
+                self.response_cache.set(cache_key, content)
+            if semantic_slot and content:
+                self.semantic_cache.add(*semantic_slot, content)
+            return content
+
+        except Exception:
+            logger.exception("LLM completion error")
+            raise
+
+    def stream(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.2,
+        max_tokens: int = 1000,
+        model: Optional[str] = None,
+        semantic_cache_key: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream a text completion from the LLM, chunk by chunk.
+
+        Same as complete() but yields text as it is generated, so a chat
+        UI can show the first words after a fraction of a second instead
+        of waiting for the whole answer. Cached answers are yielded in
+        one piece.
+
+        Args:
+            prompt: The prompt/question to send to the LLM
+            system_message: Optional system message to set AI behavior
+            temperature: Randomness (0.0 = deterministic, 1.0 = creative)
+            max_tokens: Maximum response length
+            model: Model to use (defaults to gpt-4o-mini)
+            semantic_cache_key: Opt-in semantic caching (see complete())
+
+        Yields:
+            Pieces of the response text
+
+        Example:
+            answer = st.write_stream(client.stream("How does Tesla handle emissions?"))
+        """
+        messages = self.build_messages(prompt, system_message)
+
+        cache_key = self._response_cache_key(
+            model or self.default_model, messages, temperature, max_tokens, None
+        )
+        cached = self.response_cache.get(cache_key) if cache_key else None
+        semantic_slot = None
+        if cached is None:
+            cached, semantic_slot = self._semantic_lookup(prompt, system_message, model, semantic_cache_key)
+        if cached is not None:
+            yield cached
+            return
 
-        except Exception as e:
-            logger.error(f"LLM completion error: {str(e)}")
+        try:
+            # Call OpenAI API, streaming the output
+            self.rate_limiter.acquire(self._estimate_tokens(messages, max_tokens))
+            stream = self.client.chat.completions.create(
+                model=model or self.default_model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+
+            pieces = []
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    pieces.append(chunk.choices[0].delta.content)
+                    yield pieces[-1]
+
+        except Exception:
+            logger.exception("LLM streaming error")
             raise
 
+        # Finished normally: cache the full answer like complete() does
+        content = "".join(pieces)
+        if cache_key and content:
+            self.response_cache.set(cache_key, content)
+        if semantic_slot and content:
+            self.semantic_cache.add(*semantic_slot, content)
+
     def complete_json(
         self,
         prompt: str,
         system_message: Optional[str] = None,
         temperature: float = 0.2,
         max_tokens: int = 2000,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        schema: Optional[Dict] = None
     ) -> str:
         """
         Get a JSON completion from the LLM.
@@ -156,6 +372,8 @@ class LLMClient:
             temperature: Randomness (0.0 = deterministic, 1.0 = creative)
             max_tokens: Maximum response length
             model: Model to use (defaults to gpt-4o-mini)
+            schema: Optional JSON Schema ({"name", "strict", "schema"}) the
+                answer must follow (structured outputs, see _json_response_format)
 
         Returns:
             The LLM's response as a JSON string
@@ -167,32 +385,716 @@ class LLMClient:
             )
             data = json.loads(response)  # Parse the JSON
         """
-        # Build messages
-        messages = []
-        if system_message:
-            messages.append({"role": "system", "content": system_message})
-        messages.append({"role": "user", "content": prompt})
+        messages = self.build_messages(prompt, system_message)
+        return self.complete_json_messages(messages, temperature, max_tokens, model, schema)
+
+    def complete_json_messages(
+        self,
+        messages: List[Dict],
+        temperature: float = 0.2,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        schema: Optional[Dict] = None
+    ) -> str:
+        """
+        Same as complete_json(), but takes the chat messages directly.
+
+        Callers with a fixed system message can pass a prebuilt message
+        list (e.g. a module-level system message dict) instead of having
+        it rebuilt on every call.
+
+        Args:
+            messages: Chat messages ([{"role": ..., "content": ...}, ...])
+            temperature: Randomness (0.0 = deterministic, 1.0 = creative)
+            max_tokens: Maximum response length
+            model: Model to use (defaults to gpt-4o-mini)
+            schema: Optional JSON Schema the answer must follow
+
+        Returns:
+            The LLM's response as a JSON string
+
+        Example:
+            response = client.complete_json_messages([
+                {"role": "system", "content": "You are a JSON extractor"},
+                {"role": "user", "content": "Extract metrics from: ..."}
+            ])
+        """
+        response_format = self._json_response_format(schema)
+
+        # Near-deterministic calls: reuse an identical earlier answer
+        cache_key = self._response_cache_key(
+            model or self.default_model, messages, temperature, max_tokens, response_format
+        )
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("LLM response cache hit")
+                return cached
 
         try:
-            # Call OpenAI API with JSON mode
+            # Wait for our share of the rate limit, then call OpenAI API with JSON mode
+            self.rate_limiter.acquire(self._estimate_tokens(messages, max_tokens))
             response = self.client.chat.completions.create(
                 model=model or self.default_model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
-                response_format={"type": "json_object"}  # Force JSON output
+                response_format=response_format  # Force JSON output
             )
 
+            self._log_cache_usage(response)
+
+            # Extract and return the JSON response
+            content = response.choices[0].message.content
+            if cache_key and content:
+                self.response_cache.set(cache_key, content)
+            return content
+
+        except Exception:
+            logger.exception("LLM JSON completion error")
+            raise
+
+    def stream_json(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.2,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        schema: Optional[Dict] = None
+    ) -> Iterator[str]:
+        """
+        Stream a JSON completion from the LLM, chunk by chunk.
+
+        Same as complete_json() but yields the text as it is generated,
+        so callers can start processing before the response is finished.
+        Pair with llm.json_stream.iter_json_array_items() to get parsed
+        items incrementally.
+
+        Args:
+            prompt: The prompt/question to send to the LLM
+            system_message: Optional system message
+            temperature: Randomness (0.0 = deterministic, 1.0 = creative)
+            max_tokens: Maximum response length
+            model: Model to use (defaults to gpt-4o-mini)
+            schema: Optional JSON Schema ({"name", "strict", "schema"}) the
+                answer must follow (structured outputs, see _json_response_format)
+
+        Yields:
+            Pieces of the JSON response text
+
+        Example:
+            for chunk in client.stream_json("Extract metrics from: ..."):
+                print(chunk, end="")
+        """
+        messages = self.build_messages(prompt, system_message)
+
+        try:
+            # Call OpenAI API with JSON mode, streaming the output
+            self.rate_limiter.acquire(self._estimate_tokens(messages, max_tokens))
+            stream = self.client.chat.completions.create(
+                model=model or self.default_model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format=self._json_response_format(schema),  # Force JSON output
+                stream=True
+            )
+
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception:
+            logger.exception("LLM JSON streaming error")
+            raise
+
+    def embed(self, text: str, model: str = "text-embedding-3-small") -> List[float]:
+        """
+        Get an embedding vector for a piece of text.
+
+        Embeddings turn text into numbers so we can measure how similar
+        two texts are (used by the semantic cache in llm/cache.py).
+
+        Args:
+            text: Text to embed
+            model: Embedding model (small = cheap and fast)
+
+        Returns:
+            Embedding vector as a list of floats
+
+        Example:
+            vector = client.embed("Tesla reduced emissions by 40%")
+            print(len(vector))  # 1536
+        """
+        try:
+            response = self.client.embeddings.create(model=model, input=text)
+            return response.data[0].embedding
+
+        except Exception:
+            logger.exception("LLM embedding error")
+            raise
+
+    def submit_batch(
+        self,
+        requests: List[Dict],
+        model: Optional[str] = None
+    ) -> str:
+        """
+        Submit chat completions as an offline job via the OpenAI Batch API.
+
+        For bulk work that nobody is waiting on (e.g. re-scoring many
+        companies) batch jobs cost ~50% less than live calls and don't
+        count against the per-minute rate limits. They finish within 24
+        hours, so never use this for interactive paths (chat, RAG).
+
+        Args:
+            requests: One dict per call with "custom_id" and "prompt", plus
+                optional "system_message", "temperature", "max_tokens"
+                and "response_format" (same meaning as in complete())
+            model: Model to use (defaults to gpt-4o-mini)
+
+        Returns:
+            Batch ID to pass to poll_batch() / wait_for_batch() / collect_batch()
+
+        Example:
+            batch_id = client.submit_batch([
+                {"custom_id": "tesla", "prompt": "Summarize ..."},
+                {"custom_id": "apple", "prompt": "Summarize ..."}
+            ])
+        """
+        # STEP 1: Write one JSONL request line per call
+        lines = []
+        for request in requests:
+            body = {
+                "model": model or self.default_model,
+                "messages": self.build_messages(request['prompt'], request.get('system_message')),
+                "temperature": request.get('temperature', 0.2),
+                "max_tokens": request.get('max_tokens', 1000),
+            }
+            if request.get('response_format'):
+                body["response_format"] = request['response_format']
+
+            lines.append(orjson.dumps({
+                "custom_id": request['custom_id'],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }))
+
+        # STEP 2: Upload the request file
+        batch_file = self.client.files.create(
+            file=("batch.jsonl", io.BytesIO(b"\n".join(lines))),
+            purpose="batch"
+        )
+
+        # STEP 3: Create the batch job
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+
+        logger.info("📦 Submitted batch %s with %d requests", batch.id, len(lines))
+        return batch.id
+
+    def poll_batch(self, batch_id: str) -> str:
+        """
+        Check the status of a batch job.
+
+        Args:
+            batch_id: ID returned by submit_batch()
+
+        Returns:
+            Status string ("validating", "in_progress", "completed", "failed", ...)
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        logger.info("📦 Batch %s: %s", batch_id, batch.status)
+        return batch.status
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 60,
+        timeout: Optional[float] = None
+    ) -> str:
+        """
+        Block until a batch job has finished (successfully or not).
+
+        Args:
+            batch_id: ID returned by submit_batch()
+            poll_interval: Seconds between status checks
+            timeout: Give up after this many seconds (None = wait up to the
+                batch's own 24h window)
+
+        Returns:
+            Final status ("completed", "failed", "expired" or "cancelled")
+
+        Raises:
+            TimeoutError: If the batch is still running after `timeout`
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            status = self.poll_batch(batch_id)
+            if status in BATCH_FINAL_STATUSES:
+                return status
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Batch {batch_id} still {status} after {timeout}s")
+            time.sleep(poll_interval)
+
+    def collect_batch(self, batch_id: str) -> Dict[str, Optional[str]]:
+        """
+        Download the answers of a finished batch job.
+
+        Args:
+            batch_id: ID returned by submit_batch()
+
+        Returns:
+            {custom_id: response text, or None if that request failed}
+
+        Raises:
+            ValueError: If the batch has no output yet
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if not batch.output_file_id:
+            raise ValueError(f"Batch {batch_id} has no output (status: {batch.status})")
+
+        results = {}
+        output = self.client.files.content(batch.output_file_id).text
+
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+
+            record = orjson.loads(line)
+            try:
+                body = record['response']['body']
+                results[record['custom_id']] = body['choices'][0]['message']['content']
+            except (KeyError, TypeError, IndexError):
+                logger.error("Batch request %s failed: %s", record.get('custom_id'), record.get('error'))
+                results[record['custom_id']] = None
+
+        logger.info("📦 Collected %d batch results", len(results))
+        return results
+
+    @staticmethod
+    def build_messages(prompt: str, system_message: Optional[str] = None) -> List[Dict]:
+        """
+        Build the chat message list for a prompt.
+
+        Args:
+            prompt: The user message
+            system_message: Optional system message (goes first)
+
+        Returns:
+            [{"role": "system", ...}, {"role": "user", ...}]
+        """
+        if system_message:
+            return [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": prompt}
+            ]
+        return [{"role": "user", "content": prompt}]
+
+    @staticmethod
+    def _json_response_format(schema: Optional[Dict]) -> Dict:
+        """
+        Build the response_format for a JSON call.
+
+        Plain JSON mode only promises *some* valid JSON. With a strict
+        JSON Schema (structured outputs) the model's decoding is
+        constrained to the schema, so the answer always parses and has
+        exactly the expected fields - no parse-failure fallbacks.
+
+        Args:
+            schema: {"name": ..., "strict": True, "schema": {...}} or None
+
+        Returns:
+            response_format value for chat.completions.create()
+        """
+        if schema:
+            return {"type": "json_schema", "json_schema": schema}
+        return {"type": "json_object"}
+
+    def _log_cache_usage(self, response) -> None:
+        """
+        Log how many prompt tokens were served from OpenAI's prompt cache.
+
+        Useful for checking that prompts keep a stable prefix: a high
+        cached_tokens count means cheaper and faster calls.
+
+        Args:
+            response: ChatCompletion returned by the OpenAI SDK
+        """
+        usage = getattr(response, 'usage', None)
+        details = getattr(usage, 'prompt_tokens_details', None)
+        if usage and details:
+            logger.debug(
+                "Prompt tokens: %d (cached: %d)",
+                usage.prompt_tokens, details.cached_tokens
+            )
+
+    def _response_cache_key(
+        self,
+        model: str,
+        messages: List[dict],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[dict]
+    ) -> Optional[str]:
+        """
+        Build the response cache key for a request, if it may be cached.
+
+        Args:
+            model: Model name
+            messages: Chat messages sent to the model
+            temperature: Sampling temperature
+            max_tokens: Maximum response length
+            response_format: e.g. {"type": "json_object"}, or None
+
+        Returns:
+            SHA-256 key, or None when temperature is too high to cache
+        """
+        if temperature > CACHEABLE_MAX_TEMPERATURE:
+            return None
+
+        payload = orjson.dumps({
+            'model': model,
+            'messages': messages,
+            'temperature': temperature,
+            'max_tokens': max_tokens,
+            'response_format': response_format
+        }, option=orjson.OPT_SORT_KEYS)
+        return make_cache_key(payload.decode('utf-8'))
+
+    def _semantic_lookup(
+        self,
+        prompt: str,
+        system_message: Optional[str],
+        model: Optional[str],
+        semantic_cache_key: Optional[str]
+    ) -> Tuple[Optional[str], Optional[Tuple[str, List[float]]]]:
+        """
+        Look up a semantically similar earlier answer.
+
+        Only answers for the exact same context are candidates: the
+        namespace is the whole request except the rephrasable part.
+
+        Args:
+            prompt: Full user prompt
+            system_message: System message (part of the namespace)
+            model: Model name (part of the namespace)
+            semantic_cache_key: Rephrasable part of the prompt, or None
+
+        Returns:
+            Tuple of (cached answer or None, (namespace, embedding) to
+            store the new answer under, or None if caching is off/failed)
+        """
+        if not semantic_cache_key:
+            return None, None
+
+        namespace = make_cache_key(
+            model or self.default_model,
+            system_message or "",
+            prompt.replace(semantic_cache_key, "")
+        )
+        try:
+            embedding = self.embed(semantic_cache_key)
+        except Exception:
+            return None, None  # Embedding failed: just skip the cache
+
+        cached = self.semantic_cache.lookup(namespace, embedding)
+        if cached is not None:
+            logger.info("✓ Semantic cache hit")
+        return cached, (namespace, embedding)
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """
+        Get the AsyncOpenAI client for the currently running event loop.
+
+        httpx connections can't be shared between event loops, so each
+        asyncio.run() gets its own client. All coroutines inside that
+        loop share it (and its connection pool).
+
+        Returns:
+            AsyncOpenAI client bound to the running loop
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+
+        if client is None:
+            client = AsyncOpenAI(
+                api_key=self.api_key,
+                max_retries=MAX_RETRIES,
+                timeout=REQUEST_TIMEOUT,
+                http_client=DefaultAsyncHttpxClient(
+                    limits=HTTP_POOL_LIMITS,
+                    timeout=REQUEST_TIMEOUT,
+                    http2=HTTP2_ENABLED
+                )
+            )
+            self._async_clients[loop] = client
+
+        return client
+
+    def _get_async_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the concurrency semaphore for the currently running event loop.
+
+        Returns:
+            Semaphore allowing max_concurrency calls at once
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._async_semaphores[loop] = semaphore
+
+        return semaphore
+
+    @staticmethod
+    def _estimate_tokens(messages: List[dict], max_tokens: int) -> int:
+        """
+        Estimate the tokens a request counts against the TPM limit.
+
+        OpenAI counts the prompt plus max_tokens. A quick character-based
+        estimate is plenty for throttling.
+        """
+        prompt_chars = sum(len(message['content']) for message in messages)
+        return prompt_chars // CHARS_PER_TOKEN + max_tokens
+
+    async def aclose(self) -> None:
+        """
+        Close the AsyncOpenAI client of the running event loop.
+
+        Call this at the end of an asyncio.run() block so pooled
+        connections are shut down cleanly before the loop closes.
+
+        Example:
+            async def main():
+                try:
+                    await client.acomplete_json(...)
+                finally:
+                    await client.aclose()
+        """
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    async def acomplete(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.2,
+        max_tokens: int = 1000,
+        model: Optional[str] = None
+    ) -> str:
+        """
+        Async version of complete().
+
+        Args:
+            prompt: The prompt/question to send to the LLM
+            system_message: Optional system message to set AI behavior
+            temperature: Randomness (0.0 = deterministic, 1.0 = creative)
+            max_tokens: Maximum response length
+            model: Model to use (defaults to gpt-4o-mini)
+
+        Returns:
+            The LLM's response as a string
+
+        Example:
+            answers = await asyncio.gather(
+                client.acomplete("How does Tesla handle emissions?"),
+                client.acomplete("How does Apple handle emissions?")
+            )
+        """
+        messages = self.build_messages(prompt, system_message)
+
+        # Near-deterministic calls: reuse an identical earlier answer
+        cache_key = self._response_cache_key(
+            model or self.default_model, messages, temperature, max_tokens, None
+        )
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("LLM response cache hit")
+                return cached
+
+        try:
+            # Call OpenAI API (non-blocking, throttled)
+            async with self._get_async_semaphore():
+                await self.rate_limiter.aacquire(self._estimate_tokens(messages, max_tokens))
+                response = await self._get_async_client().chat.completions.create(
+                    model=model or self.default_model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+
+            # Extract and return the response text
+            content = response.choices[0].message.content
+            if cache_key and content:
+                self.response_cache.set(cache_key, content)
+            return content
+
+        except Exception:
+            logger.exception("LLM async completion error")
+            raise
+
+    async def astream(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.2,
+        max_tokens: int = 1000,
+        model: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Async version of stream().
+
+        Args:
+            prompt: The prompt/question to send to the LLM
+            system_message: Optional system message to set AI behavior
+            temperature: Randomness (0.0 = deterministic, 1.0 = creative)
+            max_tokens: Maximum response length
+            model: Model to use (defaults to gpt-4o-mini)
+
+        Yields:
+            Pieces of the response text
+
+        Example:
+            async for piece in client.astream("How does Tesla handle emissions?"):
+                print(piece, end="")
+        """
+        messages = self.build_messages(prompt, system_message)
+
+        try:
+            # Call OpenAI API, streaming the output (non-blocking, throttled)
+            async with self._get_async_semaphore():
+                await self.rate_limiter.aacquire(self._estimate_tokens(messages, max_tokens))
+                stream = await self._get_async_client().chat.completions.create(
+                    model=model or self.default_model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True
+                )
+
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+        except Exception:
+            logger.exception("LLM async streaming error")
+            raise
+
+    async def acomplete_json(
+        self,
+        prompt: str,
+        system_message: Optional[str] = None,
+        temperature: float = 0.2,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        schema: Optional[Dict] = None
+    ) -> str:
+        """
+        Async version of complete_json().
+
+        Lets callers run many JSON completions concurrently with
+        asyncio.gather() instead of waiting for each one in turn.
+
+        Args:
+            prompt: The prompt/question to send to the LLM
+            system_message: Optional system message
+            temperature: Randomness (0.0 = deterministic, 1.0 = creative)
+            max_tokens: Maximum response length
+            model: Model to use (defaults to gpt-4o-mini)
+            schema: Optional JSON Schema ({"name", "strict", "schema"}) the
+                answer must follow (structured outputs, see _json_response_format)
+
+        Returns:
+            The LLM's response as a JSON string
+
+        Example:
+            responses = await asyncio.gather(
+                client.acomplete_json("Extract metrics for Tesla..."),
+                client.acomplete_json("Extract metrics for Apple...")
+            )
+        """
+        messages = self.build_messages(prompt, system_message)
+        return await self.acomplete_json_messages(messages, temperature, max_tokens, model, schema)
+
+    async def acomplete_json_messages(
+        self,
+        messages: List[Dict],
+        temperature: float = 0.2,
+        max_tokens: int = 2000,
+        model: Optional[str] = None,
+        schema: Optional[Dict] = None
+    ) -> str:
+        """
+        Same as acomplete_json(), but takes the chat messages directly.
+
+        Callers with a fixed system message can pass a prebuilt message
+        list (e.g. a module-level system message dict) instead of having
+        it rebuilt on every call.
+
+        Args:
+            messages: Chat messages ([{"role": ..., "content": ...}, ...])
+            temperature: Randomness (0.0 = deterministic, 1.0 = creative)
+            max_tokens: Maximum response length
+            model: Model to use (defaults to gpt-4o-mini)
+            schema: Optional JSON Schema the answer must follow
+
+        Returns:
+            The LLM's response as a JSON string
+
+        Example:
+            response = await client.acomplete_json_messages([
+                {"role": "user", "content": "Extract metrics for Tesla..."}
+            ])
+        """
+        response_format = self._json_response_format(schema)
+
+        # Near-deterministic calls: reuse an identical earlier answer
+        cache_key = self._response_cache_key(
+            model or self.default_model, messages, temperature, max_tokens, response_format
+        )
+        if cache_key:
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("LLM response cache hit")
+                return cached
+
+        try:
+            # Call OpenAI API with JSON mode (non-blocking, throttled)
+            async with self._get_async_semaphore():
+                await self.rate_limiter.aacquire(self._estimate_tokens(messages, max_tokens))
+                response = await self._get_async_client().chat.completions.create(
+                    model=model or self.default_model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    response_format=response_format  # Force JSON output
+                )
+
+            self._log_cache_usage(response)
+
             # Extract and return the JSON response
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
+            if cache_key and content:
+                self.response_cache.set(cache_key, content)
+            return content
 
-        except Exception as e:
-            logger.error(f"LLM JSON completion error: {str(e)}")
+        except Exception:
+            logger.exception("LLM async JSON completion error")
             raise
 
 
 # Singleton instance for easy importing
 _client_instance = None
+_client_lock = threading.Lock()
 
 
 def get_llm_client() -> LLMClient:
@@ -213,7 +1115,11 @@ def get_llm_client() -> LLMClient:
     """
     global _client_instance
 
+    # Double-checked locking: the lock is only taken until the instance
+    # exists, and two threads can't both create one
     if _client_instance is None:
-        _client_instance = LLMClient()
+        with _client_lock:
+            if _client_instance is None:
+                _client_instance = LLMClient()
 
     return _client_instance
@@ -0,0 +1,200 @@
+"""
+Incremental JSON Parsing for Streamed LLM Responses
+
+When we stream a JSON completion, the text arrives in small chunks.
+Waiting for the whole document before calling json.loads() means the
+user sees nothing until the very last token. This module lets us pull
+complete items out of a JSON array *as soon as each one is finished*.
+
+Student Guide:
+--------------
+How it works (a tiny stack-based scanner):
+- We walk the text character by character, remembering which
+  brackets are open ({ or [) and whether we're inside a string.
+- When we enter the array we care about (e.g. "metrics": [ ... ]),
+  every object that opens directly inside it is recorded.
+- When that object's closing } arrives, we json.loads() just that
+  slice and hand the item back immediately.
+
+The same scanner also *repairs* broken responses: if the model's JSON
+is cut off or malformed halfway, salvage_json_array() still returns
+every item that was complete before the damage.
+
+Usage:
+    from llm.json_stream import iter_json_array_items
+
+    chunks = client.stream_json(prompt)
+    for metric in iter_json_array_items(chunks, "metrics"):
+        print(metric)  # Available before the full response arrives!
+"""
+
+import json
+import orjson
+from typing import Any, Iterable, Iterator, List, Optional
+
+
+class JsonArrayStreamParser:
+    """
+    Extracts complete objects from an array field of a streamed JSON object.
+
+    Example usage:
+        parser = JsonArrayStreamParser("metrics")
+        for chunk in ['{"metrics": [{"a": 1}, ', '{"a": 2}]}']:
+            for item in parser.feed(chunk):
+                print(item)  # {'a': 1} then {'a': 2}
+        parser.close()  # Raises if the document was cut off
+    """
+
+    def __init__(self, key: str):
+        """
+        Initialize the parser.
+
+        Args:
+            key: Name of the top-level field holding the array (e.g. "metrics")
+        """
+        self.key = key
+        self._buf = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_key: Optional[str] = None
+        self._array_depth: Optional[int] = None
+        self._item_start: Optional[int] = None
+        self._done = False
+
+    def feed(self, chunk: str) -> List[Any]:
+        """
+        Add more text and return any array items that are now complete.
+
+        Args:
+            chunk: Next piece of the streamed JSON text
+
+        Returns:
+            List of newly completed items (may be empty)
+
+        Raises:
+            json.JSONDecodeError: If the brackets don't match up
+        """
+        self._buf += chunk
+        items = []
+        buf = self._buf
+
+        for i in range(self._pos, len(buf)):
+            c = buf[i]
+
+            # Inside a string: only watch for escapes and the closing quote
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if len(self._stack) == 1:
+                        # Remember the latest top-level key
+                        self._last_key = buf[self._string_start + 1:i]
+                continue
+
+            if c == '"':
+                self._in_string = True
+                self._string_start = i
+
+            elif c in '{[':
+                # Entering the target array?
+                if (c == '[' and len(self._stack) == 1
+                        and self._last_key == self.key and self._array_depth is None):
+                    self._array_depth = len(self._stack) + 1
+                # Object directly inside the target array = a new item
+                elif c == '{' and self._array_depth == len(self._stack):
+                    self._item_start = i
+                self._stack.append(c)
+
+            elif c in '}]':
+                expected = '{' if c == '}' else '['
+                if not self._stack or self._stack.pop() != expected:
+                    raise json.JSONDecodeError(f"Unexpected '{c}'", buf, i)
+
+                depth = len(self._stack)
+                if c == '}' and self._item_start is not None and depth == self._array_depth:
+                    # Item finished: parse just this slice
+                    # (a malformed item, e.g. trailing comma, is skipped)
+                    try:
+                        items.append(orjson.loads(buf[self._item_start:i + 1]))
+                    except orjson.JSONDecodeError:
+                        pass
+                    self._item_start = None
+                elif c == ']' and self._array_depth is not None and depth == self._array_depth - 1:
+                    self._array_depth = None
+
+                if not self._stack:
+                    self._done = True
+
+        self._pos = len(buf)
+        return items
+
+    def close(self) -> str:
+        """
+        Finish parsing and check the document was complete.
+
+        Returns:
+            The full text received
+
+        Raises:
+            json.JSONDecodeError: If the stream ended mid-document
+        """
+        if not self._done:
+            raise json.JSONDecodeError("Incomplete JSON document", self._buf, len(self._buf))
+        return self._buf
+
+
+def iter_json_array_items(chunks: Iterable[str], key: str) -> Iterator[Any]:
+    """
+    Yield items of a JSON array field while the JSON is still streaming in.
+
+    Args:
+        chunks: Iterable of text chunks (e.g. from LLMClient.stream_json)
+        key: Name of the top-level field holding the array
+
+    Yields:
+        Each completed array item, as soon as it is available
+
+    Raises:
+        json.JSONDecodeError: If the JSON is malformed or cut off
+
+    Example:
+        for metric in iter_json_array_items(chunks, "metrics"):
+            process(metric)
+    """
+    parser = JsonArrayStreamParser(key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
+
+
+def salvage_json_array(text: str, key: str) -> List[Any]:
+    """
+    Recover the complete items of a JSON array field from broken JSON.
+
+    Used when json.loads() fails (e.g. the response hit max_tokens and
+    was cut off): instead of throwing the whole answer away, we keep
+    every array item that was fully written before the problem.
+
+    Args:
+        text: The (possibly truncated or malformed) JSON text
+        key: Name of the top-level field holding the array
+
+    Returns:
+        List of items recovered (empty if nothing could be salvaged)
+
+    Example:
+        salvage_json_array('{"metrics": [{"a": 1}, {"a": 2', "metrics")
+        # Returns: [{'a': 1}]
+    """
+    try:
+        return JsonArrayStreamParser(key).feed(text)
+    except json.JSONDecodeError as e:
+        # Re-scan only the text before the syntax error: everything
+        # complete up to that point is still good
+        return JsonArrayStreamParser(key).feed(text[:e.pos])
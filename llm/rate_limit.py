@@ -0,0 +1,128 @@
+"""
+Token-Bucket Rate Limiting
+
+APIs limit how fast we may call them (e.g. OpenAI: requests per minute
+and tokens per minute). If we just fire requests as fast as possible we
+get "429 Too Many Requests" errors and waste seconds on retries. It is
+much cheaper to wait a little *before* sending.
+
+Student Guide:
+--------------
+How a token bucket works:
+- Imagine a bucket that holds up to N tokens and refills at N per minute
+- Every request takes tokens out of the bucket
+- If the bucket doesn't have enough, we wait until it has refilled
+
+We track two buckets at once: one for requests and one for (LLM) tokens.
+A request waits until BOTH have room.
+
+Reservations are taken immediately (the bucket may go negative), so when
+many requests arrive together each one gets its own place in line
+instead of all waking up at the same moment.
+
+Usage:
+    from llm.rate_limit import RateLimiter
+
+    limiter = RateLimiter(requests_per_minute=500, tokens_per_minute=200_000)
+    limiter.acquire(tokens=1500)         # blocking (threads)
+    await limiter.aacquire(tokens=1500)  # non-blocking (asyncio)
+"""
+
+import time
+import asyncio
+import threading
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Thread-safe request + token budget shared by all callers.
+
+    Example usage:
+        limiter = RateLimiter(requests_per_minute=60)
+        for url in urls:
+            limiter.acquire()  # at most one call per second on average
+            fetch(url)
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: Optional[float] = None):
+        """
+        Initialize the limiter with full buckets.
+
+        Args:
+            requests_per_minute: Maximum request rate
+            tokens_per_minute: Maximum token rate (None = don't track tokens)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self._requests_available = float(requests_per_minute)
+        self._tokens_available = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """
+        Take one request (and `tokens` tokens) from the buckets.
+
+        Args:
+            tokens: Tokens the request will use
+
+        Returns:
+            Seconds the caller has to wait before sending
+        """
+        with self._lock:
+            # Refill both buckets for the time that passed (up to capacity)
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._last_refill = now
+
+            self._requests_available = min(
+                self.requests_per_minute,
+                self._requests_available + elapsed * self.requests_per_minute / 60
+            )
+            self._requests_available -= 1
+            wait = max(0.0, -self._requests_available * 60 / self.requests_per_minute)
+
+            if self.tokens_per_minute:
+                # A single request larger than the whole budget can still
+                # go through once the bucket is full
+                tokens = min(tokens, self.tokens_per_minute)
+                self._tokens_available = min(
+                    self.tokens_per_minute,
+                    self._tokens_available + elapsed * self.tokens_per_minute / 60
+                )
+                self._tokens_available -= tokens
+                wait = max(wait, -self._tokens_available * 60 / self.tokens_per_minute)
+
+            return wait
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Wait (blocking) until a request may be sent.
+
+        Args:
+            tokens: Tokens the request will use
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: int = 0) -> float:
+        """
+        Wait (without blocking the event loop) until a request may be sent.
+
+        Args:
+            tokens: Tokens the request will use
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
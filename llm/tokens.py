@@ -0,0 +1,148 @@
+"""
+Token Counting and Truncation Helpers
+
+LLMs don't read characters, they read *tokens* (word pieces). Prices,
+context limits and latency are all measured in tokens, so when we need
+to fit text into a budget we should count tokens, not characters.
+
+Student Guide:
+--------------
+- 1 token ≈ 4 characters of English text (but varies a lot!)
+- Tables, URLs and non-English text use more tokens per character
+- tiktoken is OpenAI's tokenizer: it gives the exact count the API uses
+
+The tokenizer is loaded lazily on first use (it downloads/loads a
+vocabulary file). If tiktoken isn't installed, we fall back to the
+"4 characters per token" estimate so the app still works.
+
+Usage:
+    from llm.tokens import count_tokens, truncate_to_tokens
+
+    count_tokens("Tesla reduced emissions by 40%")  # → 8
+    short = truncate_to_tokens(long_text, 1200)
+"""
+
+import re
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Model whose tokenizer we use (matches LLMClient.default_model)
+TOKENIZER_MODEL = "gpt-4o-mini"
+
+# Rough fallback when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+_encoding = None
+_encoding_loaded = False
+_encoding_lock = threading.Lock()
+
+
+def _get_encoding():
+    """
+    Load the tiktoken encoding once (thread-safe).
+
+    Returns:
+        tiktoken Encoding, or None if tiktoken is not available
+    """
+    global _encoding, _encoding_loaded
+
+    if not _encoding_loaded:
+        with _encoding_lock:
+            if not _encoding_loaded:
+                try:
+                    import tiktoken
+                    _encoding = tiktoken.encoding_for_model(TOKENIZER_MODEL)
+                except Exception as e:
+                    logger.warning(f"⚠️ tiktoken unavailable, estimating tokens from length: {str(e)}")
+                    _encoding = None
+                _encoding_loaded = True
+
+    return _encoding
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count how many tokens a text uses.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Number of tokens (estimated if tiktoken is missing)
+
+    Example:
+        count_tokens("Hello world")  # → 2
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, at_sentence: bool = False) -> str:
+    """
+    Cut a text down to at most max_tokens tokens.
+
+    Unlike text[:n], this never splits a token in half and keeps the
+    budget predictable whatever the language or formatting.
+
+    Args:
+        text: Text to shorten
+        max_tokens: Maximum number of tokens to keep
+        at_sentence: If the text is cut, also drop the trailing partial
+            sentence (a half sentence is noise for the LLM)
+
+    Returns:
+        The text itself if it fits, otherwise its first max_tokens tokens
+
+    Example:
+        preview = truncate_to_tokens(report, 1200, at_sentence=True)
+    """
+    if max_tokens <= 0:
+        return ""
+
+    encoding = _get_encoding()
+    if encoding is None:
+        if len(text) <= max_tokens * CHARS_PER_TOKEN:
+            return text
+        truncated = text[:max_tokens * CHARS_PER_TOKEN]
+    else:
+        # Cheap early exit: even at 1 char/token the text can't exceed the budget
+        if len(text) <= max_tokens:
+            return text
+
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        truncated = encoding.decode(tokens[:max_tokens])
+
+    return _trim_partial_sentence(truncated) if at_sentence else truncated
+
+
+# End of a sentence or line: ". ", "!\n", "?" followed by whitespace, or a newline
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)|\n")
+
+# Never drop more than this share of the kept text to reach a sentence end
+MAX_SENTENCE_TRIM = 0.2
+
+
+def _trim_partial_sentence(text: str) -> str:
+    """
+    Cut a truncated text back to its last complete sentence or line.
+
+    Args:
+        text: Text that was cut somewhere in the middle
+
+    Returns:
+        Text ending at a sentence boundary, or unchanged if the last
+        boundary is too far back (e.g. one very long table row)
+    """
+    last_end = None
+    for last_end in _SENTENCE_END_RE.finditer(text):
+        pass
+
+    if last_end is None or last_end.end() < len(text) * (1 - MAX_SENTENCE_TRIM):
+        return text
+    return text[:last_end.end()]
@@ -19,17 +19,220 @@ This pattern is used in:
 - Any conversational interface
 """
 
-import json
+import re
+import asyncio
+import threading
 import logging
-from typing import Dict, List
+import orjson
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from llm.client import get_llm_client
 from prompts.intent_prompts import (
     create_intent_classification_prompt,
-    INTENT_CLASSIFICATION_SYSTEM_MESSAGE
+    create_batch_intent_classification_prompt,
+    create_intent_repair_prompt,
+    INTENT_NAMES,
+    INTENT_CLASSIFICATION_SYSTEM_MESSAGE_DICT,
+    INTENT_RESPONSE_SCHEMA,
+    BATCH_INTENT_RESPONSE_SCHEMA
 )
 
 logger = logging.getLogger(__name__)
 
+# Messages per batched classification call (larger batches get less accurate)
+CLASSIFY_BATCH_SIZE = 16
+
+# Response budget per message in a batch (one result object is ~60 tokens)
+BATCH_TOKENS_PER_MESSAGE = 150
+
+# Trivial commands that never need an LLM to understand.
+# Keys are normalized messages (lowercase, no punctuation, single spaces).
+EXACT_INTENTS = {
+    'clear': 'clear',
+    'clear all': 'clear',
+    'clear everything': 'clear',
+    'reset': 'clear',
+    'delete all': 'clear',
+    'delete everything': 'clear',
+    'list': 'list_companies',
+    'list companies': 'list_companies',
+    'list all companies': 'list_companies',
+    'show companies': 'list_companies',
+    'show all companies': 'list_companies',
+    'companies': 'list_companies',
+    'download': 'download',
+    'download report': 'download',
+    # Debugging aid (not offered to the LLM classifier)
+    'cache stats': 'cache_stats',
+}
+
+_NORMALIZE_RE = re.compile(r"[^\w\s]")
+
+
+def _normalize_message(user_message: str) -> str:
+    """Lowercase a message and strip punctuation/extra spaces for matching."""
+    return ' '.join(_NORMALIZE_RE.sub(' ', user_message.lower()).split())
+
+
+def match_exact_intent(user_message: str) -> Optional[Dict]:
+    """
+    Classify trivial commands ("clear", "list companies") without an LLM.
+
+    Args:
+        user_message: What the user typed
+
+    Returns:
+        Intent dictionary if the message is a known command, else None
+
+    Example:
+        match_exact_intent("List companies!")
+        # Returns: {"intent": "list_companies", "companies": [], ...}
+        match_exact_intent("Compare Tesla and Apple")  # → None
+    """
+    intent = EXACT_INTENTS.get(_normalize_message(user_message))
+    if intent is None:
+        return None
+
+    return {
+        'intent': intent,
+        'companies': [],
+        'question': None,
+        'needs_analysis': []
+    }
+
+
+# Local rules for common single-purpose prompts ("show tesla score").
+# Each pattern runs on the normalized message and captures the company
+# part as group "c". A rule only counts as a match when that part is made
+# up entirely of already-analyzed companies - anything else (unknown
+# names, questions, extra words) goes to the LLM.
+INTENT_RULES = [
+    ('compare', re.compile(r"^compare (?P<c>.+)$")),
+    ('compare', re.compile(r"^(?P<c>.+ (?:vs|versus) .+)$")),
+    ('show_score', re.compile(r"^(?:show |get |what is |whats )?(?:the )?(?:overall )?score (?:for|of) (?P<c>.+)$")),
+    ('show_score', re.compile(r"^(?:show |get |what is |whats )?(?P<c>.+?)(?: s)? (?:overall )?score$")),
+    ('show_details', re.compile(r"^(?:show )?details (?:for|of|on) (?P<c>.+)$")),
+    ('show_details', re.compile(r"^(?:show )?(?P<c>.+?)(?: s)? details$")),
+    ('show_strengths_weaknesses', re.compile(r"^(?:show )?(?:strengths and weaknesses|pros and cons) (?:for|of) (?P<c>.+)$")),
+    ('show_strengths_weaknesses', re.compile(r"^(?:show )?(?P<c>.+?)(?: s)? (?:strengths and weaknesses|pros and cons)$")),
+    ('delete', re.compile(r"^(?:delete|remove) (?P<c>.+)$")),
+    ('download', re.compile(r"^download (?:a )?(?:pdf )?(?:report )?(?:for |of |on )?(?P<c>.+)$")),
+] + [
+    (f'show_{category}', re.compile(rf"^(?:show )?(?P<c>.+?)(?: s)? {category}(?: score)?$"))
+    for category in ('environmental', 'social', 'governance')
+] + [
+    # Just a company name ("Tesla") → show its score. Must stay last.
+    ('show_score', re.compile(r"^(?P<c>.+)$")),
+]
+
+# Intents whose handlers only show companies[0]: a rule match naming
+# several companies ("tesla and apple") is left to the LLM instead,
+# which can tell that the user probably wants a comparison
+SINGLE_COMPANY_INTENTS = frozenset({
+    'show_score', 'show_details', 'show_strengths_weaknesses',
+    'show_environmental', 'show_social', 'show_governance'
+})
+
+# Words allowed between company names ("tesla and apple", "tesla vs apple")
+_COMPANY_JOINERS = r"(?:and|vs|versus|with|to)"
+
+
+@lru_cache(maxsize=8)
+def _company_patterns(analyzed_companies: Tuple[str, ...]):
+    """
+    Compile the company-name regexes once per analyzed-companies list.
+
+    The list only changes when a company is analyzed or deleted, so the
+    compiled patterns are reused across messages.
+
+    Returns:
+        Tuple of (normalized name → original name, pattern for a whole
+        span of names, pattern for a single name), or (known, None, None)
+        if there are no companies
+    """
+    known = {_normalize_message(name): name for name in analyzed_companies}
+    known.pop('', None)
+    if not known:
+        return known, None, None
+
+    # Longest names first so "apple music" wins over "apple"
+    names = '|'.join(re.escape(n) for n in sorted(known, key=len, reverse=True))
+    name_re = rf"(?:{names})"
+    span_re = re.compile(rf"{name_re}(?: (?:{_COMPANY_JOINERS} )?{name_re})*")
+    return known, span_re, re.compile(rf"(?<!\S){name_re}(?!\S)")
+
+
+def _resolve_companies(span: str, analyzed_companies: List[str]) -> Optional[List[str]]:
+    """
+    Split a normalized text span into known company names.
+
+    Args:
+        span: Part of the message that should name companies
+        analyzed_companies: Companies already in the database
+
+    Returns:
+        Original company names in mention order, or None if the span
+        contains anything that isn't an analyzed company
+
+    Example:
+        _resolve_companies("tesla and apple", ["Apple", "Tesla"])
+        # Returns: ["Tesla", "Apple"]
+    """
+    known, span_re, name_re = _company_patterns(tuple(analyzed_companies))
+    if span_re is None or not span_re.fullmatch(span):
+        return None
+
+    companies = []
+    for match in name_re.finditer(span):
+        name = known[match.group(0)]
+        if name not in companies:
+            companies.append(name)
+    return companies
+
+
+def match_rule_intent(user_message: str, analyzed_companies: List[str]) -> Optional[Dict]:
+    """
+    Classify common prompts about analyzed companies with local rules.
+
+    This runs in microseconds instead of the seconds an LLM round-trip
+    takes. It is deliberately strict: when in doubt it returns None and
+    the LLM decides.
+
+    Args:
+        user_message: What the user typed
+        analyzed_companies: Companies already in the database
+
+    Returns:
+        Intent dictionary for a confident match, else None
+
+    Example:
+        match_rule_intent("Show Tesla's score", ["Tesla"])
+        # Returns: {"intent": "show_score", "companies": ["Tesla"], ...}
+        match_rule_intent("How does Tesla handle emissions?", ["Tesla"])  # → None
+        match_rule_intent("Tesla and Apple", ["Apple", "Tesla"])  # → None (LLM decides)
+    """
+    message = _normalize_message(user_message)
+
+    for intent, pattern in INTENT_RULES:
+        match = pattern.match(message)
+        if not match:
+            continue
+
+        companies = _resolve_companies(match.group('c'), analyzed_companies)
+        if not companies or (intent == 'compare' and len(companies) < 2):
+            continue
+        if intent in SINGLE_COMPANY_INTENTS and len(companies) != 1:
+            continue
+
+        return {
+            'intent': intent,
+            'companies': companies,
+            'question': None,
+            'needs_analysis': []
+        }
+
+    return None
+
 
 class IntentClassifier:
     """
@@ -57,13 +260,18 @@ class IntentClassifier:
         """Initialize the intent classifier with an LLM client."""
         self.llm_client = get_llm_client()
 
-    def classify(self, user_message: str, analyzed_companies: List[str]) -> Dict:
+    def classify(self, user_message: str, analyzed_companies: List[str],
+                 use_fallback: bool = True) -> Dict:
         """
         Classify a user message into an intent with extracted information.
 
         Args:
             user_message: What the user typed
             analyzed_companies: List of companies already in the database
+            use_fallback: If the LLM fails (error, or still invalid after
+                          the repair attempt), return fallback() instead of
+                          raising. Callers that cache the result pass False
+                          so a failure isn't cached.
 
         Returns:
             Dictionary with:
@@ -84,7 +292,11 @@ class IntentClassifier:
             #     "needs_analysis": ["Tesla"]
             # }
         """
-        logger.info(f"Classifying intent for: {user_message[:50]}...")
+        logger.info("Classifying intent for: %s...", user_message[:50])
+
+        fast = self._fast_path(user_message, analyzed_companies)
+        if fast is not None:
+            return fast
 
         try:
             # Create the classification prompt
@@ -94,41 +306,257 @@ class IntentClassifier:
             )
 
             # Call LLM to classify
-            response = self.llm_client.complete_json(
-                prompt=prompt,
-                system_message=INTENT_CLASSIFICATION_SYSTEM_MESSAGE,
-                temperature=0.1  # Low temperature for consistent classification
+            response = self.llm_client.complete_json_messages(
+                [INTENT_CLASSIFICATION_SYSTEM_MESSAGE_DICT, {"role": "user", "content": prompt}],
+                temperature=0.1,  # Low temperature for consistent classification
+                schema=INTENT_RESPONSE_SCHEMA  # Answer always matches the intent schema
             )
 
-            # Parse JSON response
-            intent_data = json.loads(response)
+            intent_data, error = self._parse_response(response)
+            if intent_data is None:
+                # One repair attempt: cheaper than acting on a wrong intent
+                response = self.llm_client.complete_json_messages(
+                    self._repair_messages(user_message, response, error),
+                    temperature=0.0,
+                    schema=INTENT_RESPONSE_SCHEMA
+                )
+                intent_data, error = self._parse_response(response)
 
-            logger.info(f"✓ Classified as: {intent_data.get('intent')}")
+            if intent_data is None:
+                raise ValueError(f"Invalid intent classification: {error}")
             return intent_data
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse intent JSON: {str(e)}")
-            # Fallback: treat as simple analysis
-            return {
-                'intent': 'analyze',
-                'companies': [user_message.strip()],
-                'question': None,
-                'needs_analysis': [user_message.strip()]
-            }
-
-        except Exception as e:
-            logger.error(f"Intent classification error: {str(e)}")
-            # Fallback
-            return {
-                'intent': 'analyze',
-                'companies': [user_message.strip()],
-                'question': None,
-                'needs_analysis': [user_message.strip()]
-            }
+        except Exception:
+            logger.exception("Intent classification error")
+            if not use_fallback:
+                raise
+            return self.fallback(user_message)
+
+    async def aclassify(self, user_message: str, analyzed_companies: List[str]) -> Dict:
+        """
+        Async version of classify().
+
+        Args:
+            user_message: What the user typed
+            analyzed_companies: List of companies already in the database
+
+        Returns:
+            Same dictionary as classify()
+
+        Example:
+            results = await asyncio.gather(
+                classifier.aclassify("Compare Tesla and Apple", []),
+                classifier.aclassify("Show Tesla score", [])
+            )
+        """
+        logger.info("Classifying intent for: %s...", user_message[:50])
+
+        fast = self._fast_path(user_message, analyzed_companies)
+        if fast is not None:
+            return fast
+
+        try:
+            prompt = create_intent_classification_prompt(
+                user_message,
+                analyzed_companies
+            )
+
+            # Same call as classify(), but doesn't block the event loop
+            response = await self.llm_client.acomplete_json_messages(
+                [INTENT_CLASSIFICATION_SYSTEM_MESSAGE_DICT, {"role": "user", "content": prompt}],
+                temperature=0.1,
+                schema=INTENT_RESPONSE_SCHEMA
+            )
+
+            intent_data, error = self._parse_response(response)
+            if intent_data is None:
+                response = await self.llm_client.acomplete_json_messages(
+                    self._repair_messages(user_message, response, error),
+                    temperature=0.0,
+                    schema=INTENT_RESPONSE_SCHEMA
+                )
+                intent_data, error = self._parse_response(response)
+
+            return intent_data if intent_data is not None else self.fallback(user_message)
+
+        except Exception:
+            logger.exception("Intent classification error")
+            return self.fallback(user_message)
+
+    def classify_many(self, user_messages: List[str], analyzed_companies: List[str]) -> List[Dict]:
+        """
+        Classify several messages concurrently.
+
+        Total time is roughly that of the slowest LLM call instead of the
+        sum of all of them (useful for replaying chat history or tests).
+
+        Args:
+            user_messages: Messages to classify
+            analyzed_companies: List of companies already in the database
+
+        Returns:
+            One intent dictionary per message, in the same order
+
+        Example:
+            results = classifier.classify_many(
+                ["Compare Tesla and Apple", "How does Tesla handle emissions?"],
+                ["Tesla"]
+            )
+        """
+        async def run_all() -> List[Dict]:
+            try:
+                return await asyncio.gather(*(
+                    self.aclassify(message, analyzed_companies)
+                    for message in user_messages
+                ))
+            finally:
+                await self.llm_client.aclose()
+
+        return asyncio.run(run_all())
+
+    def classify_batch(self, user_messages: List[str], analyzed_companies: List[str]) -> List[Dict]:
+        """
+        Classify several messages with as few LLM calls as possible.
+
+        Messages the fast path can handle never reach the LLM; the rest
+        are sent CLASSIFY_BATCH_SIZE at a time in a single prompt. Any
+        result that comes back missing or malformed is re-classified on
+        its own with classify().
+
+        Args:
+            user_messages: Messages to classify
+            analyzed_companies: List of companies already in the database
+
+        Returns:
+            One intent dictionary per message, in the same order
+
+        Example:
+            results = classifier.classify_batch(
+                ["Compare Tesla and Apple", "clear", "How green is Apple?"],
+                ["Tesla"]
+            )
+        """
+        results: List[Optional[Dict]] = [
+            self._fast_path(message, analyzed_companies) for message in user_messages
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        for start in range(0, len(pending), CLASSIFY_BATCH_SIZE):
+            chunk = pending[start:start + CLASSIFY_BATCH_SIZE]
+            batch = self._classify_chunk([user_messages[i] for i in chunk], analyzed_companies)
+            for i, intent_data in zip(chunk, batch):
+                results[i] = intent_data
+
+        # Per-message retry for anything the batch didn't answer properly
+        for i, result in enumerate(results):
+            if result is None:
+                results[i] = self.classify(user_messages[i], analyzed_companies)
+
+        return results
+
+    def _classify_chunk(self, user_messages: List[str], analyzed_companies: List[str]) -> List[Optional[Dict]]:
+        """
+        Classify up to CLASSIFY_BATCH_SIZE messages in one LLM call.
+
+        Args:
+            user_messages: Messages to classify
+            analyzed_companies: List of companies already in the database
+
+        Returns:
+            Intent dictionary per message, or None where the LLM's answer
+            was missing or malformed
+        """
+        results: List[Optional[Dict]] = [None] * len(user_messages)
+
+        try:
+            prompt = create_batch_intent_classification_prompt(user_messages, analyzed_companies)
+            response = self.llm_client.complete_json_messages(
+                [INTENT_CLASSIFICATION_SYSTEM_MESSAGE_DICT, {"role": "user", "content": prompt}],
+                temperature=0.1,
+                max_tokens=BATCH_TOKENS_PER_MESSAGE * len(user_messages),
+                schema=BATCH_INTENT_RESPONSE_SCHEMA
+            )
+            items = orjson.loads(response).get('results', [])
+        except Exception:
+            logger.exception("Batch intent classification error")
+            return results
+
+        for position, item in enumerate(items):
+            if not isinstance(item, dict) or 'intent' not in item:
+                continue
+            # Prefer the message number the LLM echoed; fall back to order
+            index = item.pop('index', position + 1)
+            if isinstance(index, int) and 1 <= index <= len(user_messages) and results[index - 1] is None:
+                results[index - 1] = item
+
+        logger.info("✓ Batch classified %d/%d messages", sum(r is not None for r in results), len(user_messages))
+        return results
+
+    def _fast_path(self, user_message: str, analyzed_companies: List[str]) -> Optional[Dict]:
+        """Classify without the LLM if the message is an exact command or matches a rule."""
+        # Fast path: exact commands don't need an LLM round-trip
+        exact = match_exact_intent(user_message)
+        if exact is not None:
+            logger.info("✓ Exact match: %s", exact['intent'])
+            return exact
+
+        # Fast path: common prompts about companies we already know
+        rule = match_rule_intent(user_message, analyzed_companies)
+        if rule is not None:
+            logger.info("✓ Rule match: %s %s", rule['intent'], rule['companies'])
+            return rule
+
+        return None
+
+    def _parse_response(self, response: Optional[str]) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Parse and check the LLM's JSON answer.
+
+        Args:
+            response: JSON string returned by the LLM
+
+        Returns:
+            Tuple of (intent dictionary, None) if the answer is valid, or
+            (None, reason) if it isn't
+        """
+        try:
+            # orjson: C parser, several times faster than json for small payloads
+            intent_data = orjson.loads(response or "")
+        except orjson.JSONDecodeError as e:
+            logger.warning("Failed to parse intent JSON: %s", e)
+            return None, f"invalid JSON: {e}"
+
+        if not isinstance(intent_data, dict) or intent_data.get('intent') not in INTENT_NAMES:
+            logger.warning("Unknown intent in LLM answer: %.100s", response)
+            return None, f"intent must be one of: {', '.join(INTENT_NAMES)}"
+
+        logger.info("✓ Classified as: %s", intent_data['intent'])
+        return intent_data, None
+
+    @staticmethod
+    def _repair_messages(user_message: str, response: Optional[str], error: str) -> List[Dict]:
+        """Messages for the one-shot repair call after an invalid answer."""
+        prompt = create_intent_repair_prompt(user_message, response or "", error)
+        return [INTENT_CLASSIFICATION_SYSTEM_MESSAGE_DICT, {"role": "user", "content": prompt}]
+
+    @staticmethod
+    def fallback(user_message: str) -> Dict:
+        """
+        Treat a message we couldn't classify as a simple analysis request.
+
+        Last resort only (LLM unreachable, or still invalid after repair).
+        """
+        return {
+            'intent': 'analyze',
+            'companies': [user_message.strip()],
+            'question': None,
+            'needs_analysis': [user_message.strip()]
+        }
 
 
 # Singleton instance
 _classifier_instance = None
+_classifier_lock = threading.Lock()
 
 
 def get_intent_classifier() -> IntentClassifier:
@@ -146,7 +574,11 @@ def get_intent_classifier() -> IntentClassifier:
     """
     global _classifier_instance
 
+    # Double-checked locking: the lock is only taken until the instance
+    # exists, and two threads can't both create one
     if _classifier_instance is None:
-        _classifier_instance = IntentClassifier()
+        with _classifier_lock:
+            if _classifier_instance is None:
+                _classifier_instance = IntentClassifier()
 
     return _classifier_instance
@@ -42,45 +42,27 @@ METRICS_SCHEMA = {
     ]
 }
 
+# Compact table form of METRICS_SCHEMA for the prompt.
+# A flat "category|metric_name" table tokenizes far better than nested
+# bullet lists or JSON (fewer input tokens on every extraction call).
+# Built once at import time.
+_SCHEMA_TABLE = "category|metric_name\n" + "\n".join(
+    f"{category}|{metric}"
+    for category, metrics in METRICS_SCHEMA.items()
+    for metric in metrics
+)
 
-def create_metrics_extraction_prompt(company_name: str, content: str) -> str:
-    """
-    Create the prompt for extracting sustainability metrics from research content.
 
-    This prompt asks the AI to:
-    1. Read the company research content
-    2. Find information about specific sustainability practices
-    3. Score each practice (0-100)
-    4. Assess confidence in each score (0-1)
-    5. Return structured JSON output
-
-    Args:
-        company_name: Name of the company being analyzed
-        content: Combined research content from all sources (max 15,000 chars)
-
-    Returns:
-        Complete prompt string ready to send to the LLM
-
-    Example:
-        prompt = create_metrics_extraction_prompt("Tesla", research_content)
-        response = llm_client.complete(prompt)
-    """
-    # Build formatted list of all metrics
-    metrics_list = []
-    for category, metrics in METRICS_SCHEMA.items():
-        metrics_list.append(f"\n{category}:")
-        for metric in metrics:
-            metrics_list.append(f"  - {metric}")
-
-    # Create the full prompt with clear instructions
-    prompt = f"""You are an expert sustainability analyst. Analyze the following content about {company_name} and extract sustainability metrics.
+# Everything before the company name is identical for every company, so
+# it is assembled once here instead of on every call.
+_EXTRACTION_PROMPT_HEAD = """You are an expert sustainability analyst. Analyze the research content about the company named at the end of this message and extract sustainability metrics.
 
 For each metric, provide:
 1. A score from 0-100 (where 0 = very poor, 50 = average, 100 = excellent)
 2. A confidence score from 0-1 (where 0 = no data/uncertain, 1 = very confident)
 
-Extract metrics for these categories and specific metrics:
-{''.join(metrics_list)}
+Extract exactly these metrics (one row per metric):
+""" + _SCHEMA_TABLE + """
 
 SCORING GUIDELINES:
 -------------------
@@ -102,23 +84,92 @@ CONFIDENCE GUIDELINES:
 IMPORTANT: If a metric has no information in the content, use score=50 (neutral) and confidence=0.1 (very uncertain).
 
 Return ONLY a JSON object with this exact structure (no extra text):
-{{
+{
     "metrics": [
-        {{
+        {
             "category": "Environmental|Social|Governance",
-            "metric_name": "exact metric name from list above",
+            "metric_name": "exact metric name from table above",
             "value": 0-100,
             "confidence": 0-1,
             "evidence": "brief quote or summary of evidence"
-        }}
+        }
     ]
-}}
+}
 
-RESEARCH CONTENT TO ANALYZE:
-{content[:15000]}
-"""
-    return prompt
+---BEGIN COMPANY---
+Company: """
+
+
+def create_metrics_extraction_prompt(company_name: str, content: str) -> str:
+    """
+    Create the prompt for extracting sustainability metrics from research content.
+
+    This prompt asks the AI to:
+    1. Read the company research content
+    2. Find information about specific sustainability practices
+    3. Score each practice (0-100)
+    4. Assess confidence in each score (0-1)
+    5. Return structured JSON output
+
+    Prompt layout matters for cost: OpenAI caches the longest identical
+    prefix of a prompt (1024+ tokens). All static instructions come FIRST
+    and the company name + content come LAST, so every extraction call
+    shares the same cacheable prefix.
+
+    Args:
+        company_name: Name of the company being analyzed
+        content: Combined research content from all sources (already
+                 truncated to a token budget by the extractor)
+
+    Returns:
+        Complete prompt string ready to send to the LLM
+
+    Example:
+        prompt = create_metrics_extraction_prompt("Tesla", research_content)
+        response = llm_client.complete(prompt)
+    """
+    # Static instructions first (precomputed), dynamic content last
+    return "".join((
+        _EXTRACTION_PROMPT_HEAD, company_name,
+        "\n\nRESEARCH CONTENT TO ANALYZE:\n", content, "\n"
+    ))
 
 
 # System message for metrics extraction
+# Keep this a plain constant (no timestamps or interpolated values) so it is
+# byte-identical across calls and stays part of the cached prompt prefix.
 METRICS_EXTRACTION_SYSTEM_MESSAGE = "You are a sustainability metrics extraction expert. Return only valid JSON."
+
+
+# JSON Schema of the extraction answer (structured outputs, strict mode).
+# Categories and metric names are enums, so the model can only return
+# metrics we know how to score.
+METRICS_RESPONSE_SCHEMA = {
+    "name": "metrics_extraction",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "metrics": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "category": {"type": "string", "enum": list(METRICS_SCHEMA)},
+                        "metric_name": {
+                            "type": "string",
+                            "enum": [metric for metrics in METRICS_SCHEMA.values() for metric in metrics]
+                        },
+                        "value": {"type": "number"},
+                        "confidence": {"type": "number"},
+                        "evidence": {"type": "string"}
+                    },
+                    "required": ["category", "metric_name", "value", "confidence", "evidence"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["metrics"],
+        "additionalProperties": False
+    }
+}
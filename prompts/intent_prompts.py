@@ -16,44 +16,24 @@ This is crucial for building conversational interfaces!
 
 from typing import List
 
-
-def create_intent_classification_prompt(user_message: str, analyzed_companies: List[str]) -> str:
-    """
-    Create prompt for classifying user intent from their message.
-
-    The LLM analyzes the user's message and determines:
-    1. What they want to do (intent)
-    2. Which companies they're asking about
-    3. Whether it's a question (for RAG)
-    4. Which companies need analysis first
-
-    Args:
-        user_message: What the user typed in the chat
-        analyzed_companies: List of companies already in the database
-
-    Returns:
-        Prompt string that will return structured JSON with intent classification
-
-    Example:
-        analyzed = ["Tesla", "Apple"]
-        prompt = create_intent_classification_prompt("Compare Tesla and Microsoft", analyzed)
-        # Will classify as "compare" intent with needs_analysis=["Microsoft"]
-    """
-    analyzed_companies_str = ', '.join(analyzed_companies) if analyzed_companies else "None"
-
-    prompt = f"""You are an intent classifier for a sustainability analysis chatbot.
-Analyze the user's message and return a JSON object with the following structure:
-
-{{
-    "intent": "one of: analyze, compare, rag_question, show_score, show_details, show_environmental, show_social, show_governance, show_strengths_weaknesses, list_companies, delete, clear, download",
+# Every intent the chatbot knows (the app routes each one to a handler)
+INTENT_NAMES = (
+    "analyze", "compare", "rag_question", "show_score", "show_details",
+    "show_environmental", "show_social", "show_governance",
+    "show_strengths_weaknesses", "list_companies", "delete", "clear", "download"
+)
+
+# Static parts of the intent prompts, built once at import. Only the
+# analyzed-company list and the user message change between calls, so a
+# prompt is just a join of these constants and those two values.
+_INTENT_STRUCTURE = """{
+    "intent": "one of: """ + ", ".join(INTENT_NAMES) + """",
     "companies": ["list of company names mentioned"],
     "question": "the actual question if it's a rag_question, otherwise null",
     "needs_analysis": ["list of companies that need to be analyzed first"]
-}}
-
-Already analyzed companies in database: {analyzed_companies_str}
+}"""
 
-INTENT DEFINITIONS:
+_INTENT_GUIDE = """INTENT DEFINITIONS:
 -------------------
 - "analyze": User wants to analyze a new company's sustainability
 - "compare": User wants to compare 2+ companies
@@ -75,33 +55,201 @@ These companies need to be analyzed before we can answer the user's query.
 EXAMPLES:
 ---------
 User: "Tesla"
-Output: {{"intent": "analyze", "companies": ["Tesla"], "question": null, "needs_analysis": ["Tesla"]}}
+Output: {"intent": "analyze", "companies": ["Tesla"], "question": null, "needs_analysis": ["Tesla"]}
 
 User: "Compare Tesla and Apple"
-Output: {{"intent": "compare", "companies": ["Tesla", "Apple"], "question": null, "needs_analysis": ["Tesla", "Apple"] if not analyzed}}
+Output: {"intent": "compare", "companies": ["Tesla", "Apple"], "question": null, "needs_analysis": ["Tesla", "Apple"] if not analyzed}
 
 User: "How does Tesla handle carbon emissions?"
-Output: {{"intent": "rag_question", "companies": ["Tesla"], "question": "How does Tesla handle carbon emissions?", "needs_analysis": ["Tesla"] if not analyzed}}
+Output: {"intent": "rag_question", "companies": ["Tesla"], "question": "How does Tesla handle carbon emissions?", "needs_analysis": ["Tesla"] if not analyzed}
 
 User: "What's Apple's environmental score?"
-Output: {{"intent": "show_environmental", "companies": ["Apple"], "question": null, "needs_analysis": ["Apple"] if not analyzed}}
+Output: {"intent": "show_environmental", "companies": ["Apple"], "question": null, "needs_analysis": ["Apple"] if not analyzed}
 
 User: "Delete Tesla"
-Output: {{"intent": "delete", "companies": ["Tesla"], "question": null, "needs_analysis": []}}
+Output: {"intent": "delete", "companies": ["Tesla"], "question": null, "needs_analysis": []}
 
 User: "Download Tesla report"
-Output: {{"intent": "download", "companies": ["Tesla"], "question": null, "needs_analysis": ["Tesla"] if not analyzed}}
+Output: {"intent": "download", "companies": ["Tesla"], "question": null, "needs_analysis": ["Tesla"] if not analyzed}
 
 User: "Download comparison report for Tesla and Apple"
-Output: {{"intent": "download", "companies": ["Tesla", "Apple"], "question": null, "needs_analysis": [] if both analyzed}}
+Output: {"intent": "download", "companies": ["Tesla", "Apple"], "question": null, "needs_analysis": [] if both analyzed}"""
+
+# Everything up to the company list is identical on every call, so it
+# forms one long prefix that OpenAI's prompt cache can reuse.
+_INTENT_PROMPT_HEAD = (
+    "You are an intent classifier for a sustainability analysis chatbot.\n"
+    "Analyze the user's message and return a JSON object with the following structure:\n\n"
+    + _INTENT_STRUCTURE
+    + "\n\n" + _INTENT_GUIDE
+    + "\n\nAlready analyzed companies in database: "
+)
+_INTENT_PROMPT_MID = "\n\nUSER MESSAGE TO CLASSIFY:\n"
+_INTENT_PROMPT_TAIL = "\n\nReturn ONLY valid JSON, no other text.\n"
+
+
+def create_intent_classification_prompt(user_message: str, analyzed_companies: List[str]) -> str:
+    """
+    Create prompt for classifying user intent from their message.
 
-USER MESSAGE TO CLASSIFY:
-{user_message}
+    The LLM analyzes the user's message and determines:
+    1. What they want to do (intent)
+    2. Which companies they're asking about
+    3. Whether it's a question (for RAG)
+    4. Which companies need analysis first
+
+    Args:
+        user_message: What the user typed in the chat
+        analyzed_companies: List of companies already in the database
+
+    Returns:
+        Prompt string that will return structured JSON with intent classification
+
+    Example:
+        analyzed = ["Tesla", "Apple"]
+        prompt = create_intent_classification_prompt("Compare Tesla and Microsoft", analyzed)
+        # Will classify as "compare" intent with needs_analysis=["Microsoft"]
+    """
+    analyzed_companies_str = ', '.join(analyzed_companies) if analyzed_companies else "None"
+
+    return "".join((
+        _INTENT_PROMPT_HEAD, analyzed_companies_str,
+        _INTENT_PROMPT_MID, user_message,
+        _INTENT_PROMPT_TAIL
+    ))
+
+
+def create_batch_intent_classification_prompt(user_messages: List[str], analyzed_companies: List[str]) -> str:
+    """
+    Create one prompt that classifies several user messages at once.
+
+    Sending N messages in one call saves N-1 round-trips and stays far
+    below the requests-per-minute limit (useful for replaying chat
+    history or test suites). Messages are numbered so each result can
+    be matched to its message.
+
+    Args:
+        user_messages: Messages to classify (best with 4-16 of them)
+        analyzed_companies: List of companies already in the database
+
+    Returns:
+        Prompt string that will return {"results": [...]} with one
+        classification object per message, in order
+
+    Example:
+        prompt = create_batch_intent_classification_prompt(
+            ["Compare Tesla and Apple", "Delete Tesla"], ["Tesla"]
+        )
+    """
+    analyzed_companies_str = ', '.join(analyzed_companies) if analyzed_companies else "None"
+    numbered_messages = "\n".join(
+        f"{number}. {message}" for number, message in enumerate(user_messages, 1)
+    )
+
+    prompt = f"""You are an intent classifier for a sustainability analysis chatbot.
+Classify EACH of the {len(user_messages)} numbered user messages below independently.
+Return a JSON object {{"results": [...]}} whose "results" array has exactly {len(user_messages)} objects,
+one per message and in the same order, each with "index" (the message number) and this structure:
+
+{_INTENT_STRUCTURE}
+
+{_INTENT_GUIDE}
+
+Already analyzed companies in database: {analyzed_companies_str}
+
+USER MESSAGES TO CLASSIFY:
+{numbered_messages}
 
 Return ONLY valid JSON, no other text.
 """
     return prompt
 
 
+# Static head of the repair prompt (see create_intent_repair_prompt)
+_INTENT_REPAIR_HEAD = (
+    "Your previous answer to an intent classification request was not valid.\n"
+    "Return ONLY a JSON object with this structure:\n\n"
+    + _INTENT_STRUCTURE
+    + "\n\nUser message that was classified:\n"
+)
+
+
+def create_intent_repair_prompt(user_message: str, bad_response: str, error: str) -> str:
+    """
+    Create a short prompt asking the LLM to fix an invalid classification.
+
+    Much shorter than the full classification prompt: the LLM already
+    did the hard part, it only has to return it in the right shape.
+
+    Args:
+        user_message: What the user typed
+        bad_response: The invalid answer (only the first 500 characters are sent)
+        error: Why it was rejected (e.g. the JSON parser's message)
+
+    Returns:
+        Prompt string that will return the corrected JSON
+
+    Example:
+        prompt = create_intent_repair_prompt("Compare Tesla and Apple", '{"intent": "compare"', "unexpected end of data")
+    """
+    return "".join((
+        _INTENT_REPAIR_HEAD, user_message,
+        "\n\nInvalid answer:\n", bad_response[:500],
+        "\n\nError: ", error, "\n"
+    ))
+
+
 # System message for intent classification
 INTENT_CLASSIFICATION_SYSTEM_MESSAGE = "You are an intent classification expert for a sustainability chatbot. Return only valid JSON."
+
+# Same as a ready-made chat message, so callers don't rebuild it per call:
+# messages = [INTENT_CLASSIFICATION_SYSTEM_MESSAGE_DICT, {"role": "user", "content": prompt}]
+INTENT_CLASSIFICATION_SYSTEM_MESSAGE_DICT = {"role": "system", "content": INTENT_CLASSIFICATION_SYSTEM_MESSAGE}
+
+
+# JSON Schema of one classification (structured outputs, strict mode).
+# Strict mode needs every field listed in "required" and no extra fields;
+# "question" may be null.
+_INTENT_RESULT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "intent": {"type": "string", "enum": list(INTENT_NAMES)},
+        "companies": {"type": "array", "items": {"type": "string"}},
+        "question": {"type": ["string", "null"]},
+        "needs_analysis": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["intent", "companies", "question", "needs_analysis"],
+    "additionalProperties": False
+}
+
+# Response format for LLMClient.complete_json(..., schema=...)
+INTENT_RESPONSE_SCHEMA = {
+    "name": "intent_classification",
+    "strict": True,
+    "schema": _INTENT_RESULT_SCHEMA
+}
+
+# Same for batched classification: {"results": [{"index": 1, ...}, ...]}
+BATCH_INTENT_RESPONSE_SCHEMA = {
+    "name": "batch_intent_classification",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "index": {"type": "integer"},
+                        **_INTENT_RESULT_SCHEMA["properties"]
+                    },
+                    "required": ["index"] + _INTENT_RESULT_SCHEMA["required"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["results"],
+        "additionalProperties": False
+    }
+}
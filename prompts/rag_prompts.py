@@ -18,13 +18,24 @@ This ensures:
 - More accurate than pure LLM answers
 """
 
+# All instructions live in the (constant) system message, so every RAG
+# call starts with the same bytes and OpenAI's prompt-prefix cache can
+# reuse them. The user message only carries the per-question data.
+RAG_SYSTEM_MESSAGE = (
+    "You are a sustainability analyst answering questions about a company "
+    "based on research content. Answer the question based on the research "
+    "content provided. Be specific and cite information from the sources "
+    "when possible. If the information isn't in the sources, say so clearly."
+)
+
 
 def create_rag_answer_prompt(company_name: str, question: str, context: str) -> str:
     """
     Create prompt for answering questions using RAG (Retrieval Augmented Generation).
 
-    Takes the user's question and relevant context (scraped content) and asks
-    the AI to answer based ONLY on the provided context.
+    Takes the user's question and relevant context (scraped content). The
+    instructions are in RAG_SYSTEM_MESSAGE, so this prompt is purely the
+    dynamic data: company, research content and question.
 
     Args:
         company_name: Name of the company
@@ -38,29 +49,28 @@ def create_rag_answer_prompt(company_name: str, question: str, context: str) ->
         context = "Tesla reduced emissions by 40%... Gigafactories use 100% renewable energy..."
         question = "How does Tesla handle carbon emissions?"
         prompt = create_rag_answer_prompt("Tesla", question, context)
-        # AI will answer based on the provided context
+        # Send with system_message=RAG_SYSTEM_MESSAGE
     """
-    prompt = f"""Research content about {company_name}:
-
-{context}
-
-Question: {question}
-
-Answer the question based on the research content provided above. Be specific and cite information from the sources when possible. If the information isn't in the sources, say so clearly.
-"""
-    return prompt
+    return "".join((
+        "Company: ", company_name,
+        "\n\nResearch content:\n", context,
+        "\n\nQuestion: ", question, "\n"
+    ))
 
 
 def create_rag_system_message(company_name: str) -> str:
     """
     Create system message for RAG question answering.
 
-    The system message sets the AI's role and behavior.
+    The system message sets the AI's role and behavior. It is the same
+    for every company (the company name is in the user prompt), which
+    keeps it cacheable; prefer RAG_SYSTEM_MESSAGE directly.
 
     Args:
-        company_name: Name of the company being discussed
+        company_name: Name of the company being discussed (unused, kept
+            for backward compatibility)
 
     Returns:
         System message string
     """
-    return f"You are a sustainability analyst. Answer the user's question about {company_name} based on the provided research content. Be specific and cite information from the sources when possible. If the information isn't in the sources, say so."
+    return RAG_SYSTEM_MESSAGE
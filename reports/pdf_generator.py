@@ -21,16 +21,23 @@ Main Functions:
 """
 
 import io
+import os
+import bisect
+import functools
 import logging
+import threading
+import importlib.util
 from datetime import datetime
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import Dict, List, Optional
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, Image
+    PageBreak, Image, Flowable
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
@@ -41,6 +48,206 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ReportLab uses the C helpers from the optional "rl_accel" package when
+# it is installed (string widths and number formatting, which Platypus
+# calls for every word it wraps). Reports work without it, just slower.
+RL_ACCEL_AVAILABLE = importlib.util.find_spec('_rl_accel') is not None
+if not RL_ACCEL_AVAILABLE:
+    logger.warning("⚠️ rl_accel not installed - PDF layout uses the slower pure-Python helpers (pip install rl_accel)")
+
+# Size limits: layout time grows faster than linearly with very large
+# tables and comparisons, so oversized reports are rejected up front
+# (pass force=True to build them anyway)
+MAX_COMPANIES_PER_COMPARISON = 10
+MAX_METRICS_PER_TABLE = 50
+
+# Header row of every metrics table
+METRICS_TABLE_HEADER = ['Metric', 'Value', 'Confidence']
+
+# Table styles never change between reports, so they are built once here
+# and shared by every table (Table.setStyle only reads the commands).
+
+# Single report: category scores table
+_CATEGORY_TABLE_STYLE = TableStyle([
+    # Header row
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#374151")),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+
+    # Data rows
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 11),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor("#f3f4f6")]),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#d1d5db")),
+    ('TOPPADDING', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+])
+
+# Comparison report: overall and category scores tables
+_COMPARISON_TABLE_COMMANDS = [
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#374151")),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor("#f3f4f6")]),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#d1d5db")),
+    ('TOPPADDING', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+]
+_OVERALL_TABLE_STYLE = TableStyle(_COMPARISON_TABLE_COMMANDS + [('FONTSIZE', (0, 0), (-1, 0), 11)])
+_CATEGORY_COMPARISON_TABLE_STYLE = TableStyle(_COMPARISON_TABLE_COMMANDS + [('FONTSIZE', (0, 0), (-1, 0), 10)])
+
+# Metrics tables: everything except the category-colored header row
+_METRICS_TABLE_COMMANDS = [
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor("#f9fafb")]),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor("#e5e7eb")),
+]
+
+# Single report metrics tables pad the header a bit more than the rows
+_SINGLE_METRICS_PADDING = [
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('TOPPADDING', (0, 1), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+]
+_COMPARISON_METRICS_PADDING = [
+    ('TOPPADDING', (0, 0), (-1, -1), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+]
+
+
+@dataclass
+class PreparedCompany:
+    """
+    One company of a comparison report, prepared once before rendering.
+
+    The raw dicts are converted up front (date formatted, metrics grouped
+    by category), so the render steps only read these fields. Slots keep
+    it small (declared by hand: dataclass(slots=True) needs Python 3.10).
+    """
+    __slots__ = ('name', 'research_date_str', 'scores', 'by_category')
+
+    name: str
+    research_date_str: str
+    scores: Dict
+    by_category: Dict[str, List[Dict]]
+
+
+@functools.lru_cache(maxsize=256)
+def _format_date(iso_date: str, fmt: str) -> str:
+    """
+    Format an ISO date string for display (cached).
+
+    The same companies show up in report after report, so each research
+    date is parsed and formatted only once.
+
+    Args:
+        iso_date: Date as stored in the database (ISO 8601)
+        fmt: strftime format
+
+    Returns:
+        Formatted date, e.g. "January 10, 2025"
+    """
+    return datetime.fromisoformat(iso_date).strftime(fmt)
+
+
+def _generated_timestamp() -> str:
+    """Current time as shown in the "Generated:" line of a report."""
+    return datetime.now().strftime("%B %d, %Y at %I:%M %p")
+
+
+@functools.lru_cache(maxsize=None)
+def _metrics_table_style(header_color: colors.Color, comparison: bool) -> TableStyle:
+    """
+    Get the style of a metrics table with a category-colored header.
+
+    There are only three categories, so each style is built once and
+    then reused for every table of every report.
+
+    Args:
+        header_color: Background color of the header row
+        comparison: Use the comparison report's padding
+
+    Returns:
+        Shared TableStyle
+    """
+    padding = _COMPARISON_METRICS_PADDING if comparison else _SINGLE_METRICS_PADDING
+    return TableStyle(
+        [('BACKGROUND', (0, 0), (-1, 0), header_color)] + _METRICS_TABLE_COMMANDS + padding
+    )
+
+
+class ColoredText(Flowable):
+    """
+    One or more lines of plain text in a single font and color.
+
+    Paragraph parses its text as mini-HTML and runs the line breaker,
+    which is wasted work for short fixed labels (cover score, rating,
+    dates, footer). This flowable draws each line directly on the canvas.
+    Use Paragraph for anything that needs wrapping or inline markup.
+
+    Example:
+        story.append(ColoredText(["78.5/100"], 48, score_color, bold=True))
+        story.append(ColoredText(["Line one", "Line two"], 8, colors.grey))
+    """
+
+    def __init__(
+        self,
+        lines: List[str],
+        font_size: float,
+        color: colors.Color,
+        bold: bool = False,
+        centered: bool = True
+    ):
+        """
+        Args:
+            lines: Text lines (not wrapped - keep them short)
+            font_size: Font size in points
+            color: Text color
+            bold: Use Helvetica-Bold instead of Helvetica
+            centered: Center each line (otherwise left-aligned)
+        """
+        super().__init__()
+        self.lines = lines
+        self.font_size = font_size
+        self.color = color
+        self.font_name = 'Helvetica-Bold' if bold else 'Helvetica'
+        self.centered = centered
+        self.leading = font_size * 1.2
+
+    def wrap(self, availWidth, availHeight):
+        """Take the full width and one leading per line."""
+        self.width = availWidth
+        self.height = self.leading * len(self.lines)
+        return self.width, self.height
+
+    def draw(self):
+        """Draw the lines top to bottom."""
+        canvas = self.canv
+        canvas.setFillColor(self.color)
+        canvas.setFont(self.font_name, self.font_size)
+
+        # Baseline sits ~0.2 leading above the bottom of each line box
+        y = self.height - self.leading + (self.leading - self.font_size) + self.font_size * 0.2
+        for line in self.lines:
+            if self.centered:
+                canvas.drawCentredString(self.width / 2, y, line)
+            else:
+                canvas.drawString(0, y, line)
+            y -= self.leading
+
 
 class PDFReportGenerator:
     """
@@ -53,7 +260,7 @@ class PDFReportGenerator:
     - Automatic page breaks and styling
 
     Example usage:
-        generator = PDFReportGenerator()
+        generator = get_pdf_generator()  # shared instance
 
         # Single company report
         pdf_buffer = generator.generate_single_company_report(
@@ -75,26 +282,61 @@ class PDFReportGenerator:
         "Very Poor": colors.HexColor("#dc2626")    # Dark red
     }
 
-    # Category colors
+    # Gray text for dates and footers
+    METADATA_COLOR = colors.HexColor("#6b7280")
+    FOOTER_COLOR = colors.HexColor("#9ca3af")
+
+    # Lower bounds of the ratings: score >= 85 is Excellent, >= 70 Good, ...
+    SCORE_THRESHOLDS = (30, 50, 70, 85)
+    SCORE_LEVELS = ("Very Poor", "Poor", "Fair", "Good", "Excellent")
+
+    # Category colors (also the order categories appear in reports)
     CATEGORY_COLORS = {
         "Environmental": colors.HexColor("#10b981"),
         "Social": colors.HexColor("#3b82f6"),
         "Governance": colors.HexColor("#8b5cf6")
     }
 
+    # Stylesheet shared by all generators (built on first use, see _get_styles)
+    _STYLES = None
+    _styles_lock = threading.Lock()
+
     def __init__(self):
         """Initialize the PDF Report Generator."""
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        self.styles = self._get_styles()
         logger.info("PDF Report Generator initialized")
 
-    def _setup_custom_styles(self):
+    @classmethod
+    def _get_styles(cls) -> StyleSheet1:
+        """
+        Get the stylesheet, building it only once per process.
+
+        Copying ReportLab's sample stylesheet and adding our custom
+        styles takes dozens of object allocations. Styles are never
+        modified while rendering, so every generator (and thread) can
+        share one stylesheet.
+
+        Returns:
+            StyleSheet1 with the sample styles plus our custom ones
+        """
+        if cls._STYLES is None:
+            with cls._styles_lock:
+                if cls._STYLES is None:  # Another thread may have built it
+                    styles = getSampleStyleSheet()
+                    cls._setup_custom_styles(styles)
+                    cls._STYLES = styles
+        return cls._STYLES
+
+    @staticmethod
+    def _setup_custom_styles(styles: StyleSheet1):
         """Create custom paragraph styles for consistent formatting."""
+        if 'CustomTitle' in styles:
+            return  # Already set up
 
         # Title style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CustomTitle',
-            parent=self.styles['Title'],
+            parent=styles['Title'],
             fontSize=24,
             textColor=colors.HexColor("#1f2937"),
             spaceAfter=30,
@@ -102,9 +344,9 @@ class PDFReportGenerator:
         ))
 
         # Company name style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='CompanyName',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=20,
             textColor=colors.HexColor("#059669"),
             spaceAfter=12,
@@ -112,9 +354,9 @@ class PDFReportGenerator:
         ))
 
         # Section heading style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='SectionHeading',
-            parent=self.styles['Heading2'],
+            parent=styles['Heading2'],
             fontSize=16,
             textColor=colors.HexColor("#374151"),
             spaceAfter=12,
@@ -122,9 +364,9 @@ class PDFReportGenerator:
         ))
 
         # Score style
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name='ScoreText',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=14,
             spaceAfter=6
         ))
@@ -133,7 +375,8 @@ class PDFReportGenerator:
         self,
         company: Dict,
         metrics: List[Dict],
-        scores: Dict
+        scores: Dict,
+        force: bool = False
     ) -> io.BytesIO:
         """
         Generate a detailed PDF report for a single company.
@@ -142,9 +385,11 @@ class PDFReportGenerator:
             company: Company info dict (name, research_date, etc.)
             metrics: List of 15 sustainability metrics
             scores: Scores dict (final_score, category scores, etc.)
+            force: Skip the MAX_METRICS_PER_TABLE check
 
         Returns:
-            BytesIO buffer containing the PDF file
+            BytesIO buffer containing the PDF file (use .getbuffer() for a
+            zero-copy view when writing it somewhere)
 
         Example:
             pdf_buffer = generator.generate_single_company_report(
@@ -153,21 +398,22 @@ class PDFReportGenerator:
                 scores={"final_score": 78.5, ...}
             )
             # pdf_buffer can be saved to file or sent to user
+
+        Raises:
+            ValueError: If a category has more than MAX_METRICS_PER_TABLE metrics
         """
         logger.info(f"📄 Generating PDF report for: {company['name']}")
 
+        # Group metrics by category
+        metrics_by_category = self._group_by_category(metrics)
+        if not force:
+            self._check_table_sizes(company['name'], metrics_by_category)
+
         # Create PDF buffer in memory
         buffer = io.BytesIO()
 
         # Create PDF document
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18
-        )
+        doc = self._new_document(buffer)
 
         # Build document content
         story = []
@@ -191,38 +437,19 @@ class PDFReportGenerator:
         score_level = self._get_score_level(scores['final_score'])
         score_color = self.SCORE_COLORS.get(score_level, colors.black)
 
-        score_text = f"""
-        <para align=center>
-            <font size=48 color='{score_color.hexval()}'>
-                <b>{scores['final_score']:.1f}/100</b>
-            </font>
-        </para>
-        """
-        story.append(Paragraph(score_text, self.styles['Normal']))
+        story.append(ColoredText([f"{scores['final_score']:.1f}/100"], 48, score_color, bold=True))
         story.append(Spacer(1, 0.2 * inch))
 
         # Rating
-        rating_text = f"""
-        <para align=center>
-            <font size=18 color='{score_color.hexval()}'>
-                <b>{score_level}</b>
-            </font>
-        </para>
-        """
-        story.append(Paragraph(rating_text, self.styles['Normal']))
+        story.append(ColoredText([score_level], 18, score_color, bold=True))
         story.append(Spacer(1, 0.5 * inch))
 
         # Report metadata
-        research_date = datetime.fromisoformat(company['research_date']).strftime("%B %d, %Y")
-        metadata_text = f"""
-        <para align=center>
-            <font size=10 color='#6b7280'>
-                Analysis Date: {research_date}<br/>
-                Generated: {datetime.now().strftime("%B %d, %Y at %I:%M %p")}
-            </font>
-        </para>
-        """
-        story.append(Paragraph(metadata_text, self.styles['Normal']))
+        research_date = _format_date(company['research_date'], "%B %d, %Y")
+        story.append(ColoredText([
+            f"Analysis Date: {research_date}",
+            f"Generated: {_generated_timestamp()}"
+        ], 10, self.METADATA_COLOR))
 
         # Page break before content
         story.append(PageBreak())
@@ -242,8 +469,9 @@ class PDFReportGenerator:
             ('Governance', scores.get('governance_score', 0), '25%')
         ]
 
-        for cat_name, cat_score, weight in categories:
-            cat_level = self._get_score_level(cat_score)
+        cat_levels = self._get_score_levels([cat_score for _, cat_score, _ in categories])
+
+        for (cat_name, cat_score, weight), cat_level in zip(categories, cat_levels):
             category_data.append([
                 cat_name,
                 f"{cat_score:.1f}",
@@ -252,23 +480,7 @@ class PDFReportGenerator:
             ])
 
         category_table = Table(category_data, colWidths=[2*inch, 1.5*inch, 1*inch, 1.5*inch])
-        category_table.setStyle(TableStyle([
-            # Header row
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#374151")),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-
-            # Data rows
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 11),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor("#f3f4f6")]),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#d1d5db")),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ]))
+        category_table.setStyle(_CATEGORY_TABLE_STYLE)
 
         story.append(category_table)
         story.append(Spacer(1, 0.4 * inch))
@@ -277,71 +489,28 @@ class PDFReportGenerator:
         story.append(Paragraph("Detailed Metrics (All 15)", self.styles['SectionHeading']))
         story.append(Spacer(1, 0.2 * inch))
 
-        # Group metrics by category
-        metrics_by_category = {}
-        for metric in metrics:
-            category = metric['category']
-            if category not in metrics_by_category:
-                metrics_by_category[category] = []
-            metrics_by_category[category].append(metric)
-
         # Display metrics for each category
-        for category in ['Environmental', 'Social', 'Governance']:
-            if category not in metrics_by_category:
-                continue
-
+        for category, category_metrics in metrics_by_category.items():
             # Category header
             cat_color = self.CATEGORY_COLORS.get(category, colors.black)
-            story.append(Paragraph(
-                f"<font color='{cat_color.hexval()}'><b>{category} Metrics</b></font>",
-                self.styles['Normal']
-            ))
+            story.append(ColoredText([f"{category} Metrics"], 10, cat_color, bold=True, centered=False))
             story.append(Spacer(1, 0.1 * inch))
 
             # Metrics table
-            metrics_data = [['Metric', 'Value', 'Confidence']]
-
-            for metric in metrics_by_category[category]:
-                metrics_data.append([
-                    metric['metric_name'],
-                    f"{metric['value']:.1f}",
-                    f"{metric['confidence']:.0%}"
-                ])
+            metrics_data = self._metrics_table_rows(category_metrics)
 
             metrics_table = Table(metrics_data, colWidths=[3*inch, 1.5*inch, 1.5*inch])
-            metrics_table.setStyle(TableStyle([
-                # Header
-                ('BACKGROUND', (0, 0), (-1, 0), cat_color),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-
-                # Data
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor("#f9fafb")]),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor("#e5e7eb")),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-            ]))
+            metrics_table.setStyle(_metrics_table_style(cat_color, comparison=False))
 
             story.append(metrics_table)
             story.append(Spacer(1, 0.3 * inch))
 
         # === FOOTER ===
         story.append(Spacer(1, 0.3 * inch))
-        footer_text = """
-        <para align=center>
-            <font size=8 color='#9ca3af'>
-                Generated by Multi-Agent ESG Research System<br/>
-                This report is based on publicly available data and AI analysis
-            </font>
-        </para>
-        """
-        story.append(Paragraph(footer_text, self.styles['Normal']))
+        story.append(ColoredText([
+            "Generated by Multi-Agent ESG Research System",
+            "This report is based on publicly available data and AI analysis"
+        ], 8, self.FOOTER_COLOR))
 
         # Build PDF
         doc.build(story)
@@ -354,7 +523,8 @@ class PDFReportGenerator:
 
     def generate_comparison_report(
         self,
-        companies_data: List[Dict]
+        companies_data: List[Dict],
+        force: bool = False
     ) -> io.BytesIO:
         """
         Generate a comparison PDF report for multiple companies.
@@ -364,6 +534,8 @@ class PDFReportGenerator:
                 - company: Company info
                 - metrics: List of metrics
                 - scores: Scores dict
+            force: Skip the MAX_COMPANIES_PER_COMPARISON and
+                MAX_METRICS_PER_TABLE checks
 
         Returns:
             BytesIO buffer containing the PDF file
@@ -382,21 +554,29 @@ class PDFReportGenerator:
                 }
             ]
             pdf_buffer = generator.generate_comparison_report(companies_data)
+
+        Raises:
+            ValueError: If the report exceeds one of the size limits
         """
         logger.info(f"📊 Generating comparison report for {len(companies_data)} companies")
 
+        if not force and len(companies_data) > MAX_COMPANIES_PER_COMPARISON:
+            raise ValueError(
+                f"A comparison report can include at most {MAX_COMPANIES_PER_COMPARISON} "
+                f"companies ({len(companies_data)} requested)"
+            )
+
+        # Format dates and group metrics once per company
+        companies = [self._prepare_company_data(data) for data in companies_data]
+        if not force:
+            for company in companies:
+                self._check_table_sizes(company.name, company.by_category)
+
         # Create PDF buffer
         buffer = io.BytesIO()
 
         # Create PDF document
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18
-        )
+        doc = self._new_document(buffer)
 
         # Build content
         story = []
@@ -410,7 +590,7 @@ class PDFReportGenerator:
         story.append(Spacer(1, 0.3 * inch))
 
         # Company names
-        company_names = " vs ".join([data['company']['name'] for data in companies_data])
+        company_names = " vs ".join([company.name for company in companies])
         story.append(Paragraph(
             company_names,
             self.styles['CompanyName']
@@ -418,15 +598,10 @@ class PDFReportGenerator:
         story.append(Spacer(1, 0.5 * inch))
 
         # Report metadata
-        metadata_text = f"""
-        <para align=center>
-            <font size=10 color='#6b7280'>
-                Companies Compared: {len(companies_data)}<br/>
-                Generated: {datetime.now().strftime("%B %d, %Y at %I:%M %p")}
-            </font>
-        </para>
-        """
-        story.append(Paragraph(metadata_text, self.styles['Normal']))
+        story.append(ColoredText([
+            f"Companies Compared: {len(companies_data)}",
+            f"Generated: {_generated_timestamp()}"
+        ], 10, self.METADATA_COLOR))
 
         story.append(PageBreak())
 
@@ -437,37 +612,18 @@ class PDFReportGenerator:
         # Overall scores table
         overall_data = [['Company', 'Final Score', 'Rating', 'Analysis Date']]
 
-        for data in companies_data:
-            company = data['company']
-            scores = data['scores']
-            score_level = self._get_score_level(scores['final_score'])
-            research_date = datetime.fromisoformat(company['research_date']).strftime("%b %d, %Y")
+        score_levels = self._get_score_levels([company.scores['final_score'] for company in companies])
 
+        for company, score_level in zip(companies, score_levels):
             overall_data.append([
-                company['name'],
-                f"{scores['final_score']:.1f}",
+                company.name,
+                f"{company.scores['final_score']:.1f}",
                 score_level,
-                research_date
+                company.research_date_str
             ])
 
         overall_table = Table(overall_data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1.5*inch])
-        overall_table.setStyle(TableStyle([
-            # Header
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#374151")),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-
-            # Data
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor("#f3f4f6")]),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#d1d5db")),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ]))
+        overall_table.setStyle(_OVERALL_TABLE_STYLE)
 
         story.append(overall_table)
         story.append(Spacer(1, 0.4 * inch))
@@ -480,109 +636,27 @@ class PDFReportGenerator:
         category_headers = ['Company', 'Environmental (40%)', 'Social (35%)', 'Governance (25%)']
         category_comp_data = [category_headers]
 
-        for data in companies_data:
-            scores = data['scores']
+        for company in companies:
+            scores = company.scores
             category_comp_data.append([
-                data['company']['name'],
+                company.name,
                 f"{scores.get('environmental_score', 0):.1f}",
                 f"{scores.get('social_score', 0):.1f}",
                 f"{scores.get('governance_score', 0):.1f}"
             ])
 
         category_comp_table = Table(category_comp_data, colWidths=[2*inch, 1.75*inch, 1.75*inch, 1.75*inch])
-        category_comp_table.setStyle(TableStyle([
-            # Header
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor("#374151")),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-
-            # Data
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor("#f3f4f6")]),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor("#d1d5db")),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ]))
+        category_comp_table.setStyle(_CATEGORY_COMPARISON_TABLE_STYLE)
 
         story.append(category_comp_table)
         story.append(Spacer(1, 0.4 * inch))
 
         # === DETAILED METRICS COMPARISON ===
-        # For each company, show a section with their metrics
-        for data in companies_data:
+        # One section per company, each starting on a new page
+        for company in companies:
             story.append(PageBreak())
-
-            company_name = data['company']['name']
-            story.append(Paragraph(
-                f"Detailed Metrics: {company_name}",
-                self.styles['SectionHeading']
-            ))
-            story.append(Spacer(1, 0.2 * inch))
-
-            # Group metrics by category
-            metrics_by_category = {}
-            for metric in data['metrics']:
-                category = metric['category']
-                if category not in metrics_by_category:
-                    metrics_by_category[category] = []
-                metrics_by_category[category].append(metric)
-
-            # Display metrics for each category
-            for category in ['Environmental', 'Social', 'Governance']:
-                if category not in metrics_by_category:
-                    continue
-
-                cat_color = self.CATEGORY_COLORS.get(category, colors.black)
-                story.append(Paragraph(
-                    f"<font color='{cat_color.hexval()}'><b>{category}</b></font>",
-                    self.styles['Normal']
-                ))
-                story.append(Spacer(1, 0.1 * inch))
-
-                # Metrics table
-                metrics_data = [['Metric', 'Value', 'Confidence']]
-
-                for metric in metrics_by_category[category]:
-                    metrics_data.append([
-                        metric['metric_name'],
-                        f"{metric['value']:.1f}",
-                        f"{metric['confidence']:.0%}"
-                    ])
-
-                metrics_table = Table(metrics_data, colWidths=[3*inch, 1.5*inch, 1.5*inch])
-                metrics_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), cat_color),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 9),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor("#f9fafb")]),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor("#e5e7eb")),
-                    ('TOPPADDING', (0, 0), (-1, -1), 6),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ]))
-
-                story.append(metrics_table)
-                story.append(Spacer(1, 0.2 * inch))
-
-        # === FOOTER ===
-        story.append(Spacer(1, 0.3 * inch))
-        footer_text = """
-        <para align=center>
-            <font size=8 color='#9ca3af'>
-                Generated by Multi-Agent ESG Research System<br/>
-                This comparison is based on publicly available data and AI analysis
-            </font>
-        </para>
-        """
-        story.append(Paragraph(footer_text, self.styles['Normal']))
+            story.extend(self._company_metrics_section(company))
+        story.extend(self._comparison_footer())
 
         # Build PDF
         doc.build(story)
@@ -593,6 +667,146 @@ class PDFReportGenerator:
         logger.info(f"✅ Comparison report generated for {len(companies_data)} companies")
         return buffer
 
+    def _new_document(self, buffer: io.BytesIO) -> SimpleDocTemplate:
+        """
+        Create a letter-size document with the report margins.
+
+        Page streams are always zlib-compressed (smaller files, and less
+        data to copy into the buffer and send to the browser), whatever
+        the global ReportLab config says. Invariant mode leaves out the
+        creation time and random file ID, so the same content always
+        gives the same bytes. The standard fonts (Helvetica) aren't
+        embedded at all, so there is nothing to subset.
+        """
+        return SimpleDocTemplate(
+            buffer,
+            pagesize=letter,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=18,
+            pageCompression=1,
+            invariant=1
+        )
+
+    def _prepare_company_data(self, data: Dict) -> PreparedCompany:
+        """
+        Convert one entry of companies_data into a PreparedCompany.
+
+        Args:
+            data: Dict with company, metrics and scores
+
+        Returns:
+            PreparedCompany with the formatted date and grouped metrics
+        """
+        company = data['company']
+        return PreparedCompany(
+            name=company['name'],
+            research_date_str=_format_date(company['research_date'], "%b %d, %Y"),
+            scores=data['scores'],
+            by_category=self._group_by_category(data['metrics'])
+        )
+
+    def _company_metrics_section(self, company: PreparedCompany) -> List:
+        """
+        Build the "Detailed Metrics" flowables for one company of a comparison.
+
+        Args:
+            company: Prepared company (see _prepare_company_data)
+
+        Returns:
+            List of flowables (heading + one table per category)
+        """
+        section = []
+
+        section.append(Paragraph(
+            f"Detailed Metrics: {company.name}",
+            self.styles['SectionHeading']
+        ))
+        section.append(Spacer(1, 0.2 * inch))
+
+        metrics_by_category = company.by_category
+
+        # Display metrics for each category
+        for category, category_metrics in metrics_by_category.items():
+            cat_color = self.CATEGORY_COLORS.get(category, colors.black)
+            section.append(ColoredText([category], 10, cat_color, bold=True, centered=False))
+            section.append(Spacer(1, 0.1 * inch))
+
+            # Metrics table
+            metrics_data = self._metrics_table_rows(category_metrics)
+
+            metrics_table = Table(metrics_data, colWidths=[3*inch, 1.5*inch, 1.5*inch])
+            metrics_table.setStyle(_metrics_table_style(cat_color, comparison=True))
+
+            section.append(metrics_table)
+            section.append(Spacer(1, 0.2 * inch))
+
+        return section
+
+    def _comparison_footer(self) -> List:
+        """Build the footer flowables of a comparison report."""
+        return [Spacer(1, 0.3 * inch), ColoredText([
+            "Generated by Multi-Agent ESG Research System",
+            "This comparison is based on publicly available data and AI analysis"
+        ], 8, self.FOOTER_COLOR)]
+
+    @classmethod
+    def _group_by_category(cls, metrics: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Group metrics by their category, keeping their order.
+
+        Only categories that have metrics are included, in report order:
+        the known ones (see CATEGORY_COLORS) first, then any others.
+
+        Args:
+            metrics: List of metric dicts
+
+        Returns:
+            {category: [metrics of that category]}
+        """
+        grouped = defaultdict(list)
+        for metric in metrics:
+            grouped[metric['category']].append(metric)
+
+        known = {category: grouped.pop(category) for category in cls.CATEGORY_COLORS if category in grouped}
+        return {**known, **grouped}
+
+    @staticmethod
+    def _check_table_sizes(company_name: str, metrics_by_category: Dict[str, List[Dict]]) -> None:
+        """
+        Reject metrics tables longer than MAX_METRICS_PER_TABLE.
+
+        Args:
+            company_name: Company the metrics belong to (for the message)
+            metrics_by_category: {category: [metrics]}
+
+        Raises:
+            ValueError: If a category has too many metrics
+        """
+        for category, metrics in metrics_by_category.items():
+            if len(metrics) > MAX_METRICS_PER_TABLE:
+                raise ValueError(
+                    f"{company_name} has {len(metrics)} {category} metrics; "
+                    f"a report table can hold at most {MAX_METRICS_PER_TABLE}"
+                )
+
+    @staticmethod
+    def _metrics_table_rows(metrics: List[Dict]) -> List[List[str]]:
+        """
+        Build the rows of a metrics table (header + one row per metric).
+
+        Args:
+            metrics: Metrics of one category
+
+        Returns:
+            2D list ready for Table()
+        """
+        return [METRICS_TABLE_HEADER, *(
+            [m['metric_name'], f"{m['value']:.1f}", f"{m['confidence']:.0%}"]
+            for m in metrics
+        )]
+
     def _get_score_level(self, score: float) -> str:
         """
         Convert numerical score to qualitative rating.
@@ -603,16 +817,52 @@ class PDFReportGenerator:
         Returns:
             Rating string (Excellent, Good, Fair, Poor, Very Poor)
         """
-        if score >= 85:
-            return "Excellent"
-        elif score >= 70:
-            return "Good"
-        elif score >= 50:
-            return "Fair"
-        elif score >= 30:
-            return "Poor"
-        else:
-            return "Very Poor"
+        # Binary search over the thresholds instead of an if/elif ladder
+        return self.SCORE_LEVELS[bisect.bisect_right(self.SCORE_THRESHOLDS, score)]
+
+    def _get_score_levels(self, scores: List[float]) -> List[str]:
+        """
+        Convert several scores to ratings at once (see _get_score_level).
+
+        Args:
+            scores: Numerical scores (0-100)
+
+        Returns:
+            Rating strings, in the same order
+        """
+        thresholds, levels = self.SCORE_THRESHOLDS, self.SCORE_LEVELS
+        return [levels[bisect.bisect_right(thresholds, score)] for score in scores]
+
+
+# Singleton instance
+_generator_instance = None
+_generator_lock = threading.Lock()
+
+
+def get_pdf_generator() -> PDFReportGenerator:
+    """
+    Get a singleton PDF report generator (recommended entry point).
+
+    A generator holds no per-report state - every report builds its own
+    story and buffer - so one instance can serve all requests and threads.
+
+    Returns:
+        PDFReportGenerator instance
+
+    Example:
+        from reports.pdf_generator import get_pdf_generator
+
+        pdf_buffer = get_pdf_generator().generate_single_company_report(company, metrics, scores)
+    """
+    global _generator_instance
+
+    # Double-checked locking: the lock is only taken until the instance exists
+    if _generator_instance is None:
+        with _generator_lock:
+            if _generator_instance is None:
+                _generator_instance = PDFReportGenerator()
+
+    return _generator_instance
 
 
 def test_pdf_generator():
@@ -628,7 +878,7 @@ def test_pdf_generator():
 
         # Initialize
         db = DatabaseManager()
-        generator = PDFReportGenerator()
+        generator = get_pdf_generator()
 
         # Get a company from database (assuming one exists)
         companies = db.get_all_companies()
@@ -654,8 +904,9 @@ def test_pdf_generator():
 
         # Save to file
         filename = f"test_report_{company['name'].replace(' ', '_')}.pdf"
+        # getbuffer() is a zero-copy view; getvalue() would copy the whole PDF
         with open(filename, 'wb') as f:
-            f.write(pdf_buffer.getvalue())
+            f.write(pdf_buffer.getbuffer())
 
         print(f"✅ Single company report saved: {filename}")
 
@@ -681,7 +932,7 @@ def test_pdf_generator():
                 # Save comparison report
                 comp_filename = "test_comparison_report.pdf"
                 with open(comp_filename, 'wb') as f:
-                    f.write(comparison_buffer.getvalue())
+                    f.write(comparison_buffer.getbuffer())
 
                 print(f"✅ Comparison report saved: {comp_filename}")
 
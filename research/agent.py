@@ -11,15 +11,36 @@ Student Guide:
 - ResearchAgent: Main class that coordinates search and scraping
 - search_company(): Finds relevant URLs about a company
 - scrape_url(): Gets the actual content from a URL
+- scrape_sources(): Scrapes several URLs at the same time (asyncio)
+- research_company() runs search and scraping in one event loop, and
+  scraping starts as soon as the search has sent its citations
+- Scraped pages are cached on disk (research/scrape_cache.py), so a URL
+  is only sent to Firecrawl again once its cached copy has expired;
+  search results are cached there too (SEARCH_CACHE_TTL_HOURS)
 - research_company(): Puts it all together (search + scrape)
+
+Why scrape concurrently?
+Scraping is network-bound: we mostly wait for Firecrawl. Sending the
+requests one after another takes the sum of all waits; sending them
+together takes about as long as the slowest one. A semaphore caps how
+many run at once, so we stay polite to the API.
 """
 
 import os
-import time
+import asyncio
 import logging
+import threading
+import importlib.util
 from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from dotenv import load_dotenv
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from llm.rate_limit import RateLimiter
+from research.scrape_cache import get_scrape_cache
 
 # Load API keys and settings from .env file
 load_dotenv()
@@ -31,6 +52,136 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Maximum number of Firecrawl requests in flight at the same time
+SCRAPE_CONCURRENCY = int(os.getenv('FIRECRAWL_MAX_CONCURRENCY', 5))
+
+# Firecrawl requests per minute allowed by the plan. A token bucket only
+# makes a request wait when this rate would be exceeded (instead of a
+# fixed pause between requests); cache hits don't count.
+FIRECRAWL_RPM = int(os.getenv('FIRECRAWL_RPM', 100))
+
+# Shared by all agents, since the limit is per API key
+_firecrawl_limiter = RateLimiter(requests_per_minute=FIRECRAWL_RPM)
+
+# Firecrawl scraping options (the same for every URL)
+SCRAPE_OPTIONS = {
+    "formats": ["markdown"],  # Get content as markdown (clean text)
+    "onlyMainContent": True,   # Skip headers, footers, ads
+    "waitFor": 1000            # Wait 1 second for page to load
+}
+
+# Scraping takes a while, wait up to 45 seconds per page
+SCRAPE_TIMEOUT_SECONDS = 45
+
+# Scraped pages are cut to this many characters to avoid overwhelming the system.
+# Firecrawl has no option to limit the returned markdown, and a cut-off
+# JSON body can't be parsed, so the whole response is read; it is parsed
+# straight from bytes with orjson (no decoded str copy of the body).
+MAX_CONTENT_CHARS = 50000
+
+# HTTP/2 lets the concurrent scrapes share one connection. Needs the
+# optional "h2" package; without it httpx falls back to HTTP/1.1.
+HTTP2_ENABLED = importlib.util.find_spec('h2') is not None
+
+# Keep-alive connections kept open per host (blocking and async calls)
+HTTP_POOL_SIZE = 20
+
+# Response compression: both requests (urllib3) and httpx advertise
+# "gzip, deflate" by default and add "br" when the optional "brotli"
+# package is installed, so Firecrawl's large markdown bodies arrive
+# compressed without setting Accept-Encoding by hand.
+
+# Retries with exponential backoff (0.5s, 1s, 2s) for rate limits and
+# server errors; the server's Retry-After header is honored
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(['GET', 'POST']),  # Search and scrape calls are safe to repeat
+    raise_on_status=False  # After the last retry, raise_for_status() reports the error
+)
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Normalize a URL so that variants of the same page compare equal.
+
+    Lowercases the scheme and host, drops the #fragment, tracking
+    parameters (utm_*, ref) and a trailing slash.
+
+    Args:
+        url: URL as cited by the search
+
+    Returns:
+        Normalized URL (only used for comparing, never fetched)
+
+    Example:
+        _normalize_url("https://Tesla.com/impact/?utm_source=x#top")
+        # Returns: "https://tesla.com/impact"
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode([
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() != 'ref'
+    ])
+    path = parts.path.rstrip('/')
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+def _dedupe_urls(urls: List[str]) -> List[str]:
+    """
+    Remove duplicate URLs (see _normalize_url), keeping the first of each.
+
+    Args:
+        urls: URLs in search ranking order
+
+    Returns:
+        Unique URLs, same order
+    """
+    seen = set()
+    unique = []
+    for url in urls:
+        key = _normalize_url(url)
+        if key not in seen:
+            seen.add(key)
+            unique.append(url)
+    return unique
+
+
+# One HTTP session (connection pool) for every ResearchAgent in the process
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """
+    Get the process-wide requests session used by all research agents.
+
+    requests.post() opens (and closes) a new connection for every call.
+    A shared session keeps connections to Perplexity and Firecrawl
+    alive, so only the first call pays for the TCP + TLS handshake.
+
+    Returns:
+        requests.Session with pooling and retries configured
+    """
+    global _shared_session
+
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                session = requests.Session()
+                session.headers.update({"Content-Type": "application/json"})
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_SIZE,
+                    pool_maxsize=HTTP_POOL_SIZE,
+                    max_retries=HTTP_RETRY
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _shared_session = session
+
+    return _shared_session
+
 
 class ResearchAgent:
     """
@@ -67,9 +218,25 @@ class ResearchAgent:
         self.perplexity_url = "https://api.perplexity.ai/chat/completions"
         self.firecrawl_url = "https://api.firecrawl.dev/v1/scrape"
 
+        # Request headers never change, so they are built once
+        self._perplexity_headers = {
+            "Authorization": f"Bearer {self.perplexity_api_key}",
+            "Content-Type": "application/json"
+        }
+        self._firecrawl_headers = {
+            "Authorization": f"Bearer {self.firecrawl_api_key}",
+            "Content-Type": "application/json"
+        }
+
+        # Previously scraped pages (shared by all agents)
+        self.cache = get_scrape_cache()
+
+        # Pooled HTTP session (shared by all agents)
+        self._session = _get_shared_session()
+
         logger.info("Research Agent initialized successfully")
 
-    def search_company(self, company_name: str) -> List[str]:
+    def search_company(self, company_name: str, force_rescrape: bool = False) -> List[str]:
         """
         Step 1: Search for sustainability information URLs.
 
@@ -78,6 +245,7 @@ class ResearchAgent:
 
         Args:
             company_name: Name of the company (e.g., "Tesla", "Apple")
+            force_rescrape: Ignore the search cache and search again
 
         Returns:
             List of URLs (up to 10) that contain sustainability information
@@ -86,14 +254,115 @@ class ResearchAgent:
             urls = agent.search_company("Tesla")
             # Returns: ["https://tesla.com/impact", "https://...", ...]
         """
+        if not force_rescrape and (cached := self._cached_search(company_name)):
+            return cached
+
         logger.info(f"🔍 Searching for: {company_name}")
 
-        # Prepare the API request headers
-        headers = {
-            "Authorization": f"Bearer {self.perplexity_api_key}",
-            "Content-Type": "application/json"
-        }
+        try:
+            # Send the search request to Perplexity API
+            response = self._session.post(
+                self.perplexity_url,
+                json=self._search_payload(company_name),
+                headers=self._perplexity_headers,
+                timeout=30  # Wait max 30 seconds for response
+            )
+            response.raise_for_status()  # Raise error if request failed
+
+            # Parse the JSON response (orjson: C parser, straight from bytes)
+            data = orjson.loads(response.content)
+
+            # Extract URLs from the citations field
+            # Citations are the sources Perplexity found
+            urls = []
+            if 'citations' in data:
+                urls = data['citations'][:10]  # Take top 10 sources
+
+            logger.info(f"✓ Found {len(urls)} sources for {company_name}")
+            return self._store_search(company_name, urls)
 
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            # If the request fails, log the error and return empty list
+            logger.error(f"❌ Search failed: {str(e)}")
+            return []
+
+    async def _asearch_company(
+        self,
+        client: httpx.AsyncClient,
+        company_name: str,
+        force_rescrape: bool = False
+    ) -> List[str]:
+        """
+        Async version of search_company() that returns as early as possible.
+
+        The request is streamed: Perplexity sends the citations with the
+        first chunks of its answer, and we only need the citations. So we
+        stop reading as soon as they arrive instead of waiting for the
+        whole answer to be generated - scraping can start right away.
+
+        Args:
+            client: Shared async HTTP client
+            company_name: Name of the company
+            force_rescrape: Ignore the search cache and search again
+
+        Returns:
+            List of URLs (up to 10), empty if the search failed
+        """
+        if not force_rescrape and (cached := self._cached_search(company_name)):
+            return cached
+
+        logger.info(f"🔍 Searching for: {company_name}")
+
+        payload = {**self._search_payload(company_name), "stream": True}
+
+        try:
+            async with client.stream(
+                "POST",
+                self.perplexity_url,
+                json=payload,
+                headers=self._perplexity_headers,
+                timeout=30
+            ) as response:
+                response.raise_for_status()
+
+                # Server-sent events: one "data: {...}" line per chunk
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+
+                    citations = orjson.loads(data).get('citations')
+                    if citations:
+                        # Leaving the block closes the stream
+                        urls = citations[:10]  # Take top 10 sources
+                        logger.info(f"✓ Found {len(urls)} sources for {company_name}")
+                        return self._store_search(company_name, urls)
+
+            logger.info(f"✓ Found 0 sources for {company_name}")
+            return []
+
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.error(f"❌ Search failed: {str(e)}")
+            return []
+
+    def _cached_search(self, company_name: str) -> Optional[List[str]]:
+        """URLs from the search cache, or None on a miss."""
+        urls = self.cache.get_search(company_name)
+        if urls is not None:
+            logger.info(f"✓ Using cached search: {len(urls)} sources for {company_name}")
+        return urls
+
+    def _store_search(self, company_name: str, urls: List[str]) -> List[str]:
+        """Save a search result with URLs in the search cache and return it."""
+        if urls:
+            self.cache.put_search(company_name, urls)
+        return urls
+
+    @staticmethod
+    def _search_payload(company_name: str) -> Dict:
+        """Perplexity request body for the sustainability search."""
         # Create a detailed search query focusing on sustainability
         query = f"""Find recent and credible sources about {company_name}'s sustainability practices.
 
@@ -105,7 +374,7 @@ class ResearchAgent:
         Provide URLs to official reports, news articles, and credible sources."""
 
         # Prepare the API request body
-        payload = {
+        return {
             "model": "sonar",  # Perplexity's search model
             "messages": [
                 {
@@ -121,34 +390,7 @@ class ResearchAgent:
             "max_tokens": 1000
         }
 
-        try:
-            # Send the search request to Perplexity API
-            response = requests.post(
-                self.perplexity_url,
-                json=payload,
-                headers=headers,
-                timeout=30  # Wait max 30 seconds for response
-            )
-            response.raise_for_status()  # Raise error if request failed
-
-            # Parse the JSON response
-            data = response.json()
-
-            # Extract URLs from the citations field
-            # Citations are the sources Perplexity found
-            urls = []
-            if 'citations' in data:
-                urls = data['citations'][:10]  # Take top 10 sources
-
-            logger.info(f"✓ Found {len(urls)} sources for {company_name}")
-            return urls
-
-        except requests.exceptions.RequestException as e:
-            # If the request fails, log the error and return empty list
-            logger.error(f"❌ Search failed: {str(e)}")
-            return []
-
-    def scrape_url(self, url: str) -> Optional[Dict[str, str]]:
+    def scrape_url(self, url: str, force_rescrape: bool = False) -> Optional[Dict[str, str]]:
         """
         Step 2: Extract content from a single URL.
 
@@ -157,6 +399,7 @@ class ResearchAgent:
 
         Args:
             url: The webpage URL to scrape
+            force_rescrape: Ignore the scrape cache and fetch the page again
 
         Returns:
             Dictionary with 'url' and 'content' keys if successful
@@ -166,68 +409,133 @@ class ResearchAgent:
             result = agent.scrape_url("https://tesla.com/impact")
             # Returns: {"url": "...", "content": "Tesla's sustainability..."}
         """
-        logger.info(f"📄 Scraping: {url}")
+        if not force_rescrape and (cached := self._cached_source(url)):
+            return cached
 
-        # Prepare the API request headers
-        headers = {
-            "Authorization": f"Bearer {self.firecrawl_api_key}",
-            "Content-Type": "application/json"
-        }
-
-        # Configure the scraping options
-        payload = {
-            "url": url,
-            "formats": ["markdown"],  # Get content as markdown (clean text)
-            "onlyMainContent": True,   # Skip headers, footers, ads
-            "waitFor": 1000            # Wait 1 second for page to load
-        }
+        logger.info(f"📄 Scraping: {url}")
+        _firecrawl_limiter.acquire()
 
         try:
             # Send the scrape request to Firecrawl API
-            response = requests.post(
+            response = self._session.post(
                 self.firecrawl_url,
-                json=payload,
-                headers=headers,
-                timeout=45  # Scraping takes longer, wait up to 45 seconds
+                json={**SCRAPE_OPTIONS, "url": url},
+                headers=self._firecrawl_headers,
+                timeout=SCRAPE_TIMEOUT_SECONDS
             )
             response.raise_for_status()
 
-            # Parse the JSON response
-            data = response.json()
+            return self._store_source(self._parse_scrape_response(url, orjson.loads(response.content)))
 
-            # Check if scraping was successful and extract content
-            if data.get('success') and 'data' in data:
-                content = data['data'].get('markdown', '')
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            # If scraping fails, log the error and return None
+            logger.error(f"❌ Scraping failed for {url}: {str(e)}")
+            return None
 
-                if content:
-                    # Limit content to 50,000 characters to avoid overwhelming the system
-                    content = content[:50000]
-                    logger.info(f"✓ Scraped {len(content)} characters")
+    async def _ascrape_url(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        force_rescrape: bool = False
+    ) -> Optional[Dict[str, str]]:
+        """
+        Async version of scrape_url() (used by scrape_sources).
 
-                    return {
-                        'url': url,
-                        'content': content
-                    }
+        Args:
+            client: Shared async HTTP client
+            url: The webpage URL to scrape
+            force_rescrape: Ignore the scrape cache and fetch the page again
 
-            # If we got here, scraping didn't return useful content
-            logger.warning(f"⚠️ No content found at {url}")
-            return None
+        Returns:
+            Dictionary with 'url' and 'content' keys if successful
+            None if scraping fails
+        """
+        if not force_rescrape and (cached := self._cached_source(url)):
+            return cached
 
-        except requests.exceptions.RequestException as e:
-            # If scraping fails, log the error and return None
+        logger.info(f"📄 Scraping: {url}")
+        await _firecrawl_limiter.aacquire()
+
+        try:
+            response = await client.post(
+                self.firecrawl_url,
+                json={**SCRAPE_OPTIONS, "url": url},
+                headers=self._firecrawl_headers
+            )
+            response.raise_for_status()
+
+            return self._store_source(self._parse_scrape_response(url, orjson.loads(response.content)))
+
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
             logger.error(f"❌ Scraping failed for {url}: {str(e)}")
             return None
 
-    def scrape_sources(self, urls: List[str], max_sources: int = 5) -> List[Dict[str, str]]:
+    def _cached_source(self, url: str) -> Optional[Dict[str, str]]:
+        """Source dict from the scrape cache, or None on a miss."""
+        content = self.cache.get(url)
+        if content is None:
+            return None
+
+        logger.info(f"✓ Using cached page: {url}")
+        return {
+            'url': url,
+            'content': content
+        }
+
+    def _store_source(self, source: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """Save a freshly scraped source in the scrape cache and return it."""
+        if source:
+            self.cache.put(source['url'], source['content'])
+        return source
+
+    @staticmethod
+    def _parse_scrape_response(url: str, data: Dict) -> Optional[Dict[str, str]]:
+        """
+        Turn a Firecrawl response into a source dict.
+
+        Args:
+            url: The scraped URL
+            data: Parsed JSON response
+
+        Returns:
+            {'url': ..., 'content': ...}, or None if there was no content
+        """
+        # Check if scraping was successful and extract content
+        if data.get('success') and 'data' in data:
+            content = data['data'].get('markdown', '')
+
+            if content:
+                content = content[:MAX_CONTENT_CHARS]
+                logger.info(f"✓ Scraped {len(content)} characters")
+
+                return {
+                    'url': url,
+                    'content': content
+                }
+
+        # If we got here, scraping didn't return useful content
+        logger.warning(f"⚠️ No content found at {url}")
+        return None
+
+    def scrape_sources(
+        self,
+        urls: List[str],
+        max_sources: int = 5,
+        force_rescrape: bool = False
+    ) -> List[Dict[str, str]]:
         """
         Step 3: Scrape multiple URLs with smart error handling.
 
         Tries to scrape up to max_sources successfully. If some URLs fail,
         it tries additional URLs from the list until we have enough sources.
+        Up to SCRAPE_CONCURRENCY URLs are scraped at the same time, and
+        duplicate URLs (same page with tracking parameters, a #fragment
+        or a trailing slash) are scraped only once.
 
         Args:
             urls: List of URLs to try scraping
             max_sources: How many successful scrapes we want (default: 5)
+            force_rescrape: Ignore the scrape cache and fetch every page again
 
         Returns:
             List of successfully scraped sources (each with 'url' and 'content')
@@ -236,28 +544,82 @@ class ResearchAgent:
             sources = agent.scrape_sources(url_list, max_sources=5)
             # Returns: [{"url": "...", "content": "..."}, {...}, ...]
         """
-        sources = []
+        async def run() -> List[Dict[str, str]]:
+            async with self._async_client() as client:
+                return await self._ascrape_sources(client, urls, max_sources, force_rescrape)
+
+        return asyncio.run(run())
+
+    async def _ascrape_sources(
+        self,
+        client: httpx.AsyncClient,
+        urls: List[str],
+        max_sources: int,
+        force_rescrape: bool = False
+    ) -> List[Dict[str, str]]:
+        """
+        Scrape the URLs concurrently (see scrape_sources).
+
+        Args:
+            client: Shared async HTTP client
+            urls: List of URLs to try scraping
+            max_sources: How many successful scrapes we want
+            force_rescrape: Ignore the scrape cache
 
-        # Try scraping URLs until we have enough sources
-        # We try extra URLs (max_sources * 2) in case some fail
-        for i, url in enumerate(urls[:max_sources * 2]):
-            # Stop if we already have enough sources
-            if len(sources) >= max_sources:
-                break
+        Returns:
+            Successfully scraped sources, in the order of `urls`
+        """
+        # Duplicates would only cost extra Firecrawl calls. We try extra
+        # URLs (max_sources * 2) in case some fail.
+        candidates = _dedupe_urls(urls)[:max_sources * 2]
+        semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
 
-            # Try to scrape this URL
-            source = self.scrape_url(url)
-            if source:
-                sources.append(source)
+        async def scrape_one(index: int, url: str):
+            async with semaphore:
+                return index, await self._ascrape_url(client, url, force_rescrape)
 
-            # Rate limiting: pause between requests to be polite to servers
-            if i < len(urls) - 1:
-                time.sleep(1.5)  # Wait 1.5 seconds between requests
+        tasks = [asyncio.create_task(scrape_one(i, url)) for i, url in enumerate(candidates)]
+        scraped = {}
 
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, source = await next_done
+                if source:
+                    scraped[index] = source
+
+                # Stop as soon as we have enough sources; URLs that are
+                # still waiting for the semaphore are never sent
+                if len(scraped) >= max_sources:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Keep the search ranking order (best sources first)
+        sources = [scraped[index] for index in sorted(scraped)][:max_sources]
         logger.info(f"✓ Successfully scraped {len(sources)} sources")
         return sources
 
-    def research_company(self, company_name: str) -> Dict:
+    @staticmethod
+    def _async_client() -> httpx.AsyncClient:
+        """
+        Create the async HTTP client for one research run.
+
+        httpx connections can't be shared between event loops, so every
+        asyncio.run() opens its own client; all requests inside that run
+        share its connections (HTTP/2 if available).
+        """
+        return httpx.AsyncClient(
+            http2=HTTP2_ENABLED,
+            timeout=SCRAPE_TIMEOUT_SECONDS,
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_SIZE,
+                max_keepalive_connections=HTTP_POOL_SIZE
+            )
+        )
+
+    def research_company(self, company_name: str, force_rescrape: bool = False) -> Dict:
         """
         Complete research pipeline: search → scrape → return data.
 
@@ -267,8 +629,14 @@ class ResearchAgent:
         2. Scrapes content from those URLs
         3. Returns all the collected information
 
+        Search and scraping run in one event loop on one HTTP client:
+        the search stops reading Perplexity's answer as soon as the
+        citations arrive, and scraping starts immediately.
+
         Args:
             company_name: Name of the company to research
+            force_rescrape: Ignore the search and scrape caches and fetch
+                everything again
 
         Returns:
             Dictionary with structure:
@@ -289,20 +657,15 @@ class ResearchAgent:
         """
         logger.info(f"🚀 Starting research for: {company_name}")
 
-        # STEP 1: Find relevant URLs using Perplexity search
-        urls = self.search_company(company_name)
+        sources = asyncio.run(self._aresearch_company(company_name, force_rescrape))
 
         # If search failed, return empty result
-        if not urls:
-            logger.error(f"❌ No sources found for {company_name}")
+        if sources is None:
             return {
                 "company": company_name,
                 "sources": []
             }
 
-        # STEP 2: Scrape content from the found URLs
-        sources = self.scrape_sources(urls, max_sources=5)
-
         # Warn if we didn't get many sources
         if len(sources) < 3:
             logger.warning(f"⚠️ Only found {len(sources)} sources (target is 5+)")
@@ -316,6 +679,64 @@ class ResearchAgent:
         logger.info(f"✅ Research complete: {len(sources)} sources collected")
         return result
 
+    async def _aresearch_company(
+        self,
+        company_name: str,
+        force_rescrape: bool = False
+    ) -> Optional[List[Dict[str, str]]]:
+        """
+        Search and scrape in one event loop (see research_company).
+
+        Args:
+            company_name: Name of the company to research
+            force_rescrape: Ignore the scrape cache
+
+        Returns:
+            Scraped sources, or None if the search found nothing
+        """
+        async with self._async_client() as client:
+            # STEP 1: Find relevant URLs using Perplexity search
+            urls = await self._asearch_company(client, company_name, force_rescrape)
+
+            # If search failed, return empty result
+            if not urls:
+                logger.error(f"❌ No sources found for {company_name}")
+                return None
+
+            # STEP 2: Scrape content from the found URLs
+            return await self._ascrape_sources(client, urls, max_sources=5, force_rescrape=force_rescrape)
+
+
+# Singleton instance
+_agent_instance = None
+_agent_lock = threading.Lock()
+
+
+def get_research_agent() -> ResearchAgent:
+    """
+    Get a singleton research agent (recommended entry point).
+
+    An agent only holds its API headers and shared handles (HTTP session,
+    scrape cache), so one instance can serve all analyses and threads.
+
+    Returns:
+        ResearchAgent instance
+
+    Example:
+        from research.agent import get_research_agent
+
+        data = get_research_agent().research_company("Tesla")
+    """
+    global _agent_instance
+
+    # Double-checked locking: the lock is only taken until the instance exists
+    if _agent_instance is None:
+        with _agent_lock:
+            if _agent_instance is None:
+                _agent_instance = ResearchAgent()
+
+    return _agent_instance
+
 
 def test_research_agent():
     """
@@ -0,0 +1,229 @@
+"""
+Persistent Cache for Scraped Pages and Search Results
+
+Every Firecrawl call costs money and takes 1-5 seconds. When the same
+URL is scraped again (re-analyzing a company, or two companies citing
+the same report) we can reuse the content we already have. The same
+goes for the Perplexity search (~2-4 seconds) behind each analysis.
+
+Student Guide:
+--------------
+How it works:
+- Each scraped page is stored in a small SQLite file, keyed by the
+  SHA-256 hash of its URL (fixed length, whatever the URL looks like)
+- A cached page is only used while it is fresh (CACHE_EXPIRY_DAYS, the
+  same window the database uses before re-analyzing a company)
+- Content is zstd-compressed, like research_sources in the main database
+- Search results (the cited URLs) are stored per company name in a
+  second table and reused for SEARCH_CACHE_TTL_HOURS
+- Expired entries are deleted when the cache is opened
+
+Usage:
+    from research.scrape_cache import get_scrape_cache
+
+    cache = get_scrape_cache()
+    content = cache.get("https://tesla.com/impact")  # None on a miss
+    cache.put("https://tesla.com/impact", "Tesla's sustainability...")
+
+    urls = cache.get_search("Tesla")  # None on a miss
+    cache.put_search("Tesla", ["https://tesla.com/impact", ...])
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import List, Optional
+import orjson
+import zstandard
+
+logger = logging.getLogger(__name__)
+
+# Cached pages are reused for this many days
+SCRAPE_CACHE_DAYS = int(os.getenv('CACHE_EXPIRY_DAYS', 7))
+
+# Search results (cited URLs per company) are reused for this many hours
+SEARCH_CACHE_TTL_HOURS = float(os.getenv('SEARCH_CACHE_TTL_HOURS', 24))
+
+# zstd level for the cached content (3 = fast, ~4-8× on text)
+CONTENT_COMPRESSION_LEVEL = 3
+
+
+class ScrapeCache:
+    """
+    SQLite-backed cache of scraped page content and search results.
+
+    Example usage:
+        cache = ScrapeCache("scrape_cache.db")
+        if (content := cache.get(url)) is None:
+            content = scrape(url)
+            cache.put(url, content)
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        max_age_days: int = SCRAPE_CACHE_DAYS,
+        search_ttl_hours: float = SEARCH_CACHE_TTL_HOURS
+    ):
+        """
+        Open (or create) the cache file and drop expired entries.
+
+        Args:
+            db_path: Path to the SQLite file
+                    If None, uses SCRAPE_CACHE_PATH from .env or defaults to 'scrape_cache.db'
+            max_age_days: How long a cached page stays valid
+            search_ttl_hours: How long a cached search result stays valid
+        """
+        self.db_path = db_path or os.getenv('SCRAPE_CACHE_PATH', 'scrape_cache.db')
+        self.max_age = timedelta(days=max_age_days)
+        self.search_ttl_seconds = search_ttl_hours * 3600
+
+        # One connection shared by all threads, serialized with a lock
+        # (same setup as DatabaseManager)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._lock = threading.Lock()
+
+        # zstd objects aren't thread-safe; they are only used under self._lock
+        self._compressor = zstandard.ZstdCompressor(level=CONTENT_COMPRESSION_LEVEL)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+        with self._lock:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS scraped_pages (
+                    url_hash TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    content_zstd BLOB NOT NULL,
+                    scraped_at TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    company TEXT PRIMARY KEY,
+                    urls_json TEXT NOT NULL,
+                    searched_at REAL NOT NULL
+                )
+            """)
+            deleted = self._conn.execute(
+                "DELETE FROM scraped_pages WHERE scraped_at <= ?", (self._cutoff(),)
+            ).rowcount
+            self._conn.execute(
+                "DELETE FROM search_cache WHERE searched_at <= ?",
+                (time.time() - self.search_ttl_seconds,)
+            )
+
+        if deleted:
+            logger.info(f"🧹 Removed {deleted} expired pages from the scrape cache")
+
+    @staticmethod
+    def _company_key(company_name: str) -> str:
+        """Cache key of a company name ("  Tesla " and "tesla" are the same)."""
+        return company_name.strip().lower()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        """Cache key of a URL (SHA-256 hex digest)."""
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _cutoff(self) -> str:
+        """Pages scraped at or before this time are expired (ISO-8601)."""
+        return (datetime.now() - self.max_age).isoformat(sep=' ', timespec='seconds')
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Get the cached content of a URL.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Page content, or None if it isn't cached (or expired)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_zstd FROM scraped_pages WHERE url_hash = ? AND scraped_at > ?",
+                (self._key(url), self._cutoff())
+            ).fetchone()
+            if row is None:
+                return None
+            return self._decompressor.decompress(row[0]).decode('utf-8')
+
+    def put(self, url: str, content: str) -> None:
+        """
+        Store (or refresh) the content of a URL.
+
+        Args:
+            url: Page URL
+            content: Scraped content
+        """
+        now = datetime.now().isoformat(sep=' ', timespec='seconds')
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO scraped_pages (url_hash, url, content_zstd, scraped_at) "
+                "VALUES (?, ?, ?, ?)",
+                (self._key(url), url, self._compressor.compress(content.encode('utf-8')), now)
+            )
+
+    def get_search(self, company_name: str) -> Optional[List[str]]:
+        """
+        Get the cached search result (cited URLs) for a company.
+
+        Args:
+            company_name: Company name as searched
+
+        Returns:
+            List of URLs, or None if not cached (or expired)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT urls_json FROM search_cache WHERE company = ? AND searched_at > ?",
+                (self._company_key(company_name), time.time() - self.search_ttl_seconds)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def put_search(self, company_name: str, urls: List[str]) -> None:
+        """
+        Store (or refresh) the search result for a company.
+
+        Args:
+            company_name: Company name as searched
+            urls: Cited URLs, in ranking order
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache (company, urls_json, searched_at) VALUES (?, ?, ?)",
+                (self._company_key(company_name), orjson.dumps(urls).decode('utf-8'), time.time())
+            )
+
+
+# Singleton instance
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+
+def get_scrape_cache() -> ScrapeCache:
+    """
+    Get a singleton scrape cache (one connection for the whole process).
+
+    Returns:
+        ScrapeCache instance
+
+    Example:
+        from research.scrape_cache import get_scrape_cache
+
+        content = get_scrape_cache().get(url)
+    """
+    global _cache_instance
+
+    # Double-checked locking: the lock is only taken until the instance exists
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = ScrapeCache()
+
+    return _cache_instance
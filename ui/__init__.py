@@ -7,6 +7,7 @@ Structure:
 ----------
 ui/
  config.py                 # Streamlit configuration and CSS
+ profiling.py              # Opt-in rerun profiling (PROFILE_APP=1)
  components/               # Reusable UI components
     sidebar.py           # Sidebar with company list
     chat_interface.py    # Chat UI helpers
@@ -0,0 +1,175 @@
+"""
+Cache Observability
+
+The app caches a lot: the company list, single companies, intent
+classifications, history pages and RAG answers. Cached data lives in
+RAM, and Streamlit doesn't tell us how often each cache actually hits
+or how big its entries are. This module keeps those numbers.
+
+Student Guide:
+--------------
+How it works:
+- cached_data() is a drop-in replacement for @st.cache_data that also
+  counts calls, misses (the function body actually ran) and time spent
+- With PROFILE_APP set (see ui/profiling.py) it also records the size
+  of the entries it stored, by pickling the result on a miss - that's
+  how st.cache_data stores it too. This costs a second pickle per miss,
+  so it is off otherwise
+- Other caches (e.g. llm.cache.TTLCache objects) can be registered with
+  register_cache() so they show up in the same table
+- Type "cache stats" in the chat to see the table
+
+Usage:
+    from ui.cache_stats import cached_data, cache_stats
+
+    @cached_data(ttl=3600, show_spinner=False)
+    def load_companies(db_path: str, data_version: int):
+        ...
+
+    for row in cache_stats():
+        print(row['name'], row['hits'], row['misses'])
+"""
+
+import time
+import pickle
+import functools
+import threading
+from typing import Any, Callable, Dict, List
+
+import streamlit as st
+
+from ui.profiling import PROFILING_ENABLED
+
+# Per-function counters, updated under _stats_lock (script threads of
+# several sessions call cached functions at the same time)
+_stats: Dict[str, Dict[str, float]] = {}
+_stats_lock = threading.Lock()
+
+# Other caches (name → object with hits/misses attributes)
+_registered_caches: Dict[str, Any] = {}
+
+
+def _counters(name: str) -> Dict[str, float]:
+    """Counters of one cached function (created on first use; call under _stats_lock)."""
+    counters = _stats.get(name)
+    if counters is None:
+        counters = _stats[name] = {
+            'calls': 0, 'misses': 0, 'seconds': 0.0,
+            'stored_bytes': 0, 'largest_bytes': 0
+        }
+    return counters
+
+
+def cached_data(**cache_kwargs) -> Callable:
+    """
+    @st.cache_data that also records hit/miss, latency and size stats.
+
+    Args:
+        **cache_kwargs: Passed to st.cache_data (ttl, max_entries, ...)
+
+    Returns:
+        Decorator
+
+    Example:
+        @cached_data(ttl=60, show_spinner=False)
+        def load_history(db_path: str, limit: int):
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def on_miss(*args, **kwargs):
+            # Only runs when st.cache_data has no entry for these arguments
+            result = func(*args, **kwargs)
+            size = 0
+            if PROFILING_ENABLED:
+                try:
+                    size = len(pickle.dumps(result))
+                except Exception:
+                    pass  # Unpicklable results are st.cache_data's problem to report
+            with _stats_lock:
+                counters = _counters(name)
+                counters['misses'] += 1
+                counters['stored_bytes'] += size
+                counters['largest_bytes'] = max(counters['largest_bytes'], size)
+            return result
+
+        cached = st.cache_data(**cache_kwargs)(on_miss)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return cached(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with _stats_lock:
+                    counters = _counters(name)
+                    counters['calls'] += 1
+                    counters['seconds'] += elapsed
+
+        # Keep st.cache_data's .clear() available
+        wrapper.clear = cached.clear
+        return wrapper
+
+    return decorator
+
+
+def register_cache(name: str, cache: Any) -> None:
+    """
+    Show another cache (with hits/misses attributes) in cache_stats().
+
+    Args:
+        name: Label for the table
+        cache: e.g. an llm.cache.TTLCache
+
+    Example:
+        register_cache("rag answers", _answer_cache)
+    """
+    with _stats_lock:
+        _registered_caches[name] = cache
+
+
+def cache_stats() -> List[Dict]:
+    """
+    Snapshot of all cache statistics, most-called first.
+
+    Returns:
+        List of dicts with name, calls, hits, misses, avg_ms,
+        stored_bytes (total pickled size of everything stored so far,
+        expired entries included - not what the cache holds now) and
+        largest_bytes; both sizes are None unless PROFILE_APP is set
+
+    Example:
+        for row in cache_stats():
+            print(f"{row['name']}: {row['hits']}/{row['calls']} hits")
+    """
+    rows = []
+    with _stats_lock:
+        for name, counters in _stats.items():
+            calls = int(counters['calls'])
+            misses = int(counters['misses'])
+            rows.append({
+                'name': name,
+                'calls': calls,
+                'hits': calls - misses,
+                'misses': misses,
+                'avg_ms': counters['seconds'] * 1000 / calls if calls else 0.0,
+                'stored_bytes': int(counters['stored_bytes']) if PROFILING_ENABLED else None,
+                'largest_bytes': int(counters['largest_bytes']) if PROFILING_ENABLED else None
+            })
+
+        for name, cache in _registered_caches.items():
+            rows.append({
+                'name': name,
+                'calls': cache.hits + cache.misses,
+                'hits': cache.hits,
+                'misses': cache.misses,
+                'avg_ms': None,
+                'stored_bytes': None,
+                'largest_bytes': None
+            })
+
+    rows.sort(key=lambda row: row['calls'], reverse=True)
+    return rows
@@ -9,7 +9,14 @@ Available components:
 - history_view: History table display
 """
 
-from ui.components.sidebar import render_sidebar, get_companies_from_db
+from ui.components.sidebar import (
+    render_sidebar,
+    get_companies_from_db,
+    get_company_from_db,
+    get_category_from_db,
+    get_company_scores_from_db,
+    reset_turn_cache
+)
 from ui.components.chat_interface import (
     initialize_chat_state,
     display_chat_messages,
@@ -22,6 +29,10 @@ from ui.components.history_view import render_history_view
 __all__ = [
     'render_sidebar',
     'get_companies_from_db',
+    'get_company_from_db',
+    'get_category_from_db',
+    'get_company_scores_from_db',
+    'reset_turn_cache',
     'initialize_chat_state',
     'display_chat_messages',
     'classify_user_intent',
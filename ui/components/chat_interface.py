@@ -19,24 +19,65 @@ Why separate the chat interface?
 """
 
 import streamlit as st
-from logic.intents import get_intent_classifier
+from typing import Callable, Tuple, Union
+from logic.intents import get_intent_classifier, IntentClassifier
 from ui.components.sidebar import get_companies_from_db
+from ui.cache_stats import cached_data
 
+# How often a report that is still being generated is checked (seconds)
+PDF_POLL_SECONDS = 1.0
 
-def initialize_chat_state(initial_message: str):
+
+@cached_data(ttl=3600, show_spinner=False)
+def _cached_classify(user_message: str, analyzed_companies: Tuple[str, ...]) -> dict:
+    """
+    Classify a message, reusing the answer for repeated prompts.
+
+    The analyzed companies are part of the cache key because they decide
+    which companies end up in needs_analysis.
+
+    Args:
+        user_message: What the user typed
+        analyzed_companies: Companies already in the database (sorted tuple)
+
+    Returns:
+        dict: Intent data with intent, companies, question, needs_analysis
+
+    Raises:
+        Exception: If the LLM classification fails - st.cache_data doesn't
+                   store exceptions, so a failure is retried next time
+                   instead of caching the fallback for an hour
+    """
+    # The classifier is a process-wide singleton (its regexes are compiled
+    # once), and the tuple is passed as is: the rule matcher keys its
+    # compiled company patterns by this same tuple, so no copies are made
+    return get_intent_classifier().classify(user_message, analyzed_companies, use_fallback=False)
+
+
+def initialize_chat_state(initial_message: Union[str, Callable[[], str]]):
     """
     Initialize chat session state if not already initialized.
 
+    Runs on every rerun, so it only does work the first time: pass a
+    function and it is only called when the chat is actually created.
+
     Args:
-        initial_message: The welcome message to display
+        initial_message: The welcome message to display, or a function
+                         that returns it
 
     Example:
         initialize_chat_state("Welcome to the chat!")
+        initialize_chat_state(get_initial_chat_message)  # built lazily
     """
-    if 'chat_messages' not in st.session_state:
-        st.session_state.chat_messages = [
-            {"role": "assistant", "content": initial_message}
-        ]
+    if 'chat_messages' in st.session_state:
+        return
+
+    if callable(initial_message):
+        initial_message = initial_message()
+
+    st.session_state.chat_messages = [
+        {"role": "assistant", "content": initial_message}
+    ]
 
 
 def display_chat_messages():
@@ -59,14 +100,47 @@ def display_chat_messages():
             if message.get("download", False):
                 # Display download button if pending download exists
                 if hasattr(st.session_state, 'pending_download') and st.session_state.pending_download:
-                    download_data = st.session_state.pending_download
-                    st.download_button(
-                        label="📥 Download PDF Report",
-                        data=download_data['buffer'].getvalue(),
-                        file_name=download_data['filename'],
-                        mime="application/pdf",
-                        key=f"download_{download_data['filename']}"
-                    )
+                    _render_download_button(st.session_state.pending_download)
+
+
+def _render_download_button(download_data: dict):
+    """
+    Show the download button of a PDF report built in the background.
+
+    While the report's future is still running, a disabled placeholder
+    is shown inside a fragment that re-checks every PDF_POLL_SECONDS;
+    only that fragment reruns, not the whole app. When the report is
+    done, one full rerun swaps in the real button.
+
+    Args:
+        download_data: st.session_state.pending_download
+                       ({'future', 'filename', 'type'})
+    """
+    future = download_data['future']
+
+    if not future.done():
+        def poll():
+            if future.done():
+                st.rerun()
+            st.button("⏳ Generating PDF Report...", disabled=True,
+                      key=f"generating_{download_data['filename']}")
+
+        st.fragment(poll, run_every=PDF_POLL_SECONDS)()
+        return
+
+    try:
+        pdf_buffer = future.result()
+    except Exception as e:
+        st.error(f"❌ Sorry, there was an error generating the PDF report: {str(e)}")
+        return
+
+    st.download_button(
+        label="📥 Download PDF Report",
+        data=pdf_buffer.getvalue(),
+        file_name=download_data['filename'],
+        mime="application/pdf",
+        key=f"download_{download_data['filename']}"
+    )
 
 
 def classify_user_intent(user_message: str) -> dict:
@@ -74,7 +148,8 @@ def classify_user_intent(user_message: str) -> dict:
     Classify user's intent from their message.
 
     Uses the centralized intent classifier to understand what
-    the user wants to do.
+    the user wants to do. Results are cached for an hour, so a
+    repeated prompt ("show tesla score") skips the LLM call.
 
     Args:
         user_message: What the user typed
@@ -93,36 +168,55 @@ def classify_user_intent(user_message: str) -> dict:
     """
     # Get list of already analyzed companies from database
     companies_data = get_companies_from_db()
-    analyzed_companies = list(companies_data.keys())
+    analyzed_companies = tuple(sorted(companies_data.keys()))
 
-    # Use centralized intent classifier
-    classifier = get_intent_classifier()
-    intent_data = classifier.classify(user_message, analyzed_companies)
+    # Use centralized intent classifier (cached per message + companies).
+    # The fallback is applied here, outside the cache, so one failed LLM
+    # call doesn't stick to this message until the TTL runs out
+    user_message = user_message.strip()
+    try:
+        intent_data = _cached_classify(user_message, analyzed_companies)
+    except Exception:
+        intent_data = IntentClassifier.fallback(user_message)
 
     return intent_data
 
 
-def add_user_message(message: str):
+def add_user_message(message: str, render: bool = False):
     """
     Add a user message to the chat history.
 
     Args:
         message: The user's message
+        render: Also draw it right away (the history was already drawn
+                earlier in this run)
 
     Example:
         add_user_message("What's Tesla's score?")
     """
     st.session_state.chat_messages.append({"role": "user", "content": message})
+    if render:
+        with st.chat_message("user"):
+            st.markdown(message)
 
 
-def add_assistant_message(message: str):
+def add_assistant_message(message: str, render: bool = False):
     """
     Add an assistant message to the chat history.
 
+    Pass render=True for replies that don't need st.rerun() (e.g. "Please
+    specify a company"): the message is drawn now and stays in the
+    history for later runs, so the whole app doesn't run a second time
+    just to show it.
+
     Args:
         message: The assistant's message
+        render: Also draw it right away
 
     Example:
         add_assistant_message("Tesla's score is 63.5/100")
     """
     st.session_state.chat_messages.append({"role": "assistant", "content": message})
+    if render:
+        with st.chat_message("assistant"):
+            st.markdown(message)
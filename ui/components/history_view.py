@@ -15,22 +15,89 @@ Why separate the history view?
 - Easy to modify table format
 - Can be reused in reports or exports
 - Clean separation of concerns
+
+Performance:
+- The view is a fragment: its own interactions rerun only this view,
+  not the whole app (chat, sidebar)
+- Rows are cached until the database changes (data_version) or 60s
+  pass, so app reruns triggered by the chat don't re-query SQLite
+- Only one page of companies is loaded at a time, so the tab stays fast
+  however large the database grows
+- Companies and their latest scores come from a single JOIN query
+  (not one score query per company)
+- pandas/numpy are imported when the table is first built, not when the
+  app starts (importing them takes a few hundred ms)
 """
 
 import streamlit as st
-import pandas as pd
-from database.db_manager import DatabaseManager
+from typing import TYPE_CHECKING, Tuple
+from database.db_manager import get_db_manager
+from ui.components.sidebar import SCORE_LEVELS, SCORE_THRESHOLDS
+from ui.cache_stats import cached_data
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Companies shown per page in the history table
+HISTORY_PAGE_SIZE = 100
+
+
+@cached_data(ttl=60, show_spinner=False)
+def load_history(db_path: str, data_version: int, page: int = 1,
+                 page_size: int = HISTORY_PAGE_SIZE) -> Tuple[int, "pd.DataFrame"]:
+    """
+    Build the history table for one page (cached).
+
+    Args:
+        db_path: Database file to read (part of the cache key)
+        data_version: DatabaseManager.data_version; a new value means
+                      something was written and the cache must refresh
+        page: Page number, starting at 1
+        page_size: Companies per page
+
+    Returns:
+        Tuple of (total number of companies, DataFrame with Company,
+        Score, Level, Date for this page's companies that have a score)
+    """
+    # Heavy imports, only paid once the History tab is actually shown
+    import numpy as np
+    import pandas as pd
 
+    db = get_db_manager(db_path)
+    total = db.count_companies()
+    rows = db.get_companies_with_latest_scores(limit=page_size, offset=(page - 1) * page_size)
 
+    # Collect one list per column: pandas builds a DataFrame from columns
+    # much faster than from rows (no per-row type inference)
+    names, scores, dates = [], [], []
+    for name, research_date, final_score in rows:
+        if final_score is not None:
+            names.append(name)
+            scores.append(final_score)
+            dates.append(research_date)
+
+    # Rate all scores in one call (same bins as get_score_level)
+    levels = np.take(SCORE_LEVELS, np.digitize(scores, SCORE_THRESHOLDS))
+
+    history_df = pd.DataFrame({'Company': names, 'Score': scores, 'Level': levels, 'Date': dates})
+    # Format the whole column at once
+    history_df['Score'] = history_df['Score'].map('{:.1f}'.format)
+    return total, history_df
+
+
+@st.fragment
 def render_history_view():
     """
     Render the analysis history table.
 
     This function:
-    1. Fetches all companies from database
+    1. Fetches one page of companies from database
     2. Gets their latest scores
     3. Displays them in a table format
 
+    Decorated with @st.fragment so its own interactions rerun only
+    this view; the table data comes from the load_history() cache.
+
     Example:
         from ui.components.history_view import render_history_view
 
@@ -39,25 +106,21 @@ def render_history_view():
     """
     st.header("Analysis History")
 
-    db = DatabaseManager()
-    companies = db.get_all_companies()
-
-    if companies:
-        st.markdown(f"**{len(companies)} companies analyzed:**")
-
-        history_data = []
-        for company in companies:
-            score = db.get_latest_score(company['id'])
-            if score:
-                history_data.append({
-                    'Company': company['name'],
-                    'Score': f"{score['final_score']:.1f}",
-                    'Level': score.get('score_level', 'N/A'),
-                    'Date': company['research_date']
-                })
-
-        if history_data:
-            history_df = pd.DataFrame(history_data)
+    db = get_db_manager()
+    company_count = db.count_companies()
+
+    # Page selector only when there's more than one page
+    page = 1
+    page_count = (company_count + HISTORY_PAGE_SIZE - 1) // HISTORY_PAGE_SIZE
+    if page_count > 1:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+
+    company_count, history_df = load_history(db.db_path, db.data_version, int(page))
+
+    if company_count:
+        st.markdown(f"**{company_count} companies analyzed:**")
+
+        if not history_df.empty:
             st.dataframe(history_df, use_container_width=True)
         else:
             st.info("No completed analyses found")
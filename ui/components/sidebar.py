@@ -21,7 +21,17 @@ Why separate the sidebar?
 
 import streamlit as st
 import os
-from database.db_manager import DatabaseManager
+import bisect
+from typing import Dict, List, Optional, Tuple
+from database.db_manager import get_db_manager
+from ui.cache_stats import cached_data
+
+# Lower bounds of the ratings: score >= 85 is Excellent, >= 70 Good, ...
+SCORE_THRESHOLDS = (30, 50, 70, 85)
+SCORE_LEVELS = ("Very Poor", "Poor", "Fair", "Good", "Excellent")
+
+# Session-state slot holding the company list loaded during this script run
+_TURN_COMPANIES_KEY = '_turn_companies'
 
 
 def get_score_level(score: float) -> str:
@@ -38,72 +48,200 @@ def get_score_level(score: float) -> str:
         level = get_score_level(85)  # Returns "Excellent"
         level = get_score_level(55)  # Returns "Fair"
     """
-    if score >= 85:
-        return "Excellent"
-    elif score >= 70:
-        return "Good"
-    elif score >= 50:
-        return "Fair"
-    elif score >= 30:
-        return "Poor"
-    else:
-        return "Very Poor"
+    # Binary search over the thresholds instead of an if/elif ladder
+    return SCORE_LEVELS[bisect.bisect_right(SCORE_THRESHOLDS, score)]
 
 
-@st.cache_data(ttl=10)  # Cache for 10 seconds
 def get_companies_from_db():
     """
     Fetch all recent companies from database with caching.
 
     This function:
-    1. Gets all companies from database
-    2. Fetches their recent analysis data (within cache period)
-    3. Returns a dictionary of company data
+    1. Gets all companies with a recent analysis (within cache period)
+       from the database, in one bulk load
+    2. Returns a dictionary of company data
 
     Why cache?
     - Avoid excessive database queries
-    - 10-second TTL ensures data is reasonably fresh
+    - The cache key includes the database's data_version, so any save or
+      delete makes the next call reload - no stale scores, no manual
+      cache clearing, and no reloading while nothing changed
     - Improves app performance
 
+    Within one script run (sidebar, intent classifier, handlers) the
+    first result is reused: st.cache_data would otherwise unpickle a
+    fresh copy for every caller. Callers must not modify it.
+
     Returns:
         dict: Dictionary mapping company names to their data
               {
                   "Tesla": {
                       "company": {...},
-                      "sources": [...],
                       "metrics": [...],
                       "scores": {...}
                   },
                   ...
               }
+              (no "sources": use DatabaseManager.get_source_excerpts()
+              for those)
 
     Example:
         companies_data = get_companies_from_db()
         if "Tesla" in companies_data:
             print(f"Score: {companies_data['Tesla']['scores']['final_score']}")
     """
+    db = get_db_manager()
+    key = (db.db_path, db.data_version)
+
+    loaded = st.session_state.get(_TURN_COMPANIES_KEY)
+    if loaded is not None and loaded[0] == key:
+        return loaded[1]
+
+    companies_data = _load_companies(*key)
+    st.session_state[_TURN_COMPANIES_KEY] = (key, companies_data)
+    return companies_data
+
+
+def get_category_from_db(company_name: str, category: str) -> Optional[Dict]:
+    """
+    Fetch one company's latest scores and the metrics of one category.
+
+    For the category views (environmental/social/governance): the metrics
+    are filtered and sorted by the database, and no sources or other
+    categories are loaded. Cached per data_version like the other loaders.
+
+    Args:
+        company_name: Name of the company
+        category: "Environmental", "Social" or "Governance"
+
+    Returns:
+        dict: {"scores": {...}, "metrics": [(metric_name, value), ...]}
+              (metrics highest first), or None if the company has no
+              recent analysis
+
+    Example:
+        data = get_category_from_db("Tesla", "Environmental")
+        if data is not None:
+            print(f"Score: {data['scores']['environmental_score']}")
+    """
+    db = get_db_manager()
+    return _load_category(db.db_path, db.data_version, company_name, category)
+
+
+@cached_data(ttl=3600, max_entries=64, show_spinner=False)
+def _load_category(db_path: str, data_version: int, company_name: str, category: str) -> Optional[Dict]:
+    """
+    Load one company's scores and category metrics (cached per data_version).
+
+    Args:
+        db_path: Database file to read (part of the cache key)
+        data_version: DatabaseManager.data_version at call time
+        company_name: Name of the company
+        category: Metric category
+
+    Returns:
+        dict: Same structure as get_category_from_db(), or None
+    """
     try:
-        db = DatabaseManager()
-        all_companies = db.get_all_companies()
+        db = get_db_manager(db_path)
+        cache_days = int(os.getenv('CACHE_EXPIRY_DAYS', 7))
+        if not db.companies_exist([company_name], days=cache_days):
+            return None
+
+        company = db.get_company(company_name)
+        scores = db.get_latest_score(company['id']) if company else None
+        if not scores:
+            return None
+
+        return {
+            'scores': scores,
+            'metrics': db.get_category_metrics(company['id'], category)
+        }
+    except Exception as e:
+        st.error(f"Error fetching {company_name}: {str(e)}")
+        return None
 
-        companies_data = {}
+
+def get_company_scores_from_db() -> List[Tuple[str, float]]:
+    """
+    Fetch (name, final_score) of all recent companies, best first.
+
+    For views that only list names and scores: one two-column query
+    instead of every company's metrics and scores. Cached like
+    get_companies_from_db() (the key includes data_version).
+
+    Returns:
+        List of (name, final_score) tuples, highest score first
+
+    Example:
+        for name, score in get_company_scores_from_db():
+            print(f"{name}: {score:.1f}/100")
+    """
+    db = get_db_manager()
+    return _load_company_scores(db.db_path, db.data_version)
+
+
+@cached_data(ttl=3600, max_entries=8, show_spinner=False)
+def _load_company_scores(db_path: str, data_version: int) -> List[Tuple[str, float]]:
+    """
+    Load (name, final_score) of all recent companies (cached per data_version).
+
+    Args:
+        db_path: Database file to read (part of the cache key)
+        data_version: DatabaseManager.data_version at call time
+
+    Returns:
+        list: Same as get_company_scores_from_db()
+    """
+    try:
         cache_days = int(os.getenv('CACHE_EXPIRY_DAYS', 7))
+        return get_db_manager(db_path).list_companies_with_scores(days=cache_days)
+    except Exception as e:
+        st.error(f"Error fetching companies: {str(e)}")
+        return []
+
+
+def reset_turn_cache():
+    """
+    Forget the company list reused within the previous script run.
+
+    Call at the start of every run, so the list is only shared inside
+    one run (data_version already catches changes within a run).
+
+    Example:
+        reset_turn_cache()  # first thing in the app's render function
+    """
+    st.session_state.pop(_TURN_COMPANIES_KEY, None)
 
-        for company in all_companies:
-            cached = db.get_recent_analysis(company['name'], days=cache_days)
-            if cached:
-                company_data, sources, metrics, scores = cached
 
-                # Ensure score_level exists
-                if 'score_level' not in scores:
-                    scores['score_level'] = get_score_level(scores['final_score'])
+# ttl: analyses still age out of the CACHE_EXPIRY_DAYS window without a write
+@cached_data(ttl=3600, max_entries=8, show_spinner=False)
+def _load_companies(db_path: str, data_version: int):
+    """
+    Load companies with their recent analysis (cached per data_version).
+
+    Args:
+        db_path: Database file to read (part of the cache key)
+        data_version: DatabaseManager.data_version at call time
+
+    Returns:
+        dict: Same structure as get_companies_from_db()
+    """
+    try:
+        db = get_db_manager(db_path)
+        cache_days = int(os.getenv('CACHE_EXPIRY_DAYS', 7))
 
-                companies_data[company['name']] = {
-                    'company': company_data,
-                    'sources': sources,
-                    'metrics': metrics,
-                    'scores': scores
-                }
+        # All companies in four queries (not four per company). The scraped
+        # pages are left out: list views only need scores, and the RAG
+        # handler reads short excerpts itself (get_source_excerpts)
+        companies_data = {}
+        analyses = db.get_all_recent_analyses(days=cache_days, include_sources=False)
+        for company_name, (company_data, _, metrics, scores) in analyses.items():
+            companies_data[company_name] = {
+                'company': company_data,
+                'metrics': metrics,
+                'scores': scores
+            }
 
         return companies_data
     except Exception as e:
@@ -111,6 +249,95 @@ def get_companies_from_db():
         return {}
 
 
+def get_company_from_db(company_name: str) -> Optional[Dict]:
+    """
+    Fetch ONE company's recent analysis from the database with caching.
+
+    Handlers that only need one company (scores, questions, reports)
+    should use this instead of get_companies_from_db(): it runs a few
+    indexed queries for that company instead of loading every company,
+    and Streamlit only has to copy that company's data out of the cache.
+    Like get_companies_from_db(), the cache key includes data_version.
+
+    Args:
+        company_name: Name of the company
+
+    Returns:
+        dict: Same structure as one value of get_companies_from_db(),
+              or None if the company has no recent analysis
+
+    Example:
+        data = get_company_from_db("Tesla")
+        if data is not None:
+            print(f"Score: {data['scores']['final_score']}")
+    """
+    db = get_db_manager()
+    return _load_company(db.db_path, db.data_version, company_name)
+
+
+@cached_data(ttl=3600, max_entries=64, show_spinner=False)
+def _load_company(db_path: str, data_version: int, company_name: str) -> Optional[Dict]:
+    """
+    Load one company's recent analysis (cached per data_version).
+
+    Args:
+        db_path: Database file to read (part of the cache key)
+        data_version: DatabaseManager.data_version at call time
+        company_name: Name of the company
+
+    Returns:
+        dict: Same structure as get_company_from_db(), or None
+    """
+    try:
+        cache_days = int(os.getenv('CACHE_EXPIRY_DAYS', 7))
+        # Scraped pages are left out (see _load_companies)
+        cached = get_db_manager(db_path).get_recent_analysis(
+            company_name, days=cache_days, include_sources=False
+        )
+        if not cached:
+            return None
+
+        company_data, _, metrics, scores = cached
+        return {
+            'company': company_data,
+            'metrics': metrics,
+            'scores': scores
+        }
+    except Exception as e:
+        st.error(f"Error fetching {company_name}: {str(e)}")
+        return None
+
+
+def _delete_companies(company_names: List[str]):
+    """
+    Delete button callback: remove companies and note it in the chat.
+
+    Streamlit runs button callbacks before the script reruns, so the
+    rerun that follows the click already shows the updated list - no
+    extra st.rerun() (a second full script run) is needed.
+
+    Args:
+        company_names: Companies to delete
+    """
+    # One statement for all of them (CASCADE will delete related records)
+    get_db_manager().delete_companies(company_names)
+
+    # Add notification (the deletes already invalidated the cache)
+    deleted_msg = f"🗑️ Deleted from database: {', '.join(company_names)}"
+    if 'chat_messages' in st.session_state:
+        st.session_state.chat_messages.append({"role": "assistant", "content": deleted_msg})
+
+
+def _clear_all_companies():
+    """Clear All button callback: delete every company and reset the chat."""
+    # Delete all companies from database (shared manager: no new
+    # connection, schema check or flusher thread per click)
+    get_db_manager().clear_all()
+
+    if 'chat_messages' in st.session_state:
+        st.session_state.chat_messages = [st.session_state.chat_messages[0]]
+
+
 def render_sidebar():
     """
     Render the complete sidebar with company list and controls.
@@ -135,7 +362,6 @@ def render_sidebar():
 
     if companies_data:
         # Display each company with delete button
-        companies_to_delete = []
         for company_name, data in companies_data.items():
             if data:
                 score = data['scores']['final_score']
@@ -149,38 +375,16 @@ def render_sidebar():
                 with col1:
                     st.markdown(f"{color} **{company_name}**  \n{score:.1f} ({level})")
                 with col2:
-                    if st.button("🗑️", key=f"delete_{company_name}", help=f"Delete {company_name}"):
-                        companies_to_delete.append(company_name)
-
-        # Delete companies from database
-        if companies_to_delete:
-            db = DatabaseManager()
-            for company in companies_to_delete:
-                # Delete from database (CASCADE will delete related records)
-                with db._get_connection() as conn:
-                    conn.execute("DELETE FROM companies WHERE name = ?", (company,))
-                    conn.commit()
-
-            # Clear cache and add notification
-            get_companies_from_db.clear()
-            deleted_msg = f"🗑️ Deleted from database: {', '.join(companies_to_delete)}"
-            if 'chat_messages' in st.session_state:
-                st.session_state.chat_messages.append({"role": "assistant", "content": deleted_msg})
-            st.rerun()
+                    st.button(
+                        "🗑️",
+                        key=f"delete_{company_name}",
+                        help=f"Delete {company_name}",
+                        on_click=_delete_companies,
+                        args=([company_name],)
+                    )
 
         st.divider()
-        if st.button("🗑️ Clear All Companies", use_container_width=True):
-            # Delete all companies from database
-            db = DatabaseManager()
-            with db._get_connection() as conn:
-                conn.execute("DELETE FROM companies")
-                conn.commit()
-
-            # Clear cache
-            get_companies_from_db.clear()
-            if 'chat_messages' in st.session_state:
-                st.session_state.chat_messages = [st.session_state.chat_messages[0]]
-            st.rerun()
+        st.button("🗑️ Clear All Companies", use_container_width=True, on_click=_clear_all_companies)
     else:
         st.info("No companies analyzed yet")
 
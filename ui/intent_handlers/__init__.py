@@ -8,7 +8,7 @@ Each handler is responsible for processing a specific type of user intent:
 - compare.py: Compare multiple companies
 - rag.py: Answer questions using RAG (Retrieval Augmented Generation)
 - scores.py: Show scores and details
-- management.py: Delete/clear operations
+- management.py: Delete/clear operations (and the cache stats debug view)
 
 Student Guide:
 --------------
@@ -28,32 +28,35 @@ Example usage:
         handle_compare(companies)
 """
 
-from ui.intent_handlers.analyze import handle_analyze
-from ui.intent_handlers.compare import handle_compare
-from ui.intent_handlers.rag import handle_rag_question
-from ui.intent_handlers.scores import (
-    handle_show_score,
-    handle_show_details,
-    handle_show_category,
-    handle_show_strengths_weaknesses
-)
-from ui.intent_handlers.management import (
-    handle_delete,
-    handle_clear,
-    handle_list_companies
-)
-from ui.intent_handlers.download import handle_download
-
-__all__ = [
-    'handle_analyze',
-    'handle_compare',
-    'handle_rag_question',
-    'handle_show_score',
-    'handle_show_details',
-    'handle_show_category',
-    'handle_show_strengths_weaknesses',
-    'handle_delete',
-    'handle_clear',
-    'handle_list_companies',
-    'handle_download'
-]
+import importlib
+
+# Handler name → module that defines it. Modules are imported on first
+# use (PEP 562 module __getattr__): a session that only asks for scores
+# never loads ReportLab (download) or the research/analysis stack.
+_HANDLER_MODULES = {
+    'handle_analyze': 'ui.intent_handlers.analyze',
+    'handle_compare': 'ui.intent_handlers.compare',
+    'handle_rag_question': 'ui.intent_handlers.rag',
+    'handle_show_score': 'ui.intent_handlers.scores',
+    'handle_show_details': 'ui.intent_handlers.scores',
+    'handle_show_category': 'ui.intent_handlers.scores',
+    'handle_show_strengths_weaknesses': 'ui.intent_handlers.scores',
+    'handle_delete': 'ui.intent_handlers.management',
+    'handle_clear': 'ui.intent_handlers.management',
+    'handle_list_companies': 'ui.intent_handlers.management',
+    'handle_cache_stats': 'ui.intent_handlers.management',
+    'handle_download': 'ui.intent_handlers.download',
+}
+
+__all__ = list(_HANDLER_MODULES)
+
+
+def __getattr__(name: str):
+    """Import a handler's module the first time the handler is used."""
+    module_name = _HANDLER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    handler = getattr(importlib.import_module(module_name), name)
+    globals()[name] = handler  # Later lookups skip __getattr__
+    return handler
@@ -8,25 +8,39 @@ Student Guide:
 This handler:
 1. Takes a list of companies that need analysis
 2. Analyzes each one (research → extract → score → save to DB)
-3. Adds success/failure messages to chat
-4. Clears cache to show new companies in sidebar
-
-The actual analysis is done by:
+3. Adds success/failure messages to chat as each company finishes
+4. Reruns the app so the sidebar shows the new companies (saving bumps
+   the database's data_version, which invalidates the cached list)
+
+Several companies are analyzed at the same time (in a thread pool):
+each analysis mostly WAITS on web APIs, so running them in parallel
+takes about as long as the slowest one instead of the sum of all.
+Results are shown in the order they finish, so a fast company doesn't
+wait behind a slow one.
+
+The actual analysis is done by (one shared instance of each, so
+analyzing N companies doesn't set them up N times):
 - ResearchAgent (research/agent.py) - Web research
 - MetricsExtractor (analysis/extractor.py) - Extract metrics with AI
 - SustainabilityScorer (analysis/scorer.py) - Calculate scores
 - DatabaseManager (database/db_manager.py) - Save to database
 """
 
+import logging
 import streamlit as st
 from typing import List
-from research.agent import ResearchAgent
-from database.db_manager import DatabaseManager
-from analysis.extractor import MetricsExtractor
-from analysis.scorer import SustainabilityScorer
-from ui.components.sidebar import get_companies_from_db, get_score_level
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from research.agent import get_research_agent
+from database.db_manager import get_db_manager
+from analysis.extractor import get_metrics_extractor
+from analysis.scorer import get_sustainability_scorer
 import os
 
+logger = logging.getLogger(__name__)
+
+# Max companies analyzed at once (keeps us under Perplexity/Firecrawl/OpenAI rate limits)
+MAX_PARALLEL_ANALYSES = 4
+
 
 def analyze_company_helper(company_name: str) -> dict:
     """
@@ -38,6 +52,9 @@ def analyze_company_helper(company_name: str) -> dict:
     3. Saves results to database
     4. Returns success status and score
 
+    Runs in a worker thread, so it must not call Streamlit (st.*) -
+    the caller updates the UI and clears caches afterwards.
+
     Args:
         company_name: Name of the company to analyze
 
@@ -54,10 +71,10 @@ def analyze_company_helper(company_name: str) -> dict:
         if result['success']:
             print(f"Tesla score: {result['score']}")
     """
-    db = DatabaseManager()
-    research_agent = ResearchAgent()
-    extractor = MetricsExtractor()
-    scorer = SustainabilityScorer()
+    db = get_db_manager()
+    research_agent = get_research_agent()
+    extractor = get_metrics_extractor()
+    scorer = get_sustainability_scorer()
 
     # Check cache first
     cache_days = int(os.getenv('CACHE_EXPIRY_DAYS', 7))
@@ -65,9 +82,6 @@ def analyze_company_helper(company_name: str) -> dict:
 
     if cached:
         company_data, sources, metrics, scores = cached
-        # Ensure score_level exists
-        if 'score_level' not in scores:
-            scores['score_level'] = get_score_level(scores['final_score'])
         return {
             'success': True,
             'score': scores['final_score'],
@@ -86,13 +100,6 @@ def analyze_company_helper(company_name: str) -> dict:
     scores = scorer.calculate_final_score(metrics)
     db.save_scores(company_id, scores)
 
-    # Clear cache to force reload from database
-    get_companies_from_db.clear()
-
-    # Ensure score_level exists
-    if 'score_level' not in scores:
-        scores['score_level'] = get_score_level(scores['final_score'])
-
     return {
         'success': True,
         'score': scores['final_score'],
@@ -106,7 +113,8 @@ def handle_analyze(needs_analysis: List[str]):
     Handle the analyze intent - analyze companies that need analysis.
 
     This function is called when the user wants to analyze one or more companies.
-    It processes each company and adds messages to the chat.
+    It analyzes them in parallel and adds a chat message for each one as
+    soon as it finishes.
 
     Args:
         needs_analysis: List of company names to analyze
@@ -121,16 +129,52 @@ def handle_analyze(needs_analysis: List[str]):
     response = f"Let me analyze {', '.join(needs_analysis)} first...\n\n"
     st.session_state.chat_messages.append({"role": "assistant", "content": response})
 
-    for company in needs_analysis:
-        with st.chat_message("assistant"):
-            with st.spinner(f"🔍 Analyzing {company}..."):
-                result = analyze_company_helper(company)
+    # Result messages are shown as they arrive, but added to the chat
+    # history in one go once all companies are done
+    result_messages = []
+
+    # One status box for the whole batch: a line is written into it as
+    # each company finishes, and its label changes once at the end
+    with st.chat_message("assistant"):
+        with st.status(f"🔍 Analyzing {', '.join(needs_analysis)}...", expanded=True) as status:
+            # Analyze all companies in parallel; only this (script) thread
+            # touches Streamlit, the workers just return their results
+            workers = min(MAX_PARALLEL_ANALYSES, len(needs_analysis))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(_safe_analyze, company): company
+                    for company in needs_analysis
+                }
+                for future in as_completed(futures):
+                    company = futures[future]
+                    result = future.result()
+                    if result['success']:
+                        msg = f"✅ **{company}** analyzed! Score: {result['score']:.1f}/100 ({result['level']})"
+                    else:
+                        msg = f"❌ Couldn't find information about {company}"
+
+                    # Show it now; the chat history keeps it after the rerun
+                    status.write(msg)
+                    result_messages.append({"role": "assistant", "content": msg})
+
+            status.update(label=f"Analyzed {len(needs_analysis)} companies", state="complete")
+
+    st.session_state.chat_messages.extend(result_messages)
+    st.rerun()
 
-                if result['success']:
-                    msg = f"✅ **{company}** analyzed! Score: {result['score']:.1f}/100 ({result['level']})"
-                    st.session_state.chat_messages.append({"role": "assistant", "content": msg})
-                else:
-                    msg = f"❌ Couldn't find information about {company}"
-                    st.session_state.chat_messages.append({"role": "assistant", "content": msg})
 
-    st.rerun()
+def _safe_analyze(company_name: str) -> dict:
+    """
+    Run analyze_company_helper() without letting one failure stop the batch.
+
+    Args:
+        company_name: Name of the company to analyze
+
+    Returns:
+        Result dict from analyze_company_helper(), or {'success': False}
+    """
+    try:
+        return analyze_company_helper(company_name)
+    except Exception as e:
+        logger.error(f"❌ Analysis failed for {company_name}: {str(e)}")
+        return {'success': False}
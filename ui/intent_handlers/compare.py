@@ -7,7 +7,7 @@ Student Guide:
 --------------
 This handler:
 1. Takes a list of companies to compare
-2. Fetches their scores from database
+2. Fetches their scores from database (one query, already sorted)
 3. Creates a comparison with rankings
 4. Shows detailed category breakdowns
 5. Adds insights about the comparison
@@ -19,9 +19,11 @@ The comparison shows:
 - Insights based on score differences
 """
 
+import os
 import streamlit as st
 from typing import List
-from ui.components.sidebar import get_companies_from_db
+from database.db_manager import get_db_manager
+from ui.components.chat_interface import add_assistant_message
 
 
 def handle_compare(companies: List[str]):
@@ -40,50 +42,47 @@ def handle_compare(companies: List[str]):
     """
     if len(companies) < 2:
         response = "⚠️ I need at least 2 companies to compare."
-        st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        add_assistant_message(response, render=True)
         return
 
-    response = f"📊 **Comparison: {' vs '.join(companies)}**\n\n"
-
-    # Fetch companies data from database
-    companies_data = get_companies_from_db()
-    comparison_data = []
-
-    for company in companies:
-        if company in companies_data:
-            data = companies_data[company]
-            comparison_data.append({
-                'name': company,
-                'score': data['scores']['final_score'],
-                'env': data['scores']['environmental_score'],
-                'social': data['scores']['social_score'],
-                'gov': data['scores']['governance_score']
-            })
-
-    if len(comparison_data) >= 2:
-        # Sort by score (highest first)
-        comparison_data.sort(key=lambda x: x['score'], reverse=True)
-
-        # Show winner
-        winner = comparison_data[0]
-        response += f"🏆 **Winner: {winner['name']}** with {winner['score']:.1f}/100\n\n"
-
-        response += "**Detailed Comparison:**\n\n"
-        for comp in comparison_data:
-            response += f"**{comp['name']}**: {comp['score']:.1f}/100\n"
-            response += f"- 🌍 Environmental: {comp['env']:.1f}\n"
-            response += f"- 👥 Social: {comp['social']:.1f}\n"
-            response += f"- ⚖️ Governance: {comp['gov']:.1f}\n\n"
-
-        # Add insights based on score difference
-        diff = comparison_data[0]['score'] - comparison_data[1]['score']
-        if diff > 10:
-            response += f"💡 {comparison_data[0]['name']} significantly outperforms with a {diff:.1f} point lead."
-        elif diff > 5:
-            response += f"💡 {comparison_data[0]['name']} has a moderate lead of {diff:.1f} points."
-        else:
-            response += f"💡 Very close! Only {diff:.1f} points separate them."
+    # One query for all compared companies: just the score columns, sorted
+    # by SQLite (highest first). Unknown companies are missing from the rows
+    cache_days = int(os.getenv('CACHE_EXPIRY_DAYS', 7))
+    rows = get_db_manager().get_comparison_scores(companies, days=cache_days)
+    known = {row[0] for row in rows}
+    missing = [c for c in companies if c not in known]
+    if len(rows) < 2:
+        response = f"⚠️ I need at least 2 analyzed companies to compare. Not analyzed yet: {', '.join(missing)}"
+        add_assistant_message(response, render=True)
+        return
 
+    # Collect the pieces and join once at the end (no repeated string copies)
+    parts = [f"📊 **Comparison: {' vs '.join(companies)}**\n\n"]
+    if missing:
+        parts.append(f"⚠️ Skipping (not analyzed yet): {', '.join(missing)}\n\n")
+
+    # Show winner
+    winner_name, winner_score = rows[0][0], rows[0][1]
+    parts.append(f"🏆 **Winner: {winner_name}** with {winner_score:.1f}/100\n\n")
+
+    parts.append("**Detailed Comparison:**\n\n")
+    for name, score, env, social, gov in rows:
+        parts.append(
+            f"**{name}**: {score:.1f}/100\n"
+            f"- 🌍 Environmental: {env:.1f}\n"
+            f"- 👥 Social: {social:.1f}\n"
+            f"- ⚖️ Governance: {gov:.1f}\n\n"
+        )
+
+    # Add insights based on score difference
+    diff = winner_score - rows[1][1]
+    if diff > 10:
+        parts.append(f"💡 {winner_name} significantly outperforms with a {diff:.1f} point lead.")
+    elif diff > 5:
+        parts.append(f"💡 {winner_name} has a moderate lead of {diff:.1f} points.")
+    else:
+        parts.append(f"💡 Very close! Only {diff:.1f} points separate them.")
+
+    response = "".join(parts)
     st.session_state.chat_messages.append({"role": "assistant", "content": response})
     st.rerun()
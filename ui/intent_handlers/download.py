@@ -8,19 +8,87 @@ Student Guide:
 --------------
 This handler:
 1. Fetches company data from the database
-2. Generates a professional PDF report using ReportLab
-3. Provides a download button in the chat interface
+2. Starts generating a professional PDF report using ReportLab in a
+   background thread, so the app stays responsive while it is built
+3. Provides a download button in the chat interface (it shows
+   "Generating..." until the report is ready)
 
 Supports:
 - Single company reports
 - Multi-company comparison reports
+
+Finished reports are kept for a day, keyed by a hash of the data they
+show: downloading the same report again skips ReportLab entirely.
 """
 
+import io
+import os
 import streamlit as st
-from typing import List
+from typing import Callable, Dict, List
 from datetime import datetime
-from ui.components.sidebar import get_companies_from_db
-from reports.pdf_generator import PDFReportGenerator
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from llm.cache import TTLCache, make_cache_key
+from ui.cache_stats import register_cache
+from ui.components.sidebar import get_company_from_db
+from reports.pdf_generator import get_pdf_generator
+from database.db_manager import get_db_manager
+from ui.components.chat_interface import add_assistant_message
+
+# Background threads that build PDF reports, shared by all sessions
+# (the chat shows the download button once a report's future is done)
+_PDF_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="pdf-report")
+
+# Finished reports (PDF bytes) by data hash. A TTLCache rather than
+# st.cache_data because reports are built in the pool threads above.
+PDF_CACHE_TTL_SECONDS = 24 * 3600
+_pdf_cache = TTLCache(ttl_seconds=PDF_CACHE_TTL_SECONDS, max_entries=32)
+register_cache("PDF reports", _pdf_cache)
+
+
+def _report_cache_key(kind: str, companies: List[Dict]) -> str:
+    """
+    Cache key of a report: its type, today's date and a hash of its data.
+
+    Only what the report shows is hashed (name, research date, metrics,
+    scores) - not bookkeeping fields like last_accessed_at, which change
+    on every read. The date is included because a report prints when it
+    was generated; a cached copy is at most from earlier the same day.
+
+    Args:
+        kind: "single" or "comparison"
+        companies: Dicts with 'company', 'metrics' and 'scores'
+
+    Returns:
+        SHA-256 hex key
+    """
+    shown = [
+        (c['company'].get('name'), c['company'].get('research_date'), c['metrics'], c['scores'])
+        for c in companies
+    ]
+    payload = orjson.dumps(shown, option=orjson.OPT_SORT_KEYS, default=str)
+    return make_cache_key(kind, datetime.now().date().isoformat(), payload.decode('utf-8'))
+
+
+def _generate_cached(cache_key: str, generate: Callable[..., io.BytesIO], *args, **kwargs) -> io.BytesIO:
+    """
+    Build a report, or reuse the bytes of an identical earlier one.
+
+    Runs in a _PDF_POOL thread.
+
+    Args:
+        cache_key: From _report_cache_key()
+        generate: PDFReportGenerator method that builds the report
+        *args, **kwargs: Passed to generate
+
+    Returns:
+        BytesIO with the PDF
+    """
+    pdf_bytes = _pdf_cache.get(cache_key)
+    if pdf_bytes is None:
+        pdf_bytes = generate(*args, **kwargs).getvalue()
+        _pdf_cache.set(cache_key, pdf_bytes)
+    return io.BytesIO(pdf_bytes)
 
 
 def handle_download(companies: List[str]):
@@ -39,26 +107,32 @@ def handle_download(companies: List[str]):
     """
     if not companies:
         response = "Please specify which company/companies to download a report for."
-        st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        add_assistant_message(response, render=True)
         return
 
-    # Get all companies from database
-    companies_data_dict = get_companies_from_db()
+    # Check if all requested companies are available (one cheap query,
+    # before any analysis data is loaded)
+    cache_days = int(os.getenv('CACHE_EXPIRY_DAYS', 7))
+    known = get_db_manager().companies_exist(companies, days=cache_days)
+    missing_companies = [c for c in companies if c not in known]
 
-    # Check if all requested companies are available
-    missing_companies = [c for c in companies if c not in companies_data_dict]
+    if not missing_companies:
+        # Get the requested companies from database (not every company)
+        companies_data_dict = {c: get_company_from_db(c) for c in companies}
+        missing_companies = [c for c, data in companies_data_dict.items() if data is None]
 
     if missing_companies:
         missing_names = ", ".join(missing_companies)
         response = f"I haven't analyzed the following companies yet: {missing_names}\n\n"
         response += "Please analyze them first before downloading a report."
-        st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        add_assistant_message(response, render=True)
         return
 
-    # Initialize PDF generator
-    generator = PDFReportGenerator()
+    # Shared PDF generator
+    generator = get_pdf_generator()
+
+    # Chat messages of this request, added to the history in one go
+    new_messages = []
 
     try:
         if len(companies) == 1:
@@ -67,10 +141,13 @@ def handle_download(companies: List[str]):
             data = companies_data_dict[company_name]
 
             response = f"📄 Generating PDF report for **{company_name}**..."
-            st.session_state.chat_messages.append({"role": "assistant", "content": response})
+            new_messages.append({"role": "assistant", "content": response})
 
-            # Generate PDF
-            pdf_buffer = generator.generate_single_company_report(
+            # Generate PDF in the background
+            pdf_future = _PDF_POOL.submit(
+                _generate_cached,
+                _report_cache_key('single', [data]),
+                generator.generate_single_company_report,
                 company=data['company'],
                 metrics=data['metrics'],
                 scores=data['scores']
@@ -81,15 +158,15 @@ def handle_download(companies: List[str]):
             filename = f"{company_name.replace(' ', '_')}_Sustainability_Report_{date_str}.pdf"
 
             # Add download button to chat
-            # Note: We'll store the PDF buffer in session state and create button in main app
+            # Note: We store the PDF future in session state and create the button in the chat
             st.session_state.pending_download = {
-                'buffer': pdf_buffer,
+                'future': pdf_future,
                 'filename': filename,
                 'type': 'single'
             }
 
-            success_msg = f"✅ Report ready! Click the button below to download the PDF report for **{company_name}**."
-            st.session_state.chat_messages.append({
+            success_msg = f"✅ Report started! Click the button below to download the PDF report for **{company_name}** as soon as it's ready."
+            new_messages.append({
                 "role": "assistant",
                 "content": success_msg,
                 "download": True  # Flag to indicate download button needed
@@ -99,7 +176,7 @@ def handle_download(companies: List[str]):
             # Multi-company comparison report
             company_names = ", ".join(companies)
             response = f"📊 Generating comparison report for **{company_names}**..."
-            st.session_state.chat_messages.append({"role": "assistant", "content": response})
+            new_messages.append({"role": "assistant", "content": response})
 
             # Prepare data for comparison
             companies_data_list = []
@@ -111,8 +188,13 @@ def handle_download(companies: List[str]):
                     'scores': data['scores']
                 })
 
-            # Generate comparison PDF
-            pdf_buffer = generator.generate_comparison_report(companies_data_list)
+            # Generate comparison PDF in the background
+            pdf_future = _PDF_POOL.submit(
+                _generate_cached,
+                _report_cache_key('comparison', companies_data_list),
+                generator.generate_comparison_report,
+                companies_data_list
+            )
 
             # Create filename
             date_str = datetime.now().strftime("%Y-%m-%d")
@@ -121,21 +203,21 @@ def handle_download(companies: List[str]):
 
             # Store for download
             st.session_state.pending_download = {
-                'buffer': pdf_buffer,
+                'future': pdf_future,
                 'filename': filename,
                 'type': 'comparison'
             }
 
-            success_msg = f"✅ Comparison report ready! Click the button below to download the PDF comparing **{company_names}**."
-            st.session_state.chat_messages.append({
+            success_msg = f"✅ Comparison report started! Click the button below to download the PDF comparing **{company_names}** as soon as it's ready."
+            new_messages.append({
                 "role": "assistant",
                 "content": success_msg,
                 "download": True  # Flag to indicate download button needed
             })
 
-        st.rerun()
-
     except Exception as e:
         error_msg = f"❌ Sorry, there was an error generating the PDF report: {str(e)}"
-        st.session_state.chat_messages.append({"role": "assistant", "content": error_msg})
-        st.rerun()
+        new_messages.append({"role": "assistant", "content": error_msg})
+
+    st.session_state.chat_messages.extend(new_messages)
+    st.rerun()
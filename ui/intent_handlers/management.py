@@ -13,14 +13,17 @@ These handlers manage the company data in the database:
 - Clear removes all companies
 - List shows all analyzed companies
 
-All operations work directly with the database and
-clear the cache to ensure UI updates immediately.
+All operations work directly with the database. Every write bumps
+the database's data_version, so cached reads refresh immediately.
 """
 
+import os
 import streamlit as st
 from typing import List
-from database.db_manager import DatabaseManager
-from ui.components.sidebar import get_companies_from_db
+from database.db_manager import get_db_manager
+from ui.components.sidebar import get_company_scores_from_db
+from ui.cache_stats import cache_stats
+from ui.components.chat_interface import add_assistant_message
 
 
 def handle_delete(companies: List[str]):
@@ -36,37 +39,28 @@ def handle_delete(companies: List[str]):
     """
     if not companies:
         response = "Please specify which company/companies to delete."
-        st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        add_assistant_message(response, render=True)
         return
 
-    deleted = []
-    not_found = []
+    # One cheap lookup for just these names (no analysis data is loaded)
+    db = get_db_manager()
+    cache_days = int(os.getenv('CACHE_EXPIRY_DAYS', 7))
+    known = db.companies_exist(companies, days=cache_days)
+    deleted = [c for c in companies if c in known]
+    not_found = [c for c in companies if c not in known]
 
-    db = DatabaseManager()
-    companies_data = get_companies_from_db()
-
-    for company in companies:
-        if company in companies_data:
-            # Delete from database (CASCADE will delete related records)
-            with db._get_connection() as conn:
-                conn.execute("DELETE FROM companies WHERE name = ?", (company,))
-                conn.commit()
-            deleted.append(company)
-        else:
-            not_found.append(company)
-
-    # Clear cache after deletions
     if deleted:
-        get_companies_from_db.clear()
+        # One statement for all of them (CASCADE will delete related records)
+        db.delete_companies(deleted)
 
-    response = ""
+    lines = []
     if deleted:
-        response += f"🗑️ Deleted: {', '.join(deleted)}\n"
+        lines.append(f"🗑️ Deleted: {', '.join(deleted)}")
     if not_found:
-        response += f"⚠️ Not found: {', '.join(not_found)}"
+        lines.append(f"⚠️ Not found: {', '.join(not_found)}")
+    response = "\n".join(lines)
 
-    st.session_state.chat_messages.append({"role": "assistant", "content": response.strip()})
+    st.session_state.chat_messages.append({"role": "assistant", "content": response})
     st.rerun()
 
 
@@ -78,14 +72,8 @@ def handle_clear():
         handle_clear()
         # Deletes all companies and resets chat
     """
-    # Delete all companies from database
-    db = DatabaseManager()
-    with db._get_connection() as conn:
-        conn.execute("DELETE FROM companies")
-        conn.commit()
-
-    # Clear cache
-    get_companies_from_db.clear()
+    # Delete all companies from database (one transaction, WAL truncated)
+    get_db_manager().clear_all()
 
     # Reset chat to initial message
     if 'chat_messages' in st.session_state:
@@ -100,18 +88,54 @@ def handle_list_companies():
 
     Example:
         handle_list_companies()
-        # Shows list of all companies with their scores
+        # Shows list of all companies with their scores, highest first
     """
-    companies_data = get_companies_from_db()
-
-    if companies_data:
-        response = f"📋 **I've analyzed {len(companies_data)} companies:**\n\n"
-        for name, data in companies_data.items():
-            if data:
-                score = data['scores']['final_score']
-                response += f"- **{name}**: {score:.1f}/100\n"
+    # Only names and scores (best first), not every company's full analysis
+    rows = get_company_scores_from_db()
+
+    if rows:
+        # One list + join instead of += per company (linear, not quadratic)
+        parts = [f"📋 **I've analyzed {len(rows)} companies:**\n\n"]
+        parts.extend(f"- **{name}**: {score:.1f}/100\n" for name, score in rows)
+        response = "".join(parts)
     else:
         response = "I haven't analyzed any companies yet. Tell me a company name to get started!"
 
     st.session_state.chat_messages.append({"role": "assistant", "content": response})
     st.rerun()
+
+
+def handle_cache_stats():
+    """
+    Handle cache_stats intent - show how the app's caches are doing.
+
+    A debugging aid: calls, hit rate and average latency of every cached
+    function (see ui/cache_stats.py), to find caches that never hit.
+    With PROFILE_APP set, the stored sizes are shown too.
+
+    Example:
+        handle_cache_stats()
+        # Shows a table like "_load_companies | 12 | 11 | 1 | 0.4 ms | 85 KB"
+    """
+    rows = cache_stats()
+
+    if rows:
+        parts = [
+            "🧮 **Cache statistics (this server process):**\n\n",
+            "| Cache | Calls | Hits | Misses | Avg time | Stored | Largest |\n",
+            "|---|---:|---:|---:|---:|---:|---:|\n"
+        ]
+        for row in rows:
+            avg = f"{row['avg_ms']:.1f} ms" if row['avg_ms'] is not None else "–"
+            stored = f"{row['stored_bytes'] / 1024:.0f} KB" if row['stored_bytes'] is not None else "–"
+            largest = f"{row['largest_bytes'] / 1024:.0f} KB" if row['largest_bytes'] is not None else "–"
+            parts.append(
+                f"| `{row['name']}` | {row['calls']} | {row['hits']} | {row['misses']} "
+                f"| {avg} | {stored} | {largest} |\n"
+            )
+        response = "".join(parts)
+    else:
+        response = "No cache activity yet."
+
+    st.session_state.chat_messages.append({"role": "assistant", "content": response})
+    st.rerun()
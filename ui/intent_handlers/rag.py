@@ -26,13 +26,47 @@ Example:
     2. Create prompt with sources as context
     3. AI answers based on the sources
     4. Return answer with score context
+
+Asking the exact same question again (e.g. pressing Enter twice) reuses
+the earlier answer for an hour without any API call.
 """
 
+import os
+import logging
 import streamlit as st
 from typing import List
-from ui.components.sidebar import get_companies_from_db
+from database.db_manager import get_db_manager
+from ui.components.sidebar import get_company_from_db
+from ui.components.chat_interface import add_assistant_message
 from llm.client import get_llm_client
-from prompts.rag_prompts import create_rag_answer_prompt, create_rag_system_message
+from llm.cache import TTLCache, make_cache_key
+from ui.cache_stats import register_cache
+from llm.tokens import truncate_to_tokens
+from prompts.rag_prompts import create_rag_answer_prompt, RAG_SYSTEM_MESSAGE
+
+# Token budget per source in the RAG context (~3000 characters of English)
+RAG_TOKENS_PER_SOURCE = 750
+
+# Sources used as context, and how much of each page is read from the
+# database (generous: a token is ~4 bytes of English, more for other text)
+RAG_SOURCES = 3
+RAG_BYTES_PER_SOURCE = RAG_TOKENS_PER_SOURCE * 8
+
+# Exact-repeat answers, keyed by the full prompt (company, source
+# excerpts and question) + system message: new sources or prompt changes
+# give a new key.
+RAG_ANSWER_TTL_SECONDS = 3600
+_answer_cache = TTLCache(ttl_seconds=RAG_ANSWER_TTL_SECONDS)
+register_cache("RAG answers", _answer_cache)
+
+# The LLM client's semantic cache (rephrased questions reuse an answer) is
+# off by default: within one company's context, questions that differ
+# only in scope ("Scope 1" vs "Scope 3 emissions") can look alike and get
+# the wrong answer, and every miss pays an embedding call before the
+# first streamed token. Exact repeats are covered by _answer_cache.
+RAG_SEMANTIC_CACHE = os.getenv('RAG_SEMANTIC_CACHE', 'false').lower() == 'true'
+
+logger = logging.getLogger(__name__)
 
 
 def handle_rag_question(companies: List[str], question: str):
@@ -59,52 +93,64 @@ def handle_rag_question(companies: List[str], question: str):
     company_name = companies[0] if companies else None
     if not company_name:
         response = "Please specify a company for your question."
-        st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        add_assistant_message(response, render=True)
         return
 
     # Company should already be analyzed (handled in analyze step)
-    companies_data = get_companies_from_db()
-    if company_name not in companies_data:
+    data = get_company_from_db(company_name)
+    if data is None:
         response = f"Something went wrong - {company_name} should have been analyzed already."
-        st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        add_assistant_message(response, render=True)
         return
 
-    data = companies_data[company_name]
-
     with st.chat_message("assistant"):
-        with st.spinner(f"🤔 Thinking about your question..."):
-            # Prepare context from scraped sources (top 3)
-            context = "\n\n---\n\n".join([
-                f"Source: {s['url']}\n{s['content'][:3000]}"
-                for s in data['sources'][:3]
-            ])
-
-            # Use centralized LLM client and prompts
-            llm_client = get_llm_client()
-
-            try:
-                # Create RAG prompt using centralized prompt module
-                prompt = create_rag_answer_prompt(company_name, question, context)
-                system_message = create_rag_system_message(company_name)
-
-                # Call LLM using centralized client
-                answer = llm_client.complete(
+        # Prepare context from scraped sources (top 3), cut at a sentence end.
+        # Only the start of each page is read (not whole pages)
+        sources = get_db_manager().get_source_excerpts(
+            company_name, limit=RAG_SOURCES, max_bytes=RAG_BYTES_PER_SOURCE
+        )
+        context = "\n\n---\n\n".join([
+            f"Source: {s['url']}\n{truncate_to_tokens(s['content'], RAG_TOKENS_PER_SOURCE, at_sentence=True)}"
+            for s in sources
+        ])
+
+        # Use centralized LLM client and prompts
+        llm_client = get_llm_client()
+
+        try:
+            # Create RAG prompt using centralized prompt module
+            prompt = create_rag_answer_prompt(company_name, question, context)
+
+            st.markdown(f"**Regarding {company_name}:**")
+            cache_key = make_cache_key(RAG_SYSTEM_MESSAGE, prompt)
+            answer = _answer_cache.get(cache_key)
+
+            if answer is not None:
+                logger.info(
+                    f"⚡ RAG answer cache hit for {company_name} "
+                    f"({_answer_cache.hits} hits / {_answer_cache.misses} misses)"
+                )
+                st.markdown(answer)
+            else:
+                # Stream the answer so the first words show up right away
+                answer = st.write_stream(llm_client.stream(
                     prompt=prompt,
-                    system_message=system_message,
+                    system_message=RAG_SYSTEM_MESSAGE,
                     temperature=0.3,
-                    max_tokens=500
-                )
+                    max_tokens=500,
+                    semantic_cache_key=question if RAG_SEMANTIC_CACHE else None
+                ))
+                if answer:
+                    _answer_cache.set(cache_key, answer)
 
-                response = f"**Regarding {company_name}:**\n\n{answer}\n\n"
+            response = f"**Regarding {company_name}:**\n\n{answer}\n\n"
 
-                # Add score context
-                scores = data['scores']
-                response += f"\n*Based on our analysis, {company_name} has an overall sustainability score of {scores['final_score']:.1f}/100.*"
+            # Add score context
+            scores = data['scores']
+            response += f"\n*Based on our analysis, {company_name} has an overall sustainability score of {scores['final_score']:.1f}/100.*"
 
-            except Exception as e:
-                response = f"I couldn't generate an answer: {str(e)}"
+        except Exception as e:
+            response = f"I couldn't generate an answer: {str(e)}"
 
     st.session_state.chat_messages.append({"role": "assistant", "content": response})
     st.rerun()
@@ -9,8 +9,9 @@ Handles score-related intents:
 
 Student Guide:
 --------------
-These handlers fetch company data from the database and
-format it nicely for display in the chat.
+These handlers fetch one company's data from the database
+(get_company_from_db, or get_category_from_db for a single category)
+and format it nicely for display in the chat.
 
 Each handler focuses on one type of information:
 - Overall scores
@@ -19,9 +20,12 @@ Each handler focuses on one type of information:
 - Strengths and weaknesses
 """
 
+import heapq
 import streamlit as st
 from typing import List
-from ui.components.sidebar import get_companies_from_db
+from operator import itemgetter
+from ui.components.sidebar import get_company_from_db, get_category_from_db
+from ui.components.chat_interface import add_assistant_message
 
 
 def handle_show_score(companies: List[str]):
@@ -38,20 +42,20 @@ def handle_show_score(companies: List[str]):
     company_name = companies[0] if companies else None
     if not company_name:
         response = "Please specify a company to check the score."
-        st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        add_assistant_message(response, render=True)
         return
 
-    companies_data = get_companies_from_db()
-    if company_name in companies_data:
-        data = companies_data[company_name]
+    data = get_company_from_db(company_name)
+    if data is not None:
         scores = data['scores']
-        response = f"**{company_name}'s Sustainability Score:**\n\n"
-        response += f"🎯 **Overall: {scores['final_score']:.1f}/100** ({scores['score_level']})\n\n"
-        response += f"That's based on:\n"
-        response += f"- 🌍 Environmental: {scores['environmental_score']:.1f}/100\n"
-        response += f"- 👥 Social: {scores['social_score']:.1f}/100\n"
-        response += f"- ⚖️ Governance: {scores['governance_score']:.1f}/100"
+        response = (
+            f"**{company_name}'s Sustainability Score:**\n\n"
+            f"🎯 **Overall: {scores['final_score']:.1f}/100** ({scores['score_level']})\n\n"
+            f"That's based on:\n"
+            f"- 🌍 Environmental: {scores['environmental_score']:.1f}/100\n"
+            f"- 👥 Social: {scores['social_score']:.1f}/100\n"
+            f"- ⚖️ Governance: {scores['governance_score']:.1f}/100"
+        )
     else:
         response = f"I haven't analyzed {company_name} yet."
 
@@ -73,34 +77,33 @@ def handle_show_details(companies: List[str]):
     company_name = companies[0] if companies else None
     if not company_name:
         response = "Please specify a company."
-        st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        add_assistant_message(response, render=True)
         return
 
-    companies_data = get_companies_from_db()
-    if company_name in companies_data:
-        data = companies_data[company_name]
+    data = get_company_from_db(company_name)
+    if data is not None:
         scores = data['scores']
 
-        response = f"📊 **Detailed Analysis for {company_name}**\n\n"
-        response += f"**Overall Score:** {scores['final_score']:.1f}/100 ({scores['score_level']})\n\n"
-        response += f"**Category Breakdown:**\n"
-        response += f"- 🌍 Environmental: {scores['environmental_score']:.1f}/100 (40% weight)\n"
-        response += f"- 👥 Social: {scores['social_score']:.1f}/100 (35% weight)\n"
-        response += f"- ⚖️ Governance: {scores['governance_score']:.1f}/100 (25% weight)\n\n"
+        parts = [
+            f"📊 **Detailed Analysis for {company_name}**\n\n"
+            f"**Overall Score:** {scores['final_score']:.1f}/100 ({scores['score_level']})\n\n"
+            f"**Category Breakdown:**\n"
+            f"- 🌍 Environmental: {scores['environmental_score']:.1f}/100 (40% weight)\n"
+            f"- 👥 Social: {scores['social_score']:.1f}/100 (35% weight)\n"
+            f"- ⚖️ Governance: {scores['governance_score']:.1f}/100 (25% weight)\n\n"
+        ]
 
-        # Get top 3 and bottom 3 metrics
+        # Get top 3 and bottom 3 metrics (heap selection, no full sort)
         metrics = data['metrics']
-        top_metrics = sorted(metrics, key=lambda x: x['value'], reverse=True)[:3]
-        bottom_metrics = sorted(metrics, key=lambda x: x['value'])[:3]
+        top_metrics = heapq.nlargest(3, metrics, key=itemgetter('value'))
+        bottom_metrics = heapq.nsmallest(3, metrics, key=itemgetter('value'))
 
-        response += "**Strengths:**\n"
-        for m in top_metrics:
-            response += f"- {m['metric_name']}: {m['value']:.1f}/100\n"
+        parts.append("**Strengths:**\n")
+        parts.extend(f"- {m['metric_name']}: {m['value']:.1f}/100\n" for m in top_metrics)
 
-        response += "\n**Areas for Improvement:**\n"
-        for m in bottom_metrics:
-            response += f"- {m['metric_name']}: {m['value']:.1f}/100\n"
+        parts.append("\n**Areas for Improvement:**\n")
+        parts.extend(f"- {m['metric_name']}: {m['value']:.1f}/100\n" for m in bottom_metrics)
+        response = "".join(parts)
     else:
         response = f"I haven't analyzed {company_name} yet."
 
@@ -123,31 +126,30 @@ def handle_show_category(companies: List[str], intent: str):
     company_name = companies[0] if companies else None
     if not company_name:
         response = "Please specify a company."
-        st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        add_assistant_message(response, render=True)
         return
 
-    companies_data = get_companies_from_db()
-    if company_name in companies_data:
-        data = companies_data[company_name]
-        metrics = data['metrics']
+    category_map = {
+        "show_environmental": ("Environmental", "environmental_score", "🌍"),
+        "show_social": ("Social", "social_score", "👥"),
+        "show_governance": ("Governance", "governance_score", "⚖️")
+    }
+    category, score_key, emoji = category_map[intent]
+
+    # Only this category's metrics, already sorted by the database
+    data = get_category_from_db(company_name, category)
+    if data is not None:
         scores = data['scores']
 
-        category_map = {
-            "show_environmental": ("Environmental", "environmental_score", "🌍"),
-            "show_social": ("Social", "social_score", "👥"),
-            "show_governance": ("Governance", "governance_score", "⚖️")
-        }
-
-        category, score_key, emoji = category_map[intent]
-        category_metrics = [m for m in metrics if m['category'] == category]
-
-        response = f"{emoji} **{company_name}'s {category} Performance:**\n\n"
-        response += f"**Score: {scores[score_key]:.1f}/100**\n\n"
-        response += f"**Key Metrics:**\n"
-        for m in sorted(category_metrics, key=lambda x: x['value'], reverse=True):
-            icon = "✅" if m['value'] >= 75 else "⚠️" if m['value'] >= 50 else "❌"
-            response += f"{icon} {m['metric_name']}: {m['value']:.1f}/100\n"
+        parts = [
+            f"{emoji} **{company_name}'s {category} Performance:**\n\n"
+            f"**Score: {scores[score_key]:.1f}/100**\n\n"
+            f"**Key Metrics:**\n"
+        ]
+        for metric_name, value in data['metrics']:
+            icon = "✅" if value >= 75 else "⚠️" if value >= 50 else "❌"
+            parts.append(f"{icon} {metric_name}: {value:.1f}/100\n")
+        response = "".join(parts)
     else:
         response = f"I haven't analyzed {company_name} yet."
 
@@ -169,26 +171,23 @@ def handle_show_strengths_weaknesses(companies: List[str]):
     company_name = companies[0] if companies else None
     if not company_name:
         response = "Please specify a company."
-        st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        add_assistant_message(response, render=True)
         return
 
-    companies_data = get_companies_from_db()
-    if company_name in companies_data:
-        data = companies_data[company_name]
+    data = get_company_from_db(company_name)
+    if data is not None:
         metrics = data['metrics']
 
-        top_metrics = sorted(metrics, key=lambda x: x['value'], reverse=True)[:5]
-        bottom_metrics = sorted(metrics, key=lambda x: x['value'])[:5]
+        # Heap selection: only the 5 best/worst are needed, not a full sort
+        top_metrics = heapq.nlargest(5, metrics, key=itemgetter('value'))
+        bottom_metrics = heapq.nsmallest(5, metrics, key=itemgetter('value'))
 
-        response = f"**{company_name}'s Strengths & Weaknesses:**\n\n"
-        response += "💪 **Top Strengths:**\n"
-        for m in top_metrics:
-            response += f"- {m['metric_name']}: {m['value']:.1f}/100\n"
+        parts = [f"**{company_name}'s Strengths & Weaknesses:**\n\n", "💪 **Top Strengths:**\n"]
+        parts.extend(f"- {m['metric_name']}: {m['value']:.1f}/100\n" for m in top_metrics)
 
-        response += "\n⚠️ **Areas Needing Improvement:**\n"
-        for m in bottom_metrics:
-            response += f"- {m['metric_name']}: {m['value']:.1f}/100\n"
+        parts.append("\n⚠️ **Areas Needing Improvement:**\n")
+        parts.extend(f"- {m['metric_name']}: {m['value']:.1f}/100\n" for m in bottom_metrics)
+        response = "".join(parts)
     else:
         response = f"I haven't analyzed {company_name} yet."
 
@@ -0,0 +1,120 @@
+"""
+Opt-in Profiling for Streamlit Reruns
+
+Streamlit reruns the whole script on every interaction. Before
+optimizing anything, measure where a rerun actually spends its time.
+
+Student Guide:
+--------------
+How to use it:
+1. Start the app with PROFILE_APP=1 (e.g. `PROFILE_APP=1 streamlit run app.py`)
+2. Turn on "⏱️ Profile reruns" in the sidebar
+3. Interact with the app - each rerun shows its timings at the bottom
+
+Two levels of detail:
+- If pyinstrument is installed (`pip install pyinstrument`), you get a
+  full call tree (a sampling profiler, ~1% overhead)
+- Otherwise you still get the timings of the steps wrapped in timed()
+
+When PROFILE_APP is not set, everything here is a no-op.
+
+Usage:
+    from ui.profiling import profile_rerun, timed
+
+    with profile_rerun():
+        with timed("classify intent"):
+            intent_data = classify_user_intent(prompt)
+"""
+
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# Profiling UI is only offered when this is set
+PROFILING_ENABLED = os.getenv('PROFILE_APP', '').lower() in ('1', 'true', 'yes')
+
+# Step timings of the rerun being profiled, per script thread
+# (each Streamlit session runs its reruns in its own thread)
+_state = threading.local()
+
+
+def _current_timings() -> Optional[List[Tuple[str, float]]]:
+    """Timings list of this thread's profiled rerun, or None."""
+    return getattr(_state, 'timings', None)
+
+
+@contextmanager
+def timed(label: str) -> Iterator[None]:
+    """
+    Measure how long a block takes during a profiled rerun.
+
+    Args:
+        label: Name shown in the timings table
+
+    Example:
+        with timed("handle_analyze"):
+            handle_analyze(companies)
+    """
+    timings = _current_timings()
+    if timings is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.append((label, time.perf_counter() - start))
+
+
+@contextmanager
+def profile_rerun() -> Iterator[None]:
+    """
+    Profile the wrapped block if the sidebar toggle is on.
+
+    Note: when a handler calls st.rerun() the page is redrawn and the
+    report disappears; the total time is also logged so it isn't lost.
+
+    Example:
+        with profile_rerun():
+            main_body()
+    """
+    if not PROFILING_ENABLED or not st.sidebar.toggle("⏱️ Profile reruns"):
+        yield
+        return
+
+    try:
+        from pyinstrument import Profiler
+        profiler = Profiler()
+    except ImportError:
+        profiler = None
+
+    _state.timings = timings = []
+    start = time.perf_counter()
+    if profiler:
+        profiler.start()
+
+    try:
+        yield
+    finally:
+        total = time.perf_counter() - start
+        if profiler:
+            profiler.stop()
+        _state.timings = None
+
+        logger.info(f"⏱️ Rerun took {total * 1000:.0f} ms")
+        with st.expander(f"⏱️ Rerun profile: {total * 1000:.0f} ms", expanded=True):
+            for label, seconds in timings:
+                st.markdown(f"- **{label}**: {seconds * 1000:.0f} ms")
+            if profiler:
+                import streamlit.components.v1 as components
+                components.html(profiler.output_html(), height=600, scrolling=True)
+            else:
+                st.caption("Install pyinstrument for a full call tree.")